@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+stdio bridge 吞吐基准
+
+用一个立即返回 JSON 的桩 polymarket 脚本，分别测量：
+
+1. 直接串行拉起桩 CLI 的速率（CLI 基线）
+2. 通过 ``serve-stdio`` 在并发窗口 1 / 10 / 100 下的 lines/sec
+
+两者之差即 bridge 在 CLI 之上额外引入的单请求开销。
+
+用法:
+    python scripts/bench_bridge.py [--requests 500] [--concurrency 1,10,100]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+STUB_CLI = """#!/bin/sh
+echo '{"mid": "0.5"}'
+"""
+
+
+def _write_stub(directory: Path) -> Path:
+    stub = directory / "polymarket"
+    stub.write_text(STUB_CLI)
+    stub.chmod(0o755)
+    return stub
+
+
+def _cli_baseline(stub: Path, count: int) -> float:
+    started = time.perf_counter()
+    for _ in range(count):
+        subprocess.run([str(stub), "-o", "json", "clob", "midpoint", "1"], capture_output=True, check=True)
+    return count / (time.perf_counter() - started)
+
+
+async def _bridge_rate(stub: Path, count: int, concurrency: int) -> float:
+    env = dict(os.environ)
+    env.update(
+        {
+            "OPENCLAW_PM_BIN": str(stub),
+            "OPENCLAW_PM_ENFORCE_VERSION": "false",
+            "OPENCLAW_PM_BRIDGE_MAX_IN_FLIGHT": str(max(concurrency, 1)),
+            "PYTHONPATH": str(ROOT_DIR / "src") + os.pathsep + env.get("PYTHONPATH", ""),
+        }
+    )
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-m",
+        "openclaw_polymarket_skill.cli",
+        "serve-stdio",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        env=env,
+    )
+    assert process.stdin is not None and process.stdout is not None
+
+    window = asyncio.Semaphore(concurrency)
+    received = 0
+    done = asyncio.Event()
+
+    async def _reader() -> None:
+        nonlocal received
+        while received < count:
+            line = await process.stdout.readline()  # type: ignore[union-attr]
+            if not line:
+                break
+            json.loads(line)
+            received += 1
+            window.release()
+        done.set()
+
+    reader_task = asyncio.create_task(_reader())
+    started = time.perf_counter()
+    for index in range(count):
+        await window.acquire()
+        request = {"id": str(index), "action": "clob_midpoint", "params": {"token_id": "1"}}
+        process.stdin.write(json.dumps(request).encode() + b"\n")
+        await process.stdin.drain()
+    await done.wait()
+    elapsed = time.perf_counter() - started
+
+    process.stdin.close()
+    await process.wait()
+    await reader_task
+    return received / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="每轮请求数（默认 500）")
+    parser.add_argument("--concurrency", default="1,10,100", help="逗号分隔的并发窗口（默认 1,10,100）")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stub = _write_stub(Path(tmp))
+        baseline = _cli_baseline(stub, min(args.requests, 200))
+        print(f"cli-baseline      {baseline:10.1f} lines/sec  ({1000 / baseline:.2f} ms/spawn)")
+        for concurrency in (int(c) for c in args.concurrency.split(",") if c):
+            rate = asyncio.run(_bridge_rate(stub, args.requests, concurrency))
+            # 串行窗口下每请求耗时减去单次 spawn 耗时，即 bridge 自身开销
+            extra = f"  (bridge overhead {1000 / rate - 1000 / baseline:.2f} ms/req)" if concurrency == 1 else ""
+            print(f"bridge c={concurrency:<7d} {rate:10.1f} lines/sec{extra}")
+
+
+if __name__ == "__main__":
+    main()
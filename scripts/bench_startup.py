@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+CLI 冷启动基准
+
+OpenClaw 每个 action 启动一次 CLI 进程，冷启动耗时直接计入调用延迟。
+对每个子命令用 ``python -X importtime`` 运行若干次，统计：
+
+- 导入耗时中位数（所有顶层模块累计导入时间之和）与导入模块数
+- 进程总耗时中位数（含解释器启动）
+
+导入耗时超过 ``BUDGETS_MS`` 中的预算、或导入了 ``FORBIDDEN`` 中的模块时视为回归，
+``--check`` 下以退出码 1 结束，可接入 CI。
+
+用法:
+    python scripts/bench_startup.py [--runs 5] [--check]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+STUB_CLI = """#!/bin/sh
+if [ "$1" = "--version" ]; then
+  echo "polymarket 0.1.4"
+else
+  echo '{"mid": "0.5"}'
+fi
+"""
+
+# 子命令 -> (参数, 导入耗时预算 ms)
+# 需要 asyncio 的子命令耗时受机器抖动影响较大，预算留有余量；确定性的检查见 FORBIDDEN
+BUDGETS_MS: dict[str, tuple[list[str], float]] = {
+    "help": (["--help"], 60.0),
+    "list-actions": (["list-actions"], 60.0),
+    "execute": (["execute", "--action", "clob_midpoint", "--params", '{"token_id": "1"}', "--no-daemon"], 200.0),
+    "healthcheck": (["healthcheck"], 200.0),
+    "serve-stdio": (["serve-stdio"], 220.0),
+}
+
+# 任何子命令都不应导入的模块（analyze 专用或只在启用对应功能时需要）
+FORBIDDEN = (
+    "anthropic",
+    "openclaw_polymarket_skill.claude_client",
+    "openclaw_polymarket_skill.market_collector",
+    "openclaw_polymarket_skill.report_builder",
+    "openclaw_polymarket_skill.disk_cache",
+    "openclaw_polymarket_skill.http_executor",
+    "sqlite3",
+)
+
+# "import time:  self | cumulative | name"，name 前无缩进的是顶层导入
+_IMPORT_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def _write_stub(directory: Path) -> Path:
+    stub = directory / "polymarket"
+    stub.write_text(STUB_CLI)
+    stub.chmod(0o755)
+    return stub
+
+
+def _environment(stub: Path, workdir: Path) -> dict[str, str]:
+    env = dict(os.environ)
+    env.update(
+        {
+            "OPENCLAW_PM_BIN": str(stub),
+            "OPENCLAW_PM_VERSION_CACHE_PATH": str(workdir / "cli-version.json"),
+            "OPENCLAW_PM_SOCKET": str(workdir / "absent.sock"),
+            "PYTHONPATH": str(ROOT_DIR / "src") + os.pathsep + env.get("PYTHONPATH", ""),
+        }
+    )
+    return env
+
+
+def measure(args: list[str], env: dict[str, str]) -> tuple[float, float, set[str]]:
+    """运行一次子命令，返回 (导入耗时 ms, 进程耗时 ms, 导入的模块名)"""
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "openclaw_polymarket_skill.cli", *args],
+        input=b"",
+        capture_output=True,
+        env=env,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    import_us = 0
+    modules: set[str] = set()
+    for line in completed.stderr.decode("utf-8", errors="replace").splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match is None:
+            continue
+        modules.add(match.group(4))
+        if not match.group(3):
+            import_us += int(match.group(2))
+    return import_us / 1000, wall_ms, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--check", action="store_true", help="超出预算或导入禁用模块时以退出码 1 结束")
+    args = parser.parse_args()
+
+    failures: list[str] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        env = _environment(_write_stub(workdir), workdir)
+        print(f"{'subcommand':<14} {'import ms':>10} {'budget':>8} {'wall ms':>9} {'modules':>8}")
+        for name, (cli_args, budget) in BUDGETS_MS.items():
+            # 第一次运行预热 .pyc 与版本检查缓存
+            measure(cli_args, env)
+            samples = [measure(cli_args, env) for _ in range(max(1, args.runs))]
+            import_ms = statistics.median(sample[0] for sample in samples)
+            wall_ms = statistics.median(sample[1] for sample in samples)
+            modules = samples[-1][2]
+            print(f"{name:<14} {import_ms:>10.1f} {budget:>8.0f} {wall_ms:>9.1f} {len(modules):>8}")
+            if import_ms > budget:
+                failures.append(f"{name}: 导入耗时 {import_ms:.1f}ms 超出预算 {budget:.0f}ms")
+            leaked = sorted(module for module in FORBIDDEN if module in modules)
+            if leaked:
+                failures.append(f"{name}: 导入了不应加载的模块 {', '.join(leaked)}")
+
+    for failure in failures:
+        print(f"回归: {failure}", file=sys.stderr)
+    if args.check and failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
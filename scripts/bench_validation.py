@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+单请求校验 + argv 构建开销基准
+
+对一组代表性请求重复执行 ``runner.validate`` 与 ``ActionSpec.builder``（不启动子进程），
+输出每个请求的耗时（µs，多轮取最小值）。``--src`` 指向另一份代码的 ``src`` 目录即可对比改动前后：
+
+    python scripts/bench_validation.py
+    git worktree add /tmp/baseline <ref>
+    python scripts/bench_validation.py --src /tmp/baseline/src
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+REQUESTS: list[tuple[str, dict[str, object]]] = [
+    ("markets_search", {"query": "bitcoin", "limit": 5}),
+    ("clob_midpoint", {"token_id": "71321045679252212594626385532706912750332728571942532289631379312455583992563"}),
+    ("clob_price_history", {"token_id": "0x1a2b3c", "interval": "1h", "fidelity": 60}),
+    ("markets_list", {"limit": 50, "offset": 100, "active": True, "order": "volume", "ascending": True}),
+    ("data_positions", {"address": "0x0000000000000000000000000000000000000001", "limit": 25}),
+    ("clob_create_order", {"token": "123", "side": "buy", "price": "0.45", "size": "10", "post_only": True}),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--src", default=str(ROOT_DIR / "src"), help="被测代码的 src 目录")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, args.src)
+    from openclaw_polymarket_skill.actions import ACTION_REGISTRY
+    from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+    from openclaw_polymarket_skill.settings import SkillSettings
+
+    runner = PolymarketSkillRunner(SkillSettings(enforce_cli_version=False))
+    print(f"src: {args.src}")
+    print(f"{'action':<20} {'µs/request':>11}")
+    total = 0.0
+    for action, payload in REQUESTS:
+        spec = ACTION_REGISTRY[action]
+        assert runner.validate(action, payload) is None, action
+
+        def _request() -> None:
+            runner.validate(action, payload)
+            spec.builder(payload)
+
+        # 取多轮中的最小值，降低机器抖动的影响
+        best = min(timeit.repeat(_request, number=args.iterations, repeat=args.repeat))
+        per_request = best / args.iterations * 1e6
+        total += per_request
+        print(f"{action:<20} {per_request:>11.2f}")
+    print(f"{'mean':<20} {total / len(REQUESTS):>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+重新生成 ``action_catalog.py``（``list-actions`` 的预生成输出）
+
+修改 ``actions.py`` 中的 ACTION_REGISTRY 后运行：
+    python scripts/gen_action_catalog.py
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from openclaw_polymarket_skill.actions import action_list  # noqa: E402
+
+TARGET = ROOT_DIR / "src" / "openclaw_polymarket_skill" / "action_catalog.py"
+
+TEMPLATE = '''"""
+``list-actions`` 的预生成输出
+
+由 ``scripts/gen_action_catalog.py`` 根据 ACTION_REGISTRY 生成，请勿手动修改；
+CLI 直接打印该字符串，无需导入 action 注册表。``tests/test_cli.py`` 校验两者一致。
+"""
+
+LIST_ACTIONS_JSON = (
+{lines}
+)
+
+# 不读取调用方钱包 / 签名配置的公开读 action：只有这些可以转发给 daemon 执行
+PUBLIC_READ_ACTIONS = frozenset(
+    {{
+{reads}
+    }}
+)
+'''
+
+
+def render() -> str:
+    # 每个 action 一行，拼接后与 json.dumps 整体输出逐字节相同
+    actions = [json.dumps(item, ensure_ascii=False) for item in action_list()]
+    pieces = ['{"ok": true, "actions": ['] + [item + ", " for item in actions[:-1]] + [actions[-1] + "]}"]
+    reads = [item["name"] for item in action_list() if item["category"] == "read"]
+    return TEMPLATE.format(
+        lines="\n".join(f"    {piece!r}" for piece in pieces),
+        reads="\n".join(f"        {json.dumps(name)}," for name in reads),
+    )
+
+
+def main() -> None:
+    TARGET.write_text(render(), encoding="utf-8")
+    print(f"已写入 {TARGET.relative_to(ROOT_DIR)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,10 @@
-from .runner import PolymarketSkillRunner
-
 __all__ = ["PolymarketSkillRunner"]
+
+
+def __getattr__(name: str) -> object:
+    # 延迟导入：CLI 子命令（如 list-actions）导入子模块时不必加载 runner 及其依赖
+    if name == "PolymarketSkillRunner":
+        from .runner import PolymarketSkillRunner
+
+        return PolymarketSkillRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,52 @@
+"""
+``list-actions`` 的预生成输出
+
+由 ``scripts/gen_action_catalog.py`` 根据 ACTION_REGISTRY 生成，请勿手动修改；
+CLI 直接打印该字符串，无需导入 action 注册表。``tests/test_cli.py`` 校验两者一致。
+"""
+
+LIST_ACTIONS_JSON = (
+    '{"ok": true, "actions": ['
+    '{"name": "markets_search", "category": "read", "required_params": ["query"]}, '
+    '{"name": "markets_get", "category": "read", "required_params": ["id_or_slug"]}, '
+    '{"name": "markets_list", "category": "read", "required_params": []}, '
+    '{"name": "events_list", "category": "read", "required_params": []}, '
+    '{"name": "events_get", "category": "read", "required_params": ["id"]}, '
+    '{"name": "clob_book", "category": "read", "required_params": ["token_id"]}, '
+    '{"name": "clob_midpoint", "category": "read", "required_params": ["token_id"]}, '
+    '{"name": "clob_spread", "category": "read", "required_params": ["token_id"]}, '
+    '{"name": "clob_price", "category": "read", "required_params": ["token_id", "side"]}, '
+    '{"name": "clob_price_history", "category": "read", "required_params": ["token_id"]}, '
+    '{"name": "clob_balance", "category": "read_auth", "required_params": ["asset_type"]}, '
+    '{"name": "clob_orders", "category": "read_auth", "required_params": []}, '
+    '{"name": "clob_order", "category": "read_auth", "required_params": ["order_id"]}, '
+    '{"name": "clob_create_order", "category": "write", "required_params": ["token", "side", "price", "size"]}, '
+    '{"name": "clob_market_order", "category": "write", "required_params": ["token", "side", "amount"]}, '
+    '{"name": "clob_cancel", "category": "write", "required_params": ["order_id"]}, '
+    '{"name": "clob_cancel_orders", "category": "write", "required_params": ["order_ids"]}, '
+    '{"name": "clob_cancel_all", "category": "write", "required_params": []}, '
+    '{"name": "data_positions", "category": "read", "required_params": ["address"]}, '
+    '{"name": "data_value", "category": "read", "required_params": ["address"]}, '
+    '{"name": "data_trades", "category": "read", "required_params": ["address"]}, '
+    '{"name": "data_leaderboard", "category": "read", "required_params": []}]}'
+)
+
+# 不读取调用方钱包 / 签名配置的公开读 action：只有这些可以转发给 daemon 执行
+PUBLIC_READ_ACTIONS = frozenset(
+    {
+        "markets_search",
+        "markets_get",
+        "markets_list",
+        "events_list",
+        "events_get",
+        "clob_book",
+        "clob_midpoint",
+        "clob_spread",
+        "clob_price",
+        "clob_price_history",
+        "data_positions",
+        "data_value",
+        "data_trades",
+        "data_leaderboard",
+    }
+)
@@ -0,0 +1,175 @@
+"""
+只读 action 的进程内 TTL 缓存
+"""
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .rawjson import RawJson
+
+# 各 action 默认 TTL（秒）。市场/事件元数据变化慢，盘口类数据只做亚秒级去重
+DEFAULT_READ_TTLS: dict[str, float] = {
+    "markets_get": 300.0,
+    "events_get": 300.0,
+    "markets_list": 60.0,
+    "events_list": 60.0,
+    "markets_search": 30.0,
+    "data_leaderboard": 60.0,
+    "clob_price_history": 30.0,
+    "data_positions": 5.0,
+    "data_value": 5.0,
+    "data_trades": 5.0,
+    "clob_midpoint": 0.5,
+    "clob_book": 0.5,
+    "clob_spread": 0.5,
+    "clob_price": 0.5,
+}
+
+# 随缓存保存并在命中时返回的 meta 字段：只保留描述数据本身的字段；
+# 排队、限流、超时、退出码、重试等执行信息只属于当时那次调用，命中时不应重放
+RESULT_META_KEYS = ("action", "format", "warning")
+
+
+def result_meta(meta: dict[str, Any]) -> dict[str, Any]:
+    return {key: meta[key] for key in RESULT_META_KEYS if key in meta}
+
+
+@dataclass
+class CacheEntry:
+    action: str
+    payload: str
+    meta: dict[str, Any]
+    stored_at: float
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.payload)
+
+    def data(self) -> Any:
+        """每次返回独立副本，调用方修改不会污染缓存"""
+        return json.loads(self.payload)
+
+
+def cache_key(action: str, cli_args: list[str]) -> str:
+    """以 action + 规范化后的 CLI 参数作为缓存键（同一参数组合必然生成相同 argv）"""
+    return "\x1f".join([action, *cli_args])
+
+
+def serialize_payload(data: Any) -> str | None:
+    if isinstance(data, RawJson):
+        return data.text()
+    try:
+        return json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+
+
+class ReadCache:
+    """
+    带 LRU 淘汰的 TTL 缓存
+
+    - 每个 action 独立 TTL，TTL <= 0 或未配置的 action 不缓存
+    - 同时受条目数与序列化后字节数约束，超限时淘汰最久未使用的条目
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = {**DEFAULT_READ_TTLS, **(ttls or {})}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.evictions = 0
+
+    def ttl_for(self, action: str) -> float:
+        return self.ttls.get(action, 0.0)
+
+    def is_cacheable(self, action: str) -> bool:
+        return self.ttl_for(action) > 0
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self._clock():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def get_stale(self, key: str, max_stale_seconds: float) -> CacheEntry | None:
+        """读取已过期但仍在 ``max_stale_seconds`` 宽限期内的条目（不计入命中统计）"""
+        entry = self._entries.get(key)
+        if entry is None or max_stale_seconds <= 0:
+            return None
+        if entry.expires_at + max_stale_seconds <= self._clock():
+            return None
+        self.stale_hits += 1
+        return entry
+
+    def put(self, key: str, action: str, data: Any, meta: dict[str, Any]) -> None:
+        if self.ttl_for(action) <= 0:
+            return
+        payload = serialize_payload(data)
+        if payload is not None:
+            self.put_payload(key, action, payload, meta)
+
+    def put_payload(
+        self,
+        key: str,
+        action: str,
+        payload: str,
+        meta: dict[str, Any],
+        max_ttl: float | None = None,
+    ) -> None:
+        """写入已序列化的数据；``max_ttl`` 用于从下层缓存回填时不超过其剩余有效期"""
+        ttl = self.ttl_for(action)
+        if max_ttl is not None:
+            ttl = min(ttl, max_ttl)
+        if ttl <= 0 or len(payload) > self.max_bytes:
+            return
+
+        now = self._clock()
+        self._remove(key)
+        entry = CacheEntry(action=action, payload=payload, meta=dict(meta), stored_at=now, expires_at=now + ttl)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def age_ms(self, entry: CacheEntry) -> int:
+        return int((self._clock() - entry.stored_at) * 1000)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
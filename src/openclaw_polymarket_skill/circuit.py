@@ -0,0 +1,129 @@
+"""
+按上游 API 分组（gamma / clob / data）的熔断器：上游不可用时快速失败，不再启动子进程等待超时
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Callable
+
+from .ratelimit import family_for
+from .settings import SkillSettings
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 反映上游健康状况的错误类型；参数错误、鉴权失败、限流等不计入
+FAILURE_TYPES = frozenset({"NetworkError", "TimeoutError", "UpstreamError"})
+
+
+class CircuitBreaker:
+    """
+    单个分组的熔断器
+
+    - closed：连续 ``failure_threshold`` 次上游失败后打开
+    - open：``reset_seconds`` 内所有请求直接失败
+    - half_open：冷却结束后只放行一个探测请求，成功则关闭，失败则重新打开
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.trips = 0
+        self.rejected = 0
+
+    def allow(self) -> bool:
+        """是否放行本次请求；放行的请求必须以 ``record`` 或 ``abandon`` 结束"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and self._clock() - self._opened_at >= self.reset_seconds:
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+        self.rejected += 1
+        return False
+
+    def retry_in(self) -> float:
+        """距离允许探测还有多少秒"""
+        return max(0.0, self._opened_at + self.reset_seconds - self._clock())
+
+    def record(self, error: dict[str, Any] | None) -> None:
+        if error is None or error.get("type") not in FAILURE_TYPES:
+            # 非上游故障类错误说明上游可达
+            self._failures = 0
+            self._probing = False
+            self.state = CLOSED
+            return
+        self._failures += 1
+        if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+            self._trip()
+
+    def abandon(self) -> None:
+        """放行的请求被取消、没有结果时释放探测名额"""
+        self._probing = False
+
+    def _trip(self) -> None:
+        if self.state != OPEN:
+            self.trips += 1
+        self.state = OPEN
+        self._opened_at = self._clock()
+        self._probing = False
+
+    def stats(self) -> dict[str, Any]:
+        if self.state == OPEN and self._clock() - self._opened_at >= self.reset_seconds:
+            state = HALF_OPEN
+        else:
+            state = self.state
+        return {
+            "state": state,
+            "consecutive_failures": self._failures,
+            "trips": self.trips,
+            "rejected": self.rejected,
+            "retry_in_ms": int(self.retry_in() * 1000) if state == OPEN else 0,
+        }
+
+
+class CircuitBreakers:
+    """按 API 分组的熔断器集合，由 ``PolymarketExecutor`` / ``HttpExecutor`` 在限流与排队之前调用"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.breakers = {
+            family: CircuitBreaker(failure_threshold, reset_seconds, clock)
+            for family in ("gamma", "clob", "data")
+        }
+
+    def get(self, cli_args: list[str]) -> CircuitBreaker | None:
+        return self.breakers.get(family_for(cli_args) or "")
+
+    def stats(self) -> dict[str, Any]:
+        return {family: breaker.stats() for family, breaker in self.breakers.items()}
+
+
+_SHARED: dict[tuple[int, float], CircuitBreakers] = {}
+
+
+def shared_circuit_breakers(settings: SkillSettings) -> CircuitBreakers | None:
+    """进程内共享的熔断器（按配置复用），``circuit_breaker_enabled=False`` 时返回 None"""
+    if not settings.circuit_breaker_enabled:
+        return None
+    key = (settings.circuit_failure_threshold, settings.circuit_reset_seconds)
+    breakers = _SHARED.get(key)
+    if breakers is None:
+        breakers = _SHARED[key] = CircuitBreakers(*key)
+    return breakers
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import json
-import time
-from typing import Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
-from .actions import ACTION_REGISTRY
-from .analyze_models import AnalysisResult
-from .claude_client import ClaudeClient
-from .market_collector import MarketCollector
-from .openclaw_bridge import serve_stdio
-from .report_builder import OutputFormat, build_output
-from .runner import PolymarketSkillRunner
-from .settings import SkillSettings
+if TYPE_CHECKING:
+    from .report_builder import OutputFormat
+
+# OpenClaw 每个 action 启动一次 CLI，冷启动耗时直接计入调用延迟：
+# 子命令只在各自的 handler 内导入所需模块（asyncio、runner、Claude 客户端等），
+# 预算与测量见 scripts/bench_startup.py
+
+
+def _run_async(main: Callable[[], Awaitable[int | None]]) -> int:
+    import asyncio
+
+    return asyncio.run(main()) or 0
 
 
 def _parse_json(value: str, name: str) -> dict[str, Any]:
@@ -28,8 +30,7 @@ def _parse_json(value: str, name: str) -> dict[str, Any]:
     return parsed
 
 
-async def _run_execute(args: argparse.Namespace) -> int:
-    runner = PolymarketSkillRunner()
+def _run_execute(args: argparse.Namespace) -> int:
     try:
         params = _parse_json(args.params, "--params")
         context = _parse_json(args.context, "--context")
@@ -37,12 +38,48 @@ async def _run_execute(args: argparse.Namespace) -> int:
         print(json.dumps({"ok": False, "error": str(exc)}, ensure_ascii=False))
         return 2
 
-    result = await runner.execute(args.action, params=params, context=context)
+    if not args.no_daemon and _forwardable(args.action):
+        from .daemon_client import default_socket_path, forward
+        from .settings import SkillSettings
+
+        settings = SkillSettings.from_env()
+        response = forward(
+            default_socket_path(settings),
+            {"id": "cli", "method": "execute", "action": args.action, "params": params, "context": context},
+            timeout=settings.write_timeout_seconds + 5,
+        )
+        if response is not None:
+            result = response.get("result", response)
+            print(json.dumps(result, ensure_ascii=False))
+            return 0 if response.get("ok") else 1
+
+    return _run_async(lambda: _execute_locally(args.action, params, context))
+
+
+def _forwardable(action: str) -> bool:
+    """
+    只有公开读可以交给 daemon 执行
+
+    daemon 使用自己的环境（私钥、签名类型、``allow_trading`` / ``dry_run``），鉴权读与写操作
+    转发后会以 daemon 的钱包执行而忽略调用方配置，因此始终在本进程执行。
+    """
+    from .action_catalog import PUBLIC_READ_ACTIONS
+
+    return action in PUBLIC_READ_ACTIONS
+
+
+async def _execute_locally(action: str, params: dict[str, Any], context: dict[str, Any]) -> int:
+    from .runner import PolymarketSkillRunner
+
+    runner = PolymarketSkillRunner()
+    result = await runner.execute(action, params=params, context=context)
     print(json.dumps(result, ensure_ascii=False))
     return 0 if result.get("ok") else 1
 
 
 async def _run_healthcheck() -> int:
+    from .runner import PolymarketSkillRunner
+
     runner = PolymarketSkillRunner()
     result = await runner.healthcheck()
     print(json.dumps(result, ensure_ascii=False))
@@ -50,19 +87,64 @@ async def _run_healthcheck() -> int:
 
 
 def _run_list_actions() -> int:
-    data = [
-        {
-            "name": spec.name,
-            "category": spec.category.value,
-            "required_params": list(spec.required_params),
-        }
-        for spec in ACTION_REGISTRY.values()
-    ]
-    print(json.dumps({"ok": True, "actions": data}, ensure_ascii=False))
+    from .action_catalog import LIST_ACTIONS_JSON
+
+    print(LIST_ACTIONS_JSON)
+    return 0
+
+
+def _run_serve_stdio(args: argparse.Namespace) -> int:
+    from .settings import SkillSettings
+
+    workers = args.workers if args.workers is not None else SkillSettings.from_env().bridge_workers
+    if workers > 0:
+        from .supervisor import serve_stdio_supervised
+
+        return _run_async(lambda: serve_stdio_supervised(workers))
+    from .openclaw_bridge import serve_stdio
+
+    return _run_async(serve_stdio)
+
+
+def _run_serve_socket(args: argparse.Namespace) -> int:
+    from .openclaw_bridge import serve_socket
+
+    return _run_async(lambda: serve_socket(args.path or None))
+
+
+def _run_cache(args: argparse.Namespace) -> int:
+    from .disk_cache import DiskCache
+    from .settings import SkillSettings
+
+    settings = SkillSettings.from_env()
+    path = args.path or settings.disk_cache_path
+    if not path:
+        print(
+            json.dumps(
+                {"ok": False, "error": "未配置磁盘缓存，请设置 OPENCLAW_PM_DISK_CACHE_PATH 或传入 --path"},
+                ensure_ascii=False,
+            )
+        )
+        return 2
+
+    cache = DiskCache(path, ttls=settings.disk_cache_ttls, max_bytes=settings.disk_cache_max_bytes)
+    try:
+        if args.cache_command == "purge":
+            deleted = cache.purge(action=args.action, expired_only=args.expired)
+            result: dict[str, Any] = {"ok": True, "deleted": deleted}
+        elif args.cache_command == "prune":
+            result = {"ok": True, "deleted": cache.prune()}
+        else:
+            result = {"ok": True, "stats": cache.stats()}
+    finally:
+        cache.close()
+    print(json.dumps(result, ensure_ascii=False))
     return 0
 
 
 async def _run_analyze(args: argparse.Namespace) -> int:
+    from .settings import SkillSettings
+
     settings = SkillSettings.from_env()
 
     if not settings.anthropic_api_key:
@@ -74,11 +156,22 @@ async def _run_analyze(args: argparse.Namespace) -> int:
         )
         return 2
 
+    from .claude_client import ClaudeClient
+    from .market_collector import MarketCollector
+    from .report_builder import build_output
+
     market_limit: int = getattr(args, "market_limit", 5)
     output_fmt: OutputFormat = getattr(args, "output", "both")
 
+    deadline_ms: int | None = getattr(args, "deadline_ms", None)
+    deadline = None
+    if deadline_ms:
+        from .deadline import Deadline
+
+        deadline = Deadline.after_ms(deadline_ms)
+
     collector = MarketCollector(settings=settings)
-    snapshot = await collector.collect(args.query, market_limit=market_limit)
+    snapshot = await collector.collect(args.query, market_limit=market_limit, deadline=deadline)
 
     claude = ClaudeClient(settings=settings)
     result = claude.analyze(snapshot, args.analysis_prompt)
@@ -96,28 +189,52 @@ def main() -> None:
     list_actions.set_defaults(handler=lambda _: _run_list_actions())
 
     healthcheck = sub.add_parser("healthcheck", help="检查 polymarket 二进制与版本")
-    healthcheck.set_defaults(handler=lambda _: asyncio.run(_run_healthcheck()))
+    healthcheck.set_defaults(handler=lambda _: _run_async(_run_healthcheck))
 
     execute = sub.add_parser("execute", help="执行 action")
     execute.add_argument("--action", required=True, help="action 名称")
     execute.add_argument("--params", default="{}", help="JSON 对象")
     execute.add_argument("--context", default="{}", help="JSON 对象")
-    execute.set_defaults(handler=lambda ns: asyncio.run(_run_execute(ns)))
+    execute.add_argument("--no-daemon", action="store_true", dest="no_daemon", help="不转发给 serve-socket daemon，直接本地执行")
+    execute.set_defaults(handler=_run_execute)
 
     bridge = sub.add_parser("serve-stdio", help="以 stdio bridge 模式运行，供 OpenClaw 直接调用")
-    bridge.set_defaults(handler=lambda _: asyncio.run(serve_stdio()) or 0)
+    bridge.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="worker 进程数（默认读取 OPENCLAW_PM_BRIDGE_WORKERS，0 表示单进程）",
+    )
+    bridge.set_defaults(handler=_run_serve_stdio)
+
+    daemon = sub.add_parser("serve-socket", help="以常驻 daemon 模式在 Unix socket 上提供 bridge 协议")
+    daemon.add_argument("--path", default="", help="socket 路径（默认读取 OPENCLAW_PM_SOCKET）")
+    daemon.set_defaults(handler=_run_serve_socket)
+
+    cache = sub.add_parser("cache", help="查看或清理磁盘响应缓存")
+    cache.add_argument("--path", default="", help="缓存文件路径（默认读取 OPENCLAW_PM_DISK_CACHE_PATH）")
+    cache_sub = cache.add_subparsers(dest="cache_command", required=True)
+    cache_sub.add_parser("stats", help="按 action 统计条目数与大小")
+    cache_sub.add_parser("prune", help="删除过期条目并按大小上限淘汰")
+    purge = cache_sub.add_parser("purge", help="删除缓存条目")
+    purge.add_argument("--action", default=None, help="只删除指定 action 的条目")
+    purge.add_argument("--expired", action="store_true", help="只删除已过期条目")
+    cache.set_defaults(handler=_run_cache)
 
     analyze = sub.add_parser("analyze", help="一键采集市场数据并调用 Claude 进行 AI 分析")
     analyze.add_argument("--query", required=True, help="搜索关键词")
     analyze.add_argument("--analysis-prompt", required=True, dest="analysis_prompt", help="分析提示词（传给 Claude）")
     analyze.add_argument("--market-limit", type=int, default=5, dest="market_limit", help="最多分析的市场数量（默认 5）")
+    analyze.add_argument(
+        "--deadline-ms", type=int, default=None, dest="deadline_ms", help="数据采集阶段的总时间预算（毫秒，默认不限）"
+    )
     analyze.add_argument(
         "--output",
         choices=["json", "markdown", "both"],
         default="both",
         help="输出格式（默认 both）",
     )
-    analyze.set_defaults(handler=lambda ns: asyncio.run(_run_analyze(ns)))
+    analyze.set_defaults(handler=lambda ns: _run_async(lambda: _run_analyze(ns)))
 
     args = parser.parse_args()
     exit_code = args.handler(args)
@@ -0,0 +1,66 @@
+"""
+``serve-socket`` daemon 的同步客户端
+
+只依赖标准库，CLI 在创建 runner 之前先尝试把请求转发给常驻 daemon。
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import tempfile
+from typing import Any
+
+from .settings import SkillSettings
+
+
+def default_socket_path(settings: SkillSettings) -> str:
+    """``OPENCLAW_PM_SOCKET`` 优先，否则为 ``$XDG_RUNTIME_DIR``（或临时目录）下按用户区分的路径"""
+    if settings.socket_path:
+        return os.path.expanduser(settings.socket_path)
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(base, f"openclaw-pm-{os.getuid()}.sock")
+
+
+def forward(path: str, request: dict[str, Any], timeout: float) -> dict[str, Any] | None:
+    """
+    把一条 bridge 请求发给 daemon 并返回响应
+
+    连接不上（socket 不存在、daemon 已退出）时返回 None，调用方回退到本地执行；
+    请求发出后的失败不回退，避免写操作被执行两次。
+    """
+    if not os.path.exists(path):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    try:
+        try:
+            client.connect(path)
+        except OSError:
+            return None
+        try:
+            client.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            chunks: list[bytes] = []
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                if chunk.endswith(b"\n"):
+                    break
+            line = b"".join(chunks).strip()
+            if not line:
+                raise ConnectionError("daemon 未返回响应")
+            response = json.loads(line)
+            if not isinstance(response, dict):
+                raise ValueError("daemon 响应不是 JSON 对象")
+        except (OSError, ValueError) as exc:
+            return {
+                "id": request.get("id"),
+                "ok": False,
+                "error": {"code": "DaemonError", "message": f"daemon 通信失败: {exc}"},
+            }
+    finally:
+        client.close()
+    return response
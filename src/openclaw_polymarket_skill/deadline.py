@@ -0,0 +1,67 @@
+"""
+请求级截止时间：调用方通过 ``context.deadline_ms`` 给出剩余预算，沿 bridge → runner → executor 传递
+"""
+from __future__ import annotations
+
+import math
+import time
+from typing import Any, Callable
+
+
+class Deadline:
+    """
+    绝对截止时间（单调时钟）
+
+    各层只关心剩余时间：锁与队列等待以剩余时间为上限，子进程超时取配置超时与剩余时间的较小值，
+    预算已耗尽的请求在启动子进程前直接拒绝。
+    """
+
+    __slots__ = ("expires_at", "budget_ms", "_clock")
+
+    def __init__(self, expires_at: float, budget_ms: int = 0, clock: Callable[[], float] = time.monotonic) -> None:
+        self.expires_at = expires_at
+        self.budget_ms = budget_ms
+        self._clock = clock
+
+    @classmethod
+    def after_ms(cls, budget_ms: int, clock: Callable[[], float] = time.monotonic) -> "Deadline":
+        return cls(clock() + budget_ms / 1000, budget_ms, clock)
+
+    @classmethod
+    def from_context(cls, context: dict[str, Any], received_at: float | None = None) -> "Deadline | None":
+        """
+        解析 ``context.deadline_ms``（正整数，毫秒）；未提供时返回 None，格式错误时抛出 ``ValueError``
+
+        ``received_at`` 为请求到达时刻（``time.monotonic()``），预算从该时刻起算，默认从当前起算。
+        """
+        value = context.get("deadline_ms")
+        if value is None:
+            return None
+        if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+            raise ValueError("context.deadline_ms 必须是正整数")
+        if received_at is None:
+            return cls.after_ms(value)
+        return cls(received_at + value / 1000, value)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self._clock())
+
+    def expired(self) -> bool:
+        return self._clock() >= self.expires_at
+
+    def clamp(self, timeout_seconds: float) -> float:
+        """配置超时与剩余预算取较小值"""
+        return min(timeout_seconds, self.remaining())
+
+    def copy(self) -> "Deadline":
+        return Deadline(self.expires_at, self.budget_ms, self._clock)
+
+    def extend(self, other: "Deadline | None") -> None:
+        """延长到 ``other``（合并调用以最晚的等待方为准）；``other`` 为 None 表示有等待方不限时"""
+        self.expires_at = math.inf if other is None else max(self.expires_at, other.expires_at)
+
+    def earliest(self, other: "Deadline | None") -> "Deadline":
+        return other if other is not None and other.expires_at < self.expires_at else self
+
+    def message(self) -> str:
+        return f"请求超过调用方 deadline（{self.budget_ms}ms），已放弃执行"
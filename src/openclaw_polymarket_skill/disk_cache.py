@@ -0,0 +1,189 @@
+"""
+SQLite 持久化响应缓存（读缓存第二层）
+
+进程重启后仍保留慢变化的市场/事件元数据；WAL 模式下多个 bridge 进程可共享同一文件。
+"""
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable
+
+from .cache import CacheEntry
+
+# 仅缓存慢变化的 READ action（秒）
+DEFAULT_DISK_TTLS: dict[str, float] = {
+    "markets_get": 3600.0,
+    "events_get": 3600.0,
+    "markets_list": 300.0,
+    "events_list": 300.0,
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    action TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    meta TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_expires ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at);
+"""
+
+
+class DiskCache:
+    """
+    SQLite 响应缓存
+
+    - 每个 action 独立 TTL，未配置的 action 不落盘
+    - 总大小超过 ``max_bytes`` 时先删过期条目，再按最近访问时间淘汰
+    - 方法均为同步调用，异步代码中应通过 ``asyncio.to_thread`` 使用
+    """
+
+    PRUNE_EVERY = 64
+
+    def __init__(
+        self,
+        path: str,
+        ttls: dict[str, float] | None = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = os.path.expanduser(path)
+        self.ttls = {**DEFAULT_DISK_TTLS, **(ttls or {})}
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._puts = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def ttl_for(self, action: str) -> float:
+        return self.ttls.get(action, 0.0)
+
+    def is_cacheable(self, action: str) -> bool:
+        return self.ttl_for(action) > 0
+
+    def get(self, key: str) -> CacheEntry | None:
+        """读取未过期条目；SQLite 异常（如锁超时）按未命中处理，不影响请求"""
+        now = self._clock()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT action, payload, meta, stored_at, expires_at FROM responses WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            except sqlite3.Error:
+                self.errors += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        action, payload, meta, stored_at, expires_at = row
+        return CacheEntry(action=action, payload=payload, meta=json.loads(meta), stored_at=stored_at, expires_at=expires_at)
+
+    def put_payload(self, key: str, action: str, payload: str, meta: dict[str, Any]) -> None:
+        ttl = self.ttl_for(action)
+        if ttl <= 0 or len(payload) > self.max_bytes:
+            return
+        now = self._clock()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, action, payload, meta, stored_at, expires_at, accessed_at, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, action, payload, json.dumps(meta, ensure_ascii=False), now, now + ttl, now, len(payload)),
+                )
+                self._puts += 1
+                if self._puts % self.PRUNE_EVERY == 0:
+                    self._prune_locked()
+            except sqlite3.Error:
+                self.errors += 1
+
+    def remaining_ttl(self, entry: CacheEntry) -> float:
+        return max(entry.expires_at - self._clock(), 0.0)
+
+    def age_ms(self, entry: CacheEntry) -> int:
+        return int((self._clock() - entry.stored_at) * 1000)
+
+    def prune(self) -> int:
+        with self._lock:
+            return self._prune_locked()
+
+    def purge(self, action: str | None = None, expired_only: bool = False) -> int:
+        """删除条目，返回删除数量"""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if action:
+            clauses.append("action = ?")
+            params.append(action)
+        if expired_only:
+            clauses.append("expires_at <= ?")
+            params.append(self._clock())
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            deleted = self._conn.execute(f"DELETE FROM responses{where}", params).rowcount
+        return max(deleted, 0)
+
+    def stats(self) -> dict[str, Any]:
+        now = self._clock()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT action, COUNT(*), COALESCE(SUM(size), 0), SUM(expires_at <= ?) "
+                "FROM responses GROUP BY action ORDER BY action",
+                (now,),
+            ).fetchall()
+        by_action = {
+            action: {"entries": count, "bytes": size, "expired": expired or 0}
+            for action, count, size, expired in rows
+        }
+        return {
+            "path": self.path,
+            "entries": sum(item["entries"] for item in by_action.values()),
+            "bytes": sum(item["bytes"] for item in by_action.values()),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "by_action": by_action,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _prune_locked(self) -> int:
+        deleted = self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (self._clock(),)).rowcount
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_bytes:
+            # 按最近访问时间从旧到新删除，直到低于上限
+            excess = total - self.max_bytes
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+            ).fetchall():
+                if excess <= 0:
+                    break
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                excess -= size
+                deleted += 1
+        return deleted
@@ -3,13 +3,33 @@ from __future__ import annotations
 import asyncio
 import json
 import os
+import time
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Awaitable, Callable, Protocol
 
+from . import tracing
+from .circuit import HALF_OPEN, CircuitBreaker, CircuitBreakers, shared_circuit_breakers
+from .deadline import Deadline
 from .errors import classify_error
+from .metrics import REGISTRY, MetricsRegistry
+from .ratelimit import RateLimiter, family_for, shared_rate_limiter
+from .rawjson import RawJson
+from .scheduler import Priority, SubprocessScheduler, shared_scheduler
 from .security import sanitize_cmd
 from .settings import SkillSettings
 
+_READ_CHUNK = 64 * 1024
+
+
+def excerpt(text: str, limit: int) -> str:
+    """截取前 ``limit`` 字节（UTF-8）用于错误元数据，``limit <= 0`` 表示不截断"""
+    if limit <= 0 or len(text) * 4 <= limit:
+        return text
+    encoded = text.encode("utf-8")
+    if len(encoded) <= limit:
+        return text
+    return encoded[:limit].decode("utf-8", errors="ignore") + f"...（已截断，共 {len(encoded)} 字节）"
+
 
 @dataclass(frozen=True)
 class CommandResult:
@@ -19,9 +39,227 @@ class CommandResult:
     meta: dict[str, Any]
 
 
+def rate_limited(meta: dict[str, Any], timeout_seconds: float) -> CommandResult:
+    """客户端限流预计等待超过请求超时：不占用子进程，直接返回可重试的 ``RateLimitError``"""
+    meta["rate_limited"] = "client"
+    return CommandResult(
+        ok=False,
+        data=None,
+        error={
+            "type": "RateLimitError",
+            "message": f"客户端限流：预计等待超过超时时间（{timeout_seconds}s），请稍后重试",
+            "retryable": True,
+        },
+        meta=meta,
+    )
+
+
+def circuit_open(meta: dict[str, Any], cli_args: list[str], breaker: CircuitBreaker) -> CommandResult:
+    """上游分组处于熔断状态：不启动子进程，直接返回可重试的 ``CircuitOpen``"""
+    meta["circuit"] = breaker.stats()["state"]
+    return CommandResult(
+        ok=False,
+        data=None,
+        error={
+            "type": "CircuitOpen",
+            "message": f"上游 {family_for(cli_args)} 接口连续失败，已熔断，约 {breaker.retry_in():.0f}s 后探测恢复",
+            "retryable": True,
+        },
+        meta=meta,
+    )
+
+
+def deadline_exceeded(meta: dict[str, Any], deadline: Deadline | None) -> CommandResult:
+    """调用方 deadline 已到：不（再）等待子进程，返回可重试的 ``DeadlineExceeded``"""
+    meta["deadline_exceeded"] = True
+    message = deadline.message() if deadline is not None else "请求超过调用方 deadline，已放弃执行"
+    return CommandResult(
+        ok=False,
+        data=None,
+        error={"type": "DeadlineExceeded", "message": message, "retryable": True},
+        meta=meta,
+    )
+
+
+async def admit(scheduler: SubprocessScheduler, priority: Priority, deadline: Deadline | None) -> float | None:
+    """排队获取子进程槽位，返回等待秒数；deadline 先到时返回 None（未占用槽位）"""
+    if deadline is None:
+        return await scheduler.acquire(priority)
+    try:
+        return await asyncio.wait_for(scheduler.acquire(priority), deadline.remaining())
+    except asyncio.TimeoutError:
+        return None
+
+
+def spawn_timeout(timeout_seconds: float, priority: Priority, deadline: Deadline | None) -> float | None:
+    """
+    计算子进程超时；deadline 已到时返回 None（不启动）
+
+    读操作的超时取剩余预算；写操作一旦启动就按完整超时执行，避免在提交中途被终止而状态未知。
+    """
+    if deadline is None:
+        return timeout_seconds
+    if deadline.expired():
+        return None
+    return deadline.clamp(timeout_seconds) if priority > Priority.WRITE else timeout_seconds
+
+
+def record_execution(metrics: MetricsRegistry, backend: str, cli_args: list[str], result: CommandResult) -> None:
+    """更新 ``skill_exec_*`` 指标；只有实际启动了子进程 / HTTP 请求的调用才计入耗时直方图"""
+    family = family_for(cli_args) or "other"
+    if result.error is None:
+        metrics.inc("skill_exec_total", backend=backend, family=family, result="ok")
+    else:
+        metrics.inc("skill_exec_total", backend=backend, family=family, result="error")
+        metrics.inc("skill_exec_error_total", backend=backend, family=family, type=str(result.error.get("type")))
+    meta = result.meta
+    if "timeout_ms" in meta:
+        metrics.observe("skill_exec_duration_ms", meta.get("duration_ms", 0), backend=backend, family=family)
+    if "queue_wait_ms" in meta:
+        metrics.observe("skill_queue_wait_ms", meta["queue_wait_ms"], backend=backend)
+
+
+def guarded(breakers: CircuitBreakers | None, cli_args: list[str], priority: Priority) -> tuple[CircuitBreaker | None, bool]:
+    """
+    熔断检查：返回 (熔断器, 是否放行)
+
+    撤单与写操作总是放行（结果仍计入熔断统计），避免误熔断时无法撤单。
+    """
+    breaker = breakers.get(cli_args) if breakers is not None else None
+    if breaker is None or priority <= Priority.WRITE:
+        return breaker, True
+    return breaker, breaker.allow()
+
+
+class GuardedBackend(Protocol):
+    scheduler: SubprocessScheduler | None
+    rate_limiter: RateLimiter | None
+    circuit_breakers: CircuitBreakers | None
+
+
+async def run_guarded(
+    backend: GuardedBackend,
+    cli_args: list[str],
+    timeout_seconds: float,
+    priority: Priority,
+    deadline: Deadline | None,
+    meta: dict[str, Any],
+    transport: Callable[[float], Awaitable[CommandResult]],
+) -> CommandResult:
+    """
+    CLI 与 HTTP 后端共用的执行流程，``transport(timeout)`` 只负责实际的子进程 / HTTP 调用
+
+    1. deadline 已到时直接返回 ``DeadlineExceeded``
+    2. 分组熔断时返回 ``CircuitOpen``，不限流、不排队
+    3. 按 API 分组限流（等待时间记入 ``meta.rate_limit_wait_ms``），预计等待超过超时则返回客户端 ``RateLimitError``
+    4. 经共享调度器排队占用槽位（等待时间记入 ``meta.queue_wait_ms``），调用结束后释放
+    5. 读操作的超时取剩余预算；因预算截断导致的超时转为 ``DeadlineExceeded``，不计入熔断
+    6. 结果反馈给限流器（``RateLimitError`` 触发退避）与熔断器；half-open 探测未完成时归还探测名额。
+       ``meta.timeout_source == "adaptive"`` 的超时是按历史耗时学习的阈值到期，同样不计入熔断
+    """
+    if deadline is not None and deadline.expired():
+        return deadline_exceeded(meta, deadline)
+
+    breaker, allowed = guarded(backend.circuit_breakers, cli_args, priority)
+    if not allowed:
+        assert breaker is not None
+        return circuit_open(meta, cli_args, breaker)
+    probe = breaker is not None and breaker.state == HALF_OPEN and priority > Priority.WRITE
+    scheduler = backend.scheduler
+    rate_limiter = backend.rate_limiter
+
+    try:
+        if rate_limiter is not None:
+            max_wait = deadline.clamp(timeout_seconds) if deadline is not None else timeout_seconds
+            limited = await rate_limiter.acquire(cli_args, priority, max_wait=max_wait)
+            if limited is None:
+                if probe:
+                    breaker.abandon()
+                return rate_limited(meta, timeout_seconds)
+            meta["rate_limit_wait_ms"] = int(limited * 1000)
+            tracing.add("rate_limit_wait", limited)
+
+        if scheduler is not None:
+            waited = await admit(scheduler, priority, deadline)
+            if waited is None:
+                if probe:
+                    breaker.abandon()
+                return deadline_exceeded(meta, deadline)
+            meta["queue_wait_ms"] = int(waited * 1000)
+            tracing.add("queue_wait", waited)
+        try:
+            timeout = spawn_timeout(timeout_seconds, priority, deadline)
+            if timeout is None:
+                if probe:
+                    breaker.abandon()
+                return deadline_exceeded(meta, deadline)
+            meta["timeout_ms"] = int(timeout * 1000)
+            result = await transport(timeout)
+        finally:
+            if scheduler is not None:
+                scheduler.release()
+    except asyncio.CancelledError:
+        if probe:
+            breaker.abandon()
+        raise
+
+    if timeout < timeout_seconds and result.error is not None and result.error["type"] == "TimeoutError":
+        # 因调用方预算而非上游慢导致的超时，不计入熔断
+        result = deadline_exceeded(meta, deadline)
+    if rate_limiter is not None:
+        rate_limiter.observe(cli_args, result.error, meta.get("retry_after_s"))
+    if breaker is not None:
+        if _breaker_exempt(result.error, meta):
+            if probe:
+                breaker.abandon()
+        else:
+            breaker.record(result.error)
+    return result
+
+
+def _breaker_exempt(error: dict[str, Any] | None, meta: dict[str, Any]) -> bool:
+    """调用方预算耗尽、自适应超时到期都不说明上游故障，不计入熔断"""
+    if error is None:
+        return False
+    if error["type"] == "DeadlineExceeded":
+        return True
+    return error["type"] == "TimeoutError" and meta.get("timeout_source") == "adaptive"
+
+
+class ExecutorBackend(Protocol):
+    """执行后端接口：入参为 ``ActionSpec.builder`` 生成的 CLI argv，返回 ``CommandResult``"""
+
+    async def check_cli_version(self) -> tuple[bool, str]: ...
+
+    async def run(
+        self,
+        cli_args: list[str],
+        timeout_seconds: float,
+        env_overrides: dict[str, str | None] | None = None,
+        priority: Priority = Priority.READ,
+        raw: bool = False,
+        deadline: Deadline | None = None,
+        timeout_source: str | None = None,
+    ) -> CommandResult: ...
+
+
 class PolymarketExecutor:
-    def __init__(self, settings: SkillSettings) -> None:
+    # 取消调用时会 kill 子进程，对冲落败的调用不会继续占用上游
+    cancellable = True
+
+    def __init__(
+        self,
+        settings: SkillSettings,
+        scheduler: SubprocessScheduler | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
         self.settings = settings
+        self.scheduler = scheduler or shared_scheduler(settings.max_concurrent_processes)
+        self.rate_limiter = rate_limiter or shared_rate_limiter(settings)
+        self.circuit_breakers = circuit_breakers or shared_circuit_breakers(settings)
+        self.metrics = metrics or REGISTRY
 
     async def check_cli_version(self) -> tuple[bool, str]:
         command = [self.settings.polymarket_bin, "--version"]
@@ -49,8 +287,12 @@ class PolymarketExecutor:
     async def run(
         self,
         cli_args: list[str],
-        timeout_seconds: int,
+        timeout_seconds: float,
         env_overrides: dict[str, str | None] | None = None,
+        priority: Priority = Priority.READ,
+        raw: bool = False,
+        deadline: Deadline | None = None,
+        timeout_source: str | None = None,
     ) -> CommandResult:
         """
         执行 polymarket CLI 命令
@@ -58,15 +300,58 @@ class PolymarketExecutor:
         改进:
         1. 统一的时间追踪
         2. 超时后显式终止进程
-        3. 完整保留 stdout/stderr
+        3. 增量读取 stdout，超过 ``max_output_bytes`` 时终止子进程并返回 ``ResponseTooLarge``；
+           错误元数据只保留 ``error_excerpt_bytes`` 以内的 stdout/stderr 片段
         4. 空响应检测
+        5. 经共享调度器限制并发子进程数，按优先级排队（排队时间记入 meta.queue_wait_ms）
+        6. ``raw=True`` 时 JSON 对象/数组输出以 ``RawJson`` 原样返回，不解析
+        7. 占用槽位前先经按 API 分组的令牌桶限流（等待时间记入 meta.rate_limit_wait_ms），
+           结果为 ``RateLimitError`` 时该分组自动退避
+        8. 分组熔断时直接返回 ``CircuitOpen``，不限流、不排队、不启动子进程
+        9. 带 ``deadline`` 时限流与排队等待以剩余预算为上限，读操作的子进程超时取剩余预算，
+           预算耗尽时不启动子进程，返回 ``DeadlineExceeded``
+        10. 每次调用（含限流、熔断等快速失败）计入 ``skill_exec_*`` 指标
+        11. ``timeout_source="adaptive"`` 表示超时来自自适应阈值，记入 meta，到期不计入熔断
         """
+        result = await self._run(cli_args, timeout_seconds, env_overrides, priority, raw, deadline, timeout_source)
+        record_execution(self.metrics, "cli", cli_args, result)
+        return result
+
+    async def _run(
+        self,
+        cli_args: list[str],
+        timeout_seconds: float,
+        env_overrides: dict[str, str | None] | None = None,
+        priority: Priority = Priority.READ,
+        raw: bool = False,
+        deadline: Deadline | None = None,
+        timeout_source: str | None = None,
+    ) -> CommandResult:
         command = [self.settings.polymarket_bin, "-o", "json", *cli_args]
-        meta = {
+        meta: dict[str, Any] = {
             "cmd_sanitized": sanitize_cmd(command),
             "duration_ms": 0,
         }
+        if timeout_source is not None:
+            meta["timeout_source"] = timeout_source
+        return await run_guarded(
+            self,
+            cli_args,
+            timeout_seconds,
+            priority,
+            deadline,
+            meta,
+            lambda timeout: self._run_process(command, timeout, env_overrides, meta, raw),
+        )
 
+    async def _run_process(
+        self,
+        command: list[str],
+        timeout_seconds: float,
+        env_overrides: dict[str, str | None] | None,
+        meta: dict[str, Any],
+        raw: bool = False,
+    ) -> CommandResult:
         environment = os.environ.copy()
         if env_overrides:
             for key, value in env_overrides.items():
@@ -74,6 +359,7 @@ class PolymarketExecutor:
                     environment[key] = value
 
         started = asyncio.get_event_loop().time()
+        spawned = started
         process = None
 
         try:
@@ -83,15 +369,41 @@ class PolymarketExecutor:
                 stderr=asyncio.subprocess.PIPE,
                 env=environment,
             )
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            spawned = asyncio.get_event_loop().time()
+            tracing.add("spawn", spawned - started)
+            stdout, stderr, overflowed = await asyncio.wait_for(
+                self._communicate(process),
                 timeout=timeout_seconds,
             )
 
             # 计算执行时长
-            meta["duration_ms"] = int((asyncio.get_event_loop().time() - started) * 1000)
+            finished = asyncio.get_event_loop().time()
+            meta["duration_ms"] = int((finished - started) * 1000)
+            tracing.add("child", finished - spawned)
             meta["exit_code"] = process.returncode
 
+            if overflowed:
+                meta["stdout"] = excerpt(stdout.decode("utf-8", errors="ignore"), self.settings.error_excerpt_bytes)
+                return CommandResult(
+                    ok=False,
+                    data=None,
+                    error={
+                        "type": "ResponseTooLarge",
+                        "message": f"命令输出超过上限 {self.settings.max_output_bytes} 字节，已终止",
+                        "retryable": False,
+                    },
+                    meta=meta,
+                )
+
+            if raw and process.returncode == 0:
+                with tracing.span("decode"):
+                    passthrough = RawJson.from_output(stdout)
+                if passthrough is not None:
+                    raw_stderr = stderr.decode("utf-8", errors="ignore").strip()
+                    if raw_stderr:
+                        meta["stderr"] = excerpt(raw_stderr, self.settings.error_excerpt_bytes)
+                    return CommandResult(ok=True, data=passthrough, error=None, meta=meta)
+
             # 解码输出
             raw_stdout = stdout.decode("utf-8", errors="ignore").strip()
             raw_stderr = stderr.decode("utf-8", errors="ignore").strip()
@@ -102,6 +414,16 @@ class PolymarketExecutor:
             else:
                 return self._handle_failure(raw_stdout, raw_stderr, process.returncode, meta)
 
+        except asyncio.CancelledError:
+            # 调用方取消（如批量 deadline）时不留下孤儿进程
+            if process and process.returncode is None:
+                try:
+                    process.kill()
+                    await process.wait()
+                except Exception:
+                    pass
+            raise
+
         except FileNotFoundError:
             return CommandResult(
                 ok=False,
@@ -116,8 +438,11 @@ class PolymarketExecutor:
 
         except asyncio.TimeoutError:
             # 计算实际执行时长
-            meta["duration_ms"] = int((asyncio.get_event_loop().time() - started) * 1000)
+            finished = asyncio.get_event_loop().time()
+            meta["duration_ms"] = int((finished - started) * 1000)
             meta["timed_out"] = True
+            if process is not None:
+                tracing.add("child", finished - spawned)
 
             # 显式终止进程
             if process and process.returncode is None:
@@ -132,7 +457,7 @@ class PolymarketExecutor:
                 data=None,
                 error={
                     "type": "TimeoutError",
-                    "message": f"命令执行超时（{timeout_seconds}s）",
+                    "message": f"命令执行超时（{timeout_seconds:g}s）",
                     "retryable": True,
                 },
                 meta=meta,
@@ -153,6 +478,59 @@ class PolymarketExecutor:
                 meta=meta,
             )
 
+    async def _communicate(self, process: asyncio.subprocess.Process) -> tuple[bytes, bytes, bool]:
+        """
+        增量读取 stdout/stderr，返回 (stdout, stderr, 是否超限)
+
+        stderr 只保留前 ``error_excerpt_bytes`` 字节但会一直读到 EOF，避免子进程因管道写满而阻塞；
+        stdout 超过 ``max_output_bytes`` 时立即终止子进程。
+        """
+        max_stdout = self.settings.max_output_bytes
+        max_stderr = self.settings.error_excerpt_bytes
+        stdout = bytearray()
+        stderr = bytearray()
+
+        async def _pump_stdout() -> bool:
+            assert process.stdout is not None
+            # stdout_read：首个数据块到 EOF，不含子进程产生输出前的运行时间
+            first: float | None = None
+            try:
+                while chunk := await process.stdout.read(_READ_CHUNK):
+                    if first is None:
+                        first = time.perf_counter()
+                    stdout.extend(chunk)
+                    if 0 < max_stdout < len(stdout):
+                        return True
+                return False
+            finally:
+                if first is not None:
+                    tracing.add("stdout_read", time.perf_counter() - first)
+
+        async def _pump_stderr() -> None:
+            assert process.stderr is not None
+            while chunk := await process.stderr.read(_READ_CHUNK):
+                if max_stderr <= 0 or len(stderr) < max_stderr:
+                    stderr.extend(chunk)
+
+        stdout_task = asyncio.ensure_future(_pump_stdout())
+        stderr_task = asyncio.ensure_future(_pump_stderr())
+        try:
+            overflowed = await stdout_task
+            if overflowed:
+                process.kill()
+                # 丢弃管道中的剩余数据直到 EOF，让管道正常关闭
+                assert process.stdout is not None
+                while await process.stdout.read(_READ_CHUNK):
+                    pass
+            await stderr_task
+            await process.wait()
+        finally:
+            for task in (stdout_task, stderr_task):
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(stdout_task, stderr_task, return_exceptions=True)
+        return bytes(stdout), bytes(stderr), overflowed
+
     def _handle_success(
         self,
         raw_stdout: str,
@@ -164,7 +542,7 @@ class PolymarketExecutor:
         if not raw_stdout:
             meta["warning"] = "Exit code 0 but no output"
             if raw_stderr:
-                meta["stderr"] = raw_stderr
+                meta["stderr"] = excerpt(raw_stderr, self.settings.error_excerpt_bytes)
             return CommandResult(
                 ok=False,
                 data=None,
@@ -179,9 +557,10 @@ class PolymarketExecutor:
         # 尝试解析 JSON
         parsed: Any | None
         try:
-            parsed = json.loads(raw_stdout)
+            with tracing.span("decode"):
+                parsed = json.loads(raw_stdout)
             if raw_stderr:
-                meta["stderr"] = raw_stderr
+                meta["stderr"] = excerpt(raw_stderr, self.settings.error_excerpt_bytes)
             return CommandResult(
                 ok=True,
                 data=parsed,
@@ -193,7 +572,7 @@ class PolymarketExecutor:
             meta["warning"] = f"Non-JSON response: {str(e)}"
             meta["format"] = "raw_text"
             if raw_stderr:
-                meta["stderr"] = raw_stderr
+                meta["stderr"] = excerpt(raw_stderr, self.settings.error_excerpt_bytes)
             return CommandResult(
                 ok=True,
                 data=raw_stdout,
@@ -221,14 +600,15 @@ class PolymarketExecutor:
             message = str(parsed["error"])
             cli_error = parsed
         else:
-            message = raw_stderr or raw_stdout or f"命令执行失败，退出码 {returncode}"
+            message = excerpt(raw_stderr or raw_stdout, self.settings.error_excerpt_bytes)
+            message = message or f"命令执行失败，退出码 {returncode}"
             cli_error = None
 
-        # 保留完整的输出信息
+        # 只保留有界的输出片段
         if raw_stdout:
-            meta["stdout"] = raw_stdout
+            meta["stdout"] = excerpt(raw_stdout, self.settings.error_excerpt_bytes)
         if raw_stderr:
-            meta["stderr"] = raw_stderr
+            meta["stderr"] = excerpt(raw_stderr, self.settings.error_excerpt_bytes)
 
         # 分类错误
         error_info = classify_error(message)
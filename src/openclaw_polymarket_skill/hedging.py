@@ -0,0 +1,147 @@
+"""
+幂等读请求的对冲（hedged request）：首个调用超过该 action 的历史分位耗时仍未返回时，
+再发起一个相同调用，取先成功的结果并取消另一个
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from .latency import LatencyTracker
+
+
+class Hedger:
+    """
+    按 action 对冲读请求，并把每次调用的耗时记入 ``LatencyTracker``
+
+    - 只对 ``actions`` 中的 action 对冲，阈值为该 action 最近成功耗时的 ``percentile`` 分位；
+      样本不足 ``min_samples`` 时不对冲
+    - 先完成的调用失败而另一个仍在进行时继续等待另一个；都失败时返回先完成的失败结果
+    - 落败的调用被取消（CLI 后端取消时会 kill 子进程），不阻塞返回
+    - 调用方只能传入幂等的读操作：两次调用都可能已经到达上游
+    - 耗时样本取 ``meta.duration_ms``（只含占用槽位后的执行时间），不含限流与排队等待
+    - 到达阈值时 ``can_hedge()`` 返回 False（调度器 / 限流器已饱和，或后端无法取消）则不对冲，
+      只计入 ``hedge_skipped``：对冲调用只会排在同一队列后面，或在落败后仍占用上游
+    """
+
+    def __init__(
+        self,
+        tracker: LatencyTracker,
+        actions: tuple[str, ...] | frozenset[str] = (),
+        percentile: float = 0.95,
+        min_samples: int = 20,
+    ) -> None:
+        self.tracker = tracker
+        self.actions = frozenset(actions)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self._counts: dict[str, dict[str, int]] = {}
+        self._losers: set[asyncio.Task[dict[str, Any]]] = set()
+
+    def threshold(self, action: str) -> float | None:
+        """当前对冲阈值（秒），未启用或样本不足时返回 None"""
+        if action not in self.actions:
+            return None
+        return self.tracker.percentile(action, self.percentile, self.min_samples)
+
+    async def run(
+        self,
+        action: str,
+        call: Callable[[], Awaitable[dict[str, Any]]],
+        can_hedge: Callable[[], bool] | None = None,
+    ) -> dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        threshold = self.threshold(action)
+        if threshold is None:
+            started = loop.time()
+            result = await call()
+            self._observe(action, result, loop.time() - started)
+            if action in self.actions:
+                self._count(action, "requests")
+            return result
+
+        self._count(action, "requests")
+        started: dict[asyncio.Future[dict[str, Any]], float] = {}
+        primary = asyncio.ensure_future(call())
+        started[primary] = loop.time()
+        pending: set[asyncio.Task[dict[str, Any]]] = {primary}
+        hedge: asyncio.Task[dict[str, Any]] | None = None
+        first_failure: dict[str, Any] | None = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=threshold)
+            if not done:
+                if can_hedge is None or can_hedge():
+                    hedge = asyncio.ensure_future(call())
+                    started[hedge] = loop.time()
+                    pending.add(hedge)
+                    self._count(action, "hedged")
+                else:
+                    self._count(action, "hedge_skipped")
+            while True:
+                for task in done:
+                    result = task.result()
+                    if result.get("ok"):
+                        self._observe(action, result, loop.time() - started[task])
+                        return self._finish(action, result, task is hedge, hedge is not None, pending)
+                    if first_failure is None:
+                        first_failure = result
+                if not pending:
+                    assert first_failure is not None
+                    return self._finish(action, first_failure, False, hedge is not None, pending)
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        except BaseException:
+            for task in (primary, hedge):
+                if task is not None and not task.done():
+                    task.cancel()
+            raise
+
+    def _finish(
+        self,
+        action: str,
+        result: dict[str, Any],
+        hedge_won: bool,
+        hedged: bool,
+        pending: set[asyncio.Task[dict[str, Any]]],
+    ) -> dict[str, Any]:
+        for task in pending:
+            task.cancel()
+            self._losers.add(task)
+            task.add_done_callback(self._losers.discard)
+        if hedged:
+            result["meta"]["hedged"] = True
+            result["meta"]["hedge_won"] = hedge_won
+            if hedge_won:
+                self._count(action, "hedge_wins")
+        return result
+
+    def _observe(self, action: str, result: dict[str, Any], seconds: float) -> None:
+        if not result.get("ok"):
+            return
+        meta = result.get("meta") or {}
+        duration_ms = meta.get("duration_ms")
+        if isinstance(duration_ms, (int, float)):
+            seconds = duration_ms / 1000
+        else:
+            waited_ms = meta.get("rate_limit_wait_ms", 0) + meta.get("queue_wait_ms", 0)
+            seconds = max(0.0, seconds - waited_ms / 1000)
+        self.tracker.record(action, seconds)
+
+    def _count(self, action: str, name: str) -> None:
+        counts = self._counts.get(action)
+        if counts is None:
+            counts = self._counts[action] = {"requests": 0, "hedged": 0, "hedge_wins": 0, "hedge_skipped": 0}
+        counts[name] += 1
+
+    def stats(self) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for action in sorted(self.actions):
+            counts = self._counts.get(action, {"requests": 0, "hedged": 0, "hedge_wins": 0, "hedge_skipped": 0})
+            threshold = self.threshold(action)
+            result[action] = {
+                **counts,
+                "hedge_rate": round(counts["hedged"] / counts["requests"], 4) if counts["requests"] else 0.0,
+                "win_rate": round(counts["hedge_wins"] / counts["hedged"], 4) if counts["hedged"] else 0.0,
+                "threshold_ms": int(threshold * 1000) if threshold is not None else None,
+                "samples": self.tracker.count(action),
+            }
+        return result
@@ -0,0 +1,387 @@
+"""
+进程内 HTTP 执行后端
+
+直接调用 Gamma / CLOB / Data REST 接口，省去每次调用的 fork/exec、CLI 启动和 TLS 握手。
+只支持公开只读 action；请求由 runner 传入的 action 与已校验参数构建（经 ``ActionPlan.values``
+套用与 argv 相同的默认值），返回与 CLI 后端相同的 ``CommandResult``。
+"""
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import socket
+import threading
+import time
+from typing import Any
+from urllib.parse import quote, urlencode, urlsplit
+
+from . import tracing
+from .actions import ACTION_PLANS
+from .circuit import CircuitBreakers, shared_circuit_breakers
+from .deadline import Deadline
+from .errors import ErrorInfo, classify_error
+from .executor import CommandResult, excerpt, record_execution, run_guarded
+from .metrics import REGISTRY, MetricsRegistry
+from .ratelimit import RateLimiter, shared_rate_limiter
+from .rawjson import RawJson
+from .scheduler import Priority, SubprocessScheduler, shared_scheduler
+from .security import sanitize_cmd
+from .settings import SkillSettings
+
+
+class UnsupportedCommand(ValueError):
+    """action 无法映射到公开 REST 接口"""
+
+
+_PAGING = {"limit": "limit", "offset": "offset"}
+_LISTING = {**_PAGING, "active": "active", "closed": "closed", "order": "order", "ascending": "ascending"}
+
+
+HTTP_ACTIONS = frozenset({
+    "markets_search", "markets_get", "markets_list", "events_get", "events_list",
+    "clob_book", "clob_midpoint", "clob_spread", "clob_price", "clob_price_history",
+    "data_positions", "data_trades", "data_value", "data_leaderboard",
+})
+
+
+def _query(values: dict[str, str], mapping: dict[str, str]) -> dict[str, str]:
+    return {name: values[key] for key, name in mapping.items() if key in values}
+
+
+def _segment(value: str) -> str:
+    return quote(value, safe="")
+
+
+def map_request(action: str, values: dict[str, str]) -> tuple[str, str, dict[str, str]]:
+    """
+    把 action 与参数值映射为 (api, path, query)，api 取值 gamma / clob / data
+
+    ``values`` 为 ``ActionPlan.values`` 的结果：与 CLI argv 携带的值一致（含默认值），
+    不从 argv 反向解析，以 ``--`` 开头的参数值不会被误认为选项。
+    """
+    if action == "markets_search":
+        return "gamma", "/public-search", {"q": values["query"], **_query(values, {"limit": "limit_per_type"})}
+    if action == "markets_get":
+        ident = values["id_or_slug"]
+        return "gamma", (f"/markets/{ident}" if ident.isdigit() else f"/markets/slug/{_segment(ident)}"), {}
+    if action == "markets_list":
+        return "gamma", "/markets", _query(values, _LISTING)
+    if action == "events_get":
+        return "gamma", f"/events/{_segment(values['id'])}", {}
+    if action == "events_list":
+        return "gamma", "/events", _query(values, {**_LISTING, "tag": "tag_slug"})
+    if action in {"clob_book", "clob_midpoint"}:
+        return "clob", f"/{action[5:]}", {"token_id": values["token_id"]}
+    if action in {"clob_spread", "clob_price"}:
+        return "clob", f"/{action[5:]}", {"token_id": values["token_id"], **_query(values, {"side": "side"})}
+    if action == "clob_price_history":
+        return "clob", "/prices-history", {
+            "market": values["token_id"],
+            **_query(values, {"interval": "interval", "fidelity": "fidelity"}),
+        }
+    if action in {"data_positions", "data_trades"}:
+        return "data", f"/{action[5:]}", {"user": values["address"], **_query(values, _PAGING)}
+    if action == "data_value":
+        return "data", "/value", {"user": values["address"]}
+    if action == "data_leaderboard":
+        return "data", "/leaderboard", _query(values, {**_PAGING, "period": "timePeriod", "order_by": "orderBy"})
+    raise UnsupportedCommand(action)
+
+
+class ConnectionPool:
+    """按 host 复用 keep-alive 连接（线程安全）"""
+
+    def __init__(self, base_url: str, max_idle: int = 8) -> None:
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "https"
+        self.host = parts.hostname or ""
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.max_idle = max_idle
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+        self.created = 0
+
+    def acquire(self, timeout: float, fresh: bool = False) -> tuple[http.client.HTTPConnection, bool]:
+        """返回 (连接, 是否为复用的空闲连接)"""
+        connection = None
+        if not fresh:
+            with self._lock:
+                connection = self._idle.pop() if self._idle else None
+        if connection is None:
+            factory = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            self.created += 1
+            return factory(self.host, self.port, timeout=timeout), False
+        connection.timeout = timeout
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout)
+        return connection, True
+
+    def release(self, connection: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(connection)
+                    return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+
+class HttpExecutor:
+    """与 ``PolymarketExecutor`` 接口一致的 HTTP 后端"""
+
+    # 请求在 ``asyncio.to_thread`` 中执行，取消 task 不会中断进行中的请求
+    cancellable = False
+
+    def __init__(
+        self,
+        settings: SkillSettings,
+        scheduler: SubprocessScheduler | None = None,
+        rate_limiter: RateLimiter | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.settings = settings
+        self.scheduler = scheduler or shared_scheduler(settings.max_concurrent_processes)
+        # 与 CLI 后端共用同一组令牌桶：两者访问的是同一批上游 API
+        self.rate_limiter = rate_limiter or shared_rate_limiter(settings)
+        self.circuit_breakers = circuit_breakers or shared_circuit_breakers(settings)
+        self.metrics = metrics or REGISTRY
+        self.pools = {
+            "gamma": ConnectionPool(settings.gamma_api_url),
+            "clob": ConnectionPool(settings.clob_api_url),
+            "data": ConnectionPool(settings.data_api_url),
+        }
+
+    async def check_cli_version(self) -> tuple[bool, str]:
+        return True, "http"
+
+    async def run(
+        self,
+        cli_args: list[str],
+        timeout_seconds: float,
+        env_overrides: dict[str, str | None] | None = None,
+        priority: Priority = Priority.READ,
+        raw: bool = False,
+        deadline: Deadline | None = None,
+        action: str | None = None,
+        params: dict[str, Any] | None = None,
+        timeout_source: str | None = None,
+    ) -> CommandResult:
+        """``cli_args`` 只用于日志、限流与熔断分组；请求内容由 ``action`` 与 ``params`` 决定"""
+        result = await self._run(
+            cli_args, timeout_seconds, env_overrides, priority, raw, deadline, action, params, timeout_source
+        )
+        record_execution(self.metrics, "http", cli_args, result)
+        return result
+
+    async def _run(
+        self,
+        cli_args: list[str],
+        timeout_seconds: float,
+        env_overrides: dict[str, str | None] | None = None,
+        priority: Priority = Priority.READ,
+        raw: bool = False,
+        deadline: Deadline | None = None,
+        action: str | None = None,
+        params: dict[str, Any] | None = None,
+        timeout_source: str | None = None,
+    ) -> CommandResult:
+        meta: dict[str, Any] = {
+            "cmd_sanitized": sanitize_cmd([self.settings.polymarket_bin, "-o", "json", *cli_args]),
+            "duration_ms": 0,
+            "backend": "http",
+        }
+        if timeout_source is not None:
+            meta["timeout_source"] = timeout_source
+        try:
+            plan = ACTION_PLANS.get(action or "")
+            if plan is None or params is None or action not in HTTP_ACTIONS:
+                raise UnsupportedCommand(action or "")
+            api, path, query = map_request(plan.spec.name, plan.values(params))
+        except UnsupportedCommand:
+            return CommandResult(
+                ok=False,
+                data=None,
+                error={
+                    "type": "UnsupportedByBackend",
+                    "message": f"HTTP 后端不支持该命令: {' '.join(cli_args)}",
+                    "retryable": False,
+                },
+                meta=meta,
+            )
+
+        async def _transport(timeout: float) -> CommandResult:
+            started = time.monotonic()
+            return await asyncio.to_thread(self._request, api, path, query, timeout, meta, started, raw)
+
+        return await run_guarded(self, cli_args, timeout_seconds, priority, deadline, meta, _transport)
+
+    def close(self) -> None:
+        for pool in self.pools.values():
+            pool.close()
+
+    def _send(
+        self,
+        pool: ConnectionPool,
+        target: str,
+        expires_at: float,
+        max_bytes: int = 0,
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """
+        发送 GET；复用的空闲连接可能已被服务端关闭，此时换新连接重试一次
+
+        ``max_bytes > 0`` 时最多读取 ``max_bytes + 1`` 字节，超限的响应体未读完，连接不再复用。
+        socket 超时只约束单次读写，``expires_at``（monotonic）是整个请求的上限：到期时由计时器
+        关闭 socket，中断进行中的读取，逐字节慢速返回的响应也不会超出预算。
+        """
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            raise socket.timeout("HTTP 请求预算已耗尽")
+        connection, reused = pool.acquire(remaining)
+        expired = threading.Event()
+
+        def _expire() -> None:
+            expired.set()
+            sock = connection.sock
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+        timer = threading.Timer(remaining, _expire)
+        timer.daemon = True
+        timer.start()
+        try:
+            while True:
+                try:
+                    connection.request(
+                        "GET", target, headers={"Accept": "application/json", "Connection": "keep-alive"}
+                    )
+                    response = connection.getresponse()
+                    body = response.read(max_bytes + 1) if max_bytes > 0 else response.read()
+                except (ConnectionError, http.client.RemoteDisconnected, http.client.BadStatusLine):
+                    connection.close()
+                    if expired.is_set():
+                        raise socket.timeout("HTTP 请求超出总耗时上限") from None
+                    if not reused:
+                        raise
+                    connection, reused = pool.acquire(max(expires_at - time.monotonic(), 0.001), fresh=True)
+                    continue
+                except BaseException:
+                    connection.close()
+                    if expired.is_set():
+                        raise socket.timeout("HTTP 请求超出总耗时上限") from None
+                    raise
+                if expired.is_set():
+                    # 计时器关闭 socket 后读到的响应体可能不完整
+                    connection.close()
+                    raise socket.timeout("HTTP 请求超出总耗时上限")
+                pool.release(connection, reusable=not response.will_close and response.isclosed())
+                return response, body
+        finally:
+            timer.cancel()
+
+    def _request(
+        self,
+        api: str,
+        path: str,
+        query: dict[str, str],
+        timeout_seconds: float,
+        meta: dict[str, Any],
+        started: float,
+        raw: bool = False,
+    ) -> CommandResult:
+        pool = self.pools[api]
+        target = pool.base_path + path + (f"?{urlencode(query)}" if query else "")
+        meta["url"] = f"{pool.scheme}://{pool.host}{f':{pool.port}' if pool.port else ''}{target}"
+
+        try:
+            response, body = self._send(pool, target, started + timeout_seconds, self.settings.max_output_bytes)
+        except socket.timeout:
+            meta["duration_ms"] = int((time.monotonic() - started) * 1000)
+            meta["timed_out"] = True
+            return CommandResult(
+                ok=False,
+                data=None,
+                error={"type": "TimeoutError", "message": f"HTTP 请求超时（{timeout_seconds:g}s）", "retryable": True},
+                meta=meta,
+            )
+        except (OSError, http.client.HTTPException) as exc:
+            meta["duration_ms"] = int((time.monotonic() - started) * 1000)
+            return CommandResult(
+                ok=False,
+                data=None,
+                error={"type": "NetworkError", "message": f"HTTP 连接失败: {exc}", "retryable": True},
+                meta=meta,
+            )
+
+        elapsed = time.monotonic() - started
+        meta["duration_ms"] = int(elapsed * 1000)
+        meta["status"] = response.status
+        # 在 to_thread 的线程中运行，contextvar 已随调用复制，记录到同一个 trace
+        tracing.add("http", elapsed)
+        if 0 < self.settings.max_output_bytes < len(body):
+            return CommandResult(
+                ok=False,
+                data=None,
+                error={
+                    "type": "ResponseTooLarge",
+                    "message": f"响应超过上限 {self.settings.max_output_bytes} 字节，已中止读取",
+                    "retryable": False,
+                },
+                meta=meta,
+            )
+        if raw and response.status < 400:
+            with tracing.span("decode"):
+                passthrough = RawJson.from_output(body)
+            if passthrough is not None:
+                return CommandResult(ok=True, data=passthrough, error=None, meta=meta)
+        text = body.decode("utf-8", errors="ignore").strip()
+
+        if response.status >= 400:
+            message = excerpt(text, self.settings.error_excerpt_bytes) or response.reason
+            try:
+                parsed = json.loads(text)
+                if isinstance(parsed, dict) and "error" in parsed:
+                    message = excerpt(str(parsed["error"]), self.settings.error_excerpt_bytes)
+            except json.JSONDecodeError:
+                pass
+            if response.status == 429:
+                error_info = ErrorInfo("RateLimitError", True)
+                retry_after = response.getheader("Retry-After")
+                if retry_after and retry_after.strip().isdigit():
+                    meta["retry_after_s"] = int(retry_after.strip())
+            elif response.status >= 500:
+                error_info = ErrorInfo("UpstreamError", True)
+            else:
+                error_info = classify_error(message)
+            return CommandResult(
+                ok=False,
+                data=None,
+                error={"type": error_info.type, "message": message, "retryable": error_info.retryable},
+                meta=meta,
+            )
+
+        if not text:
+            return CommandResult(
+                ok=False,
+                data=None,
+                error={"type": "EmptyResponse", "message": "接口返回空响应", "retryable": False},
+                meta=meta,
+            )
+        try:
+            with tracing.span("decode"):
+                data = json.loads(text)
+            return CommandResult(ok=True, data=data, error=None, meta=meta)
+        except json.JSONDecodeError as exc:
+            meta["warning"] = f"Non-JSON response: {exc}"
+            meta["format"] = "raw_text"
+            return CommandResult(ok=True, data=text, error=None, meta=meta)
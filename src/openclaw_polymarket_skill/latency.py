@@ -0,0 +1,99 @@
+"""
+按 action 的滑动窗口耗时统计
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any
+
+
+class LatencyTracker:
+    """
+    记录每个 action 最近 ``window`` 次成功调用的耗时（秒），按需计算分位数
+
+    窗口固定大小，旧样本自动淘汰，分位数随上游状况变化；失败调用不记录，避免超时拉高阈值。
+    """
+
+    def __init__(self, window: int = 256) -> None:
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, action: str, seconds: float) -> None:
+        samples = self._samples.get(action)
+        if samples is None:
+            samples = self._samples[action] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def count(self, action: str) -> int:
+        samples = self._samples.get(action)
+        return len(samples) if samples is not None else 0
+
+    def percentile(self, action: str, q: float, min_samples: int = 1) -> float | None:
+        """返回分位数 ``q``（0-1，最近秩法），样本少于 ``min_samples`` 时返回 None"""
+        samples = self._samples.get(action)
+        if samples is None or len(samples) < max(1, min_samples):
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+    def stats(self) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for action, samples in self._samples.items():
+            ordered = sorted(samples)
+            last = len(ordered) - 1
+            result[action] = {
+                "count": len(ordered),
+                "p50_ms": int(ordered[last // 2] * 1000),
+                "p95_ms": int(ordered[min(last, int(0.95 * len(ordered)))] * 1000),
+                "p99_ms": int(ordered[min(last, int(0.99 * len(ordered)))] * 1000),
+            }
+        return result
+
+
+class AdaptiveTimeouts:
+    """
+    按 action 的自适应超时：最近成功调用的执行耗时 p99 × ``multiplier``，限定在 ``[min_seconds, max_seconds]``
+
+    - 样本取 ``meta.duration_ms``（只含子进程/HTTP 执行，不含排队与限流等待）
+    - 样本不足 ``min_samples`` 时使用调用方给出的默认超时
+    - 超时的调用以当时的超时值记为一个样本：上游整体变慢时阈值随之上调，不会因只记录成功样本而卡在过低的值
+    """
+
+    def __init__(
+        self,
+        multiplier: float = 3.0,
+        min_seconds: float = 1.0,
+        max_seconds: float = 60.0,
+        min_samples: int = 20,
+        percentile: float = 0.99,
+        window: int = 256,
+    ) -> None:
+        self.tracker = LatencyTracker(window)
+        self.multiplier = multiplier
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.min_samples = min_samples
+        self.percentile = percentile
+
+    def timeout(self, action: str, default: float) -> tuple[float, bool]:
+        """返回 (超时秒数, 是否为自适应值)"""
+        observed = self.tracker.percentile(action, self.percentile, self.min_samples)
+        if observed is None:
+            return default, False
+        return min(self.max_seconds, max(self.min_seconds, observed * self.multiplier)), True
+
+    def observe(self, action: str, result: dict[str, Any], timeout: float) -> None:
+        if result.get("ok"):
+            duration_ms = result.get("meta", {}).get("duration_ms")
+            if isinstance(duration_ms, (int, float)):
+                self.tracker.record(action, duration_ms / 1000)
+        elif (result.get("error") or {}).get("type") == "TimeoutError":
+            self.tracker.record(action, timeout)
+
+    def stats(self) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for action, summary in self.tracker.stats().items():
+            seconds, adaptive = self.timeout(action, 0.0)
+            result[action] = {**summary, "timeout_ms": int(seconds * 1000) if adaptive else None}
+        return result
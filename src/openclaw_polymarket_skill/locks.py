@@ -4,6 +4,40 @@ import asyncio
 from collections import defaultdict
 from typing import Any, Awaitable, Callable
 
+from . import tracing
+
+
+def wallet_key(runtime: dict[str, Any]) -> str:
+    return str(runtime.get("wallet_id") or runtime.get("address") or "default-wallet")
+
+
+async def acquire_within(lock: asyncio.Lock, timeout: float) -> None:
+    """
+    在 ``timeout`` 秒内获取锁，超时抛出 ``asyncio.TimeoutError`` 且不持有锁
+
+    Python < 3.12 的 ``asyncio.wait_for`` 在内部 ``acquire`` 刚完成时超时会丢弃结果，锁永远不会释放；
+    有 ``asyncio.timeout`` 时用它，否则在被取消的 acquire 实际拿到锁时由回调释放。
+    """
+    if hasattr(asyncio, "timeout"):
+        async with asyncio.timeout(timeout):
+            await lock.acquire()
+        return
+    acquiring = asyncio.ensure_future(lock.acquire())
+    try:
+        await asyncio.wait_for(asyncio.shield(acquiring), timeout)
+    except BaseException:
+        acquiring.add_done_callback(_release_if_acquired(lock))
+        acquiring.cancel()
+        raise
+
+
+def _release_if_acquired(lock: asyncio.Lock) -> Callable[[asyncio.Future[bool]], None]:
+    def _callback(future: asyncio.Future[bool]) -> None:
+        if not future.cancelled() and future.exception() is None:
+            lock.release()
+
+    return _callback
+
 
 class WalletLockManager:
     def __init__(self) -> None:
@@ -13,7 +47,16 @@ class WalletLockManager:
         self,
         wallet_id: str,
         task_factory: Callable[[], Awaitable[dict[str, Any]]],
+        timeout: float | None = None,
     ) -> dict[str, Any]:
+        """``timeout`` 只约束等待锁的时间，超时抛出 ``asyncio.TimeoutError``（此时 task 未执行）"""
         lock = self._locks[wallet_id]
-        async with lock:
+        with tracing.span("lock_wait"):
+            if timeout is None:
+                await lock.acquire()
+            else:
+                await acquire_within(lock, timeout)
+        try:
             return await task_factory()
+        finally:
+            lock.release()
@@ -5,6 +5,7 @@ import time
 from typing import Any
 
 from .analyze_models import MarketSnapshot, TokenData
+from .deadline import Deadline
 from .runner import PolymarketSkillRunner
 from .settings import SkillSettings
 
@@ -16,12 +17,18 @@ class MarketCollector:
         self._settings = settings or SkillSettings.from_env()
         self._runner = PolymarketSkillRunner(settings=self._settings)
 
-    async def collect(self, query: str, market_limit: int = 5) -> MarketSnapshot:
+    async def collect(self, query: str, market_limit: int = 5, deadline: Deadline | None = None) -> MarketSnapshot:
+        """
+        采集市场快照
+
+        ``deadline`` 为整次采集的截止时间，传递给每个 action：到期后未完成的调用返回 ``DeadlineExceeded``
+        并记入 ``fetch_errors``，不再启动新的子进程。
+        """
         snapshot = MarketSnapshot(query=query)
         actions_called = 0
 
         # 阶段1：搜索市场列表
-        search_result = await self._runner.execute("markets_search", {"query": query, "limit": market_limit})
+        search_result = await self._runner.execute("markets_search", {"query": query, "limit": market_limit}, deadline=deadline)
         actions_called += 1
 
         markets: list[dict[str, Any]] = []
@@ -43,7 +50,7 @@ class MarketCollector:
             all_token_ids.extend(str(t) for t in token_ids if t)
 
         if all_token_ids:
-            token_tasks = [self._collect_token(tid) for tid in all_token_ids]
+            token_tasks = [self._collect_token(tid, deadline) for tid in all_token_ids]
             token_results = await asyncio.gather(*token_tasks, return_exceptions=True)
             actions_called += len(all_token_ids) * 4  # midpoint/spread/book/history
 
@@ -57,7 +64,7 @@ class MarketCollector:
 
         # 阶段3（可选）：采集相关事件
         try:
-            events_result = await self._runner.execute("events_list", {})
+            events_result = await self._runner.execute("events_list", {}, deadline=deadline)
             actions_called += 1
             if events_result.get("ok"):
                 raw_events = events_result.get("data") or {}
@@ -72,14 +79,14 @@ class MarketCollector:
         snapshot.actions_called = actions_called
         return snapshot
 
-    async def _collect_token(self, token_id: str) -> tuple[TokenData, list[str]]:
+    async def _collect_token(self, token_id: str, deadline: Deadline | None = None) -> tuple[TokenData, list[str]]:
         """并行采集单个 token 的 midpoint/spread/book/history"""
         td = TokenData(token_id=token_id)
         errors: list[str] = []
 
         async def _safe(action: str, params: dict[str, Any]) -> Any:
             try:
-                result = await self._runner.execute(action, params)
+                result = await self._runner.execute(action, params, deadline=deadline)
                 if result.get("ok"):
                     return result.get("data")
                 errors.append(f"{action}({token_id}): {(result.get('error') or {}).get('message', '失败')}")
@@ -0,0 +1,242 @@
+"""
+进程内指标：计数器与固定分桶直方图，可导出为 JSON 快照或 Prometheus 文本格式
+
+更新只在事件循环线程中进行（无锁，单次更新为几次字典操作）；supervisor 模式下由
+supervisor 汇总各 worker 的快照。
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from bisect import bisect_left
+from typing import Any, Awaitable, Callable
+
+# 直方图分桶上界（毫秒），最后隐含 +Inf
+BUCKETS_MS: tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+DESCRIPTIONS: dict[str, str] = {
+    "skill_call_total": "action 调用次数（按 action 与结果）",
+    "skill_call_error_total": "action 调用错误次数（按 action 与 error type）",
+    "skill_call_duration_ms": "action 端到端耗时（毫秒）",
+    "skill_timeout_total": "action 超时次数",
+    "skill_trade_blocked_total": "写操作被门控拦截次数（按原因）",
+    "skill_exec_total": "执行后端调用次数（按后端、API 分组与结果）",
+    "skill_exec_error_total": "执行后端错误次数（按后端与 error type）",
+    "skill_exec_duration_ms": "子进程 / HTTP 执行耗时（毫秒）",
+    "skill_queue_wait_ms": "等待子进程槽位的时间（毫秒）",
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS_MS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class MetricsRegistry:
+    """按名称与标签组织的计数器与直方图"""
+
+    def __init__(self) -> None:
+        self._counters: dict[str, dict[Labels, float]] = {}
+        self._histograms: dict[str, dict[Labels, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        series = self._counters.get(name)
+        if series is None:
+            series = self._counters[name] = {}
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        series = self._histograms.get(name)
+        if series is None:
+            series = self._histograms[name] = {}
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = _Histogram()
+        histogram.observe(value)
+
+    def value(self, name: str, **labels: str) -> float:
+        return self._counters.get(name, {}).get(tuple(sorted(labels.items())), 0)
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._histograms.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON 可序列化的快照；直方图附带由分桶估算的 p50/p95/p99"""
+        return {
+            "bucket_bounds_ms": list(BUCKETS_MS),
+            "counters": {
+                name: [{"labels": dict(key), "value": value} for key, value in sorted(series.items())]
+                for name, series in sorted(self._counters.items())
+            },
+            "histograms": {
+                name: [
+                    _summarize({"labels": dict(key), "count": h.count, "sum": h.sum, "buckets": list(h.counts)})
+                    for key, h in sorted(series.items())
+                ]
+                for name, series in sorted(self._histograms.items())
+            },
+        }
+
+
+# 进程内共享（与 scheduler / rate limiter 一样，同一进程的多个 runner 与 executor 共用）
+REGISTRY = MetricsRegistry()
+
+
+def quantile(buckets: list[int], count: int, q: float) -> float | None:
+    """按分桶线性插值估算分位数（毫秒），落在 +Inf 桶时返回最大上界"""
+    if count <= 0:
+        return None
+    rank = q * count
+    seen = 0
+    for index, bucket in enumerate(buckets):
+        if bucket and seen + bucket >= rank:
+            if index >= len(BUCKETS_MS):
+                return BUCKETS_MS[-1]
+            low = BUCKETS_MS[index - 1] if index > 0 else 0.0
+            high = BUCKETS_MS[index]
+            return round(low + (high - low) * (rank - seen) / bucket, 3)
+        seen += bucket
+    return BUCKETS_MS[-1]
+
+
+def _summarize(entry: dict[str, Any]) -> dict[str, Any]:
+    for name, q in (("p50", 0.5), ("p95", 0.95), ("p99", 0.99)):
+        entry[name] = quantile(entry["buckets"], entry["count"], q)
+    return entry
+
+
+def merge_snapshots(snapshots: list[dict[str, Any]]) -> dict[str, Any]:
+    """合并多个进程的快照：计数器与分桶按标签相加，分位数重新估算"""
+    counters: dict[str, dict[Labels, float]] = {}
+    histograms: dict[str, dict[Labels, dict[str, Any]]] = {}
+    for snapshot in snapshots:
+        for name, entries in snapshot.get("counters", {}).items():
+            series = counters.setdefault(name, {})
+            for entry in entries:
+                key = tuple(sorted(entry["labels"].items()))
+                series[key] = series.get(key, 0) + entry["value"]
+        for name, entries in snapshot.get("histograms", {}).items():
+            merged = histograms.setdefault(name, {})
+            for entry in entries:
+                key = tuple(sorted(entry["labels"].items()))
+                target = merged.get(key)
+                if target is None:
+                    merged[key] = {
+                        "labels": dict(entry["labels"]),
+                        "count": entry["count"],
+                        "sum": entry["sum"],
+                        "buckets": list(entry["buckets"]),
+                    }
+                else:
+                    target["count"] += entry["count"]
+                    target["sum"] += entry["sum"]
+                    target["buckets"] = [a + b for a, b in zip(target["buckets"], entry["buckets"])]
+    return {
+        "bucket_bounds_ms": list(BUCKETS_MS),
+        "counters": {
+            name: [{"labels": dict(key), "value": value} for key, value in sorted(series.items())]
+            for name, series in sorted(counters.items())
+        },
+        "histograms": {
+            name: [_summarize(entry) for _, entry in sorted(series.items())]
+            for name, series in sorted(histograms.items())
+        },
+    }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str], extra: str = "") -> str:
+    parts = [f'{key}="{_escape(str(value))}"' for key, value in sorted(labels.items())]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def render_prometheus(snapshot: dict[str, Any]) -> str:
+    """渲染为 Prometheus 文本格式（textfile collector 可直接读取）"""
+    lines: list[str] = []
+    for name, entries in snapshot.get("counters", {}).items():
+        lines.append(f"# HELP {name} {DESCRIPTIONS.get(name, name)}")
+        lines.append(f"# TYPE {name} counter")
+        for entry in entries:
+            lines.append(f"{name}{_labels(entry['labels'])} {_number(entry['value'])}")
+    bounds = snapshot.get("bucket_bounds_ms", list(BUCKETS_MS))
+    for name, entries in snapshot.get("histograms", {}).items():
+        lines.append(f"# HELP {name} {DESCRIPTIONS.get(name, name)}")
+        lines.append(f"# TYPE {name} histogram")
+        for entry in entries:
+            cumulative = 0
+            for bound, bucket in zip([*bounds, None], entry["buckets"]):
+                cumulative += bucket
+                le = 'le="+Inf"' if bound is None else f'le="{_number(bound)}"'
+                lines.append(f"{name}_bucket{_labels(entry['labels'], le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(entry['labels'])} {_number(entry['sum'])}")
+            lines.append(f"{name}_count{_labels(entry['labels'])} {entry['count']}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def write_textfile(path: str, text: str) -> None:
+    """原子写入（同目录临时文件 + rename），collector 不会读到半个文件"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".metrics-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def start_textfile_writer(path: str, interval: float, render: Callable[[], Awaitable[str]]) -> asyncio.Task[None] | None:
+    """未配置 ``path`` 时返回 None"""
+    if not path:
+        return None
+    return asyncio.create_task(run_textfile_writer(path, max(0.1, interval), render))
+
+
+async def stop_textfile_writer(task: asyncio.Task[None] | None) -> None:
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
+async def run_textfile_writer(path: str, interval: float, render: Callable[[], Awaitable[str]]) -> None:
+    """每 ``interval`` 秒写一次 textfile，被取消时再写最后一次"""
+    try:
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(write_textfile, path, await render())
+    except asyncio.CancelledError:
+        try:
+            write_textfile(path, await render())
+        except Exception:
+            pass
+        raise
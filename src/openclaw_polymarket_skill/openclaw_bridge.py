@@ -2,10 +2,23 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Any, Callable, Protocol
 
-from .actions import ACTION_REGISTRY
+from .actions import ACTION_REGISTRY, action_list
+from .daemon_client import default_socket_path
+from .deadline import Deadline
+from .locks import wallet_key
+from .metrics import render_prometheus, start_textfile_writer, stop_textfile_writer
+from .rawjson import dumps_line
 from .runner import PolymarketSkillRunner
+from .settings import SkillSettings
+
+MAX_LINE_BYTES = 16 * 1024 * 1024
 
 
 def _error_response(request_id: str | int | None, code: str, message: str) -> dict[str, Any]:
@@ -19,25 +32,34 @@ def _error_response(request_id: str | int | None, code: str, message: str) -> di
     }
 
 
-async def handle_request(runner: PolymarketSkillRunner, request: dict[str, Any]) -> dict[str, Any]:
+async def handle_request(
+    runner: PolymarketSkillRunner,
+    request: dict[str, Any],
+    passthrough: bool = False,
+    received_at: float | None = None,
+) -> dict[str, Any]:
+    """
+    处理单个请求；``passthrough=True`` 时结果中的 CLI 输出可能是未解析的 ``RawJson``
+
+    ``context.deadline_ms`` 从 ``received_at``（请求读入时刻，默认为当前）起算，排队等待同样消耗预算。
+    """
     request_id = request.get("id")
     method = request.get("method", "execute")
 
     if method == "list_actions":
-        actions = [
-            {
-                "name": spec.name,
-                "category": spec.category.value,
-                "required_params": list(spec.required_params),
-            }
-            for spec in ACTION_REGISTRY.values()
-        ]
-        return {"id": request_id, "ok": True, "result": {"actions": actions}}
+        return {"id": request_id, "ok": True, "result": {"actions": action_list()}}
 
     if method == "healthcheck":
         result = await runner.healthcheck()
         return {"id": request_id, "ok": bool(result.get("ok")), "result": result}
 
+    if method == "metrics":
+        return {"id": request_id, "ok": True, "result": metrics_result(runner.metrics.snapshot(), request.get("format"))}
+
+    options: dict[str, Any] = {"passthrough": True} if passthrough else {}
+    if method == "execute_batch":
+        return await _handle_batch(runner, request, options, received_at)
+
     if method != "execute":
         return _error_response(request_id, "UnsupportedMethod", f"不支持的方法: {method}")
 
@@ -51,43 +73,414 @@ async def handle_request(runner: PolymarketSkillRunner, request: dict[str, Any])
         return _error_response(request_id, "ValidationError", "params 必须是 JSON 对象")
     if context is not None and not isinstance(context, dict):
         return _error_response(request_id, "ValidationError", "context 必须是 JSON 对象")
+    try:
+        deadline = Deadline.from_context(context or {}, received_at)
+    except ValueError as exc:
+        return _error_response(request_id, "ValidationError", str(exc))
+    if deadline is not None:
+        options["deadline"] = deadline
 
-    result = await runner.execute(action=str(action), params=params or {}, context=context or {})
+    result = await runner.execute(
+        action=str(action),
+        params=params or {},
+        context=context or {},
+        **options,
+    )
     return {"id": request_id, "ok": bool(result.get("ok")), "result": result}
 
 
-async def serve_stdio() -> None:
-    runner = PolymarketSkillRunner()
-    loop = asyncio.get_event_loop()
+async def _handle_batch(
+    runner: PolymarketSkillRunner,
+    request: dict[str, Any],
+    options: dict[str, Any],
+    received_at: float | None = None,
+) -> dict[str, Any]:
+    request_id = request.get("id")
+    items = request.get("items")
+    if not isinstance(items, list) or not items:
+        return _error_response(request_id, "ValidationError", "items 必须是非空 JSON 数组")
+    max_items = runner.settings.batch_max_items
+    if len(items) > max_items:
+        return _error_response(request_id, "ValidationError", f"items 数量不能超过 {max_items}")
+    for item in items:
+        if not isinstance(item, dict) or not item.get("action"):
+            return _error_response(request_id, "ValidationError", "items 中每一项必须是包含 action 的 JSON 对象")
+        if item.get("params") is not None and not isinstance(item["params"], dict):
+            return _error_response(request_id, "ValidationError", "items[].params 必须是 JSON 对象")
+
+    context = request.get("context")
+    if context is not None and not isinstance(context, dict):
+        return _error_response(request_id, "ValidationError", "context 必须是 JSON 对象")
+    try:
+        deadline = Deadline.from_context(context or {}, received_at)
+    except ValueError as exc:
+        return _error_response(request_id, "ValidationError", str(exc))
+    if deadline is not None:
+        options = {**options, "deadline": deadline}
+
+    max_concurrency = request.get("max_concurrency")
+    deadline_ms = request.get("deadline_ms")
+    for name, value in (("max_concurrency", max_concurrency), ("deadline_ms", deadline_ms)):
+        if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value <= 0):
+            return _error_response(request_id, "ValidationError", f"{name} 必须是正整数")
+
+    result = await runner.execute_batch(
+        items,
+        context=context or {},
+        max_concurrency=max_concurrency,
+        deadline_seconds=deadline_ms / 1000 if deadline_ms else None,
+        **options,
+    )
+    return {"id": request_id, "ok": bool(result.get("ok")), "result": result}
+
+
+def _parse_line(payload: str) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """解析一行请求，返回 (request, error_response)，二者恰有一个非空"""
+    try:
+        request = json.loads(payload)
+    except json.JSONDecodeError:
+        return None, _error_response(None, "InvalidJson", "输入不是合法 JSON")
+    if not isinstance(request, dict):
+        return None, _error_response(None, "ValidationError", "请求必须是 JSON 对象")
+    return request, None
+
+
+def _write_wallet(request: dict[str, Any]) -> str | None:
+    """写操作请求返回其钱包键，其余返回 None"""
+    if request.get("method", "execute") != "execute":
+        return None
+    spec = ACTION_REGISTRY.get(str(request.get("action")))
+    if spec is None or not spec.is_write:
+        return None
+    context = request.get("context")
+    return wallet_key(context if isinstance(context, dict) else {})
+
+
+class RequestDispatcher:
+    """
+    并发分发 bridge 请求
+
+    - 每个请求作为独立 task 执行，响应按完成顺序输出（调用方以 id 关联）
+    - ``max_in_flight`` 限制同时处理的请求数，达到上限时 submit 阻塞（反压读取端）
+    - 同一钱包的写操作按到达顺序串行进入 runner，runner 内仍由 WalletLockManager 加锁
+    """
+
+    def __init__(
+        self,
+        runner: PolymarketSkillRunner,
+        emit: Callable[[dict[str, Any]], Any],
+        max_in_flight: int = 32,
+        passthrough: bool = False,
+    ) -> None:
+        self._runner = runner
+        self._emit = emit
+        self._passthrough = passthrough
+        self._slots = asyncio.Semaphore(max(1, max_in_flight))
+        self._pending: set[asyncio.Task[None]] = set()
+        self._wallet_tails: dict[str, asyncio.Task[None]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, request: dict[str, Any]) -> None:
+        received_at = time.monotonic()
+        await self._slots.acquire()
+        previous: asyncio.Task[None] | None = None
+        wallet_id = _write_wallet(request)
+        if wallet_id is not None:
+            previous = self._wallet_tails.get(wallet_id)
+
+        task = asyncio.create_task(self._process(request, previous, received_at))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+        if wallet_id is not None:
+            self._wallet_tails[wallet_id] = task
+            task.add_done_callback(lambda t, key=wallet_id: self._release_tail(key, t))
+
+    async def drain(self) -> None:
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def _release_tail(self, wallet_id: str, task: asyncio.Task[None]) -> None:
+        if self._wallet_tails.get(wallet_id) is task:
+            del self._wallet_tails[wallet_id]
+
+    async def _process(
+        self,
+        request: dict[str, Any],
+        previous: asyncio.Task[None] | None,
+        received_at: float | None = None,
+    ) -> None:
+        try:
+            if previous is not None:
+                # 只等待前序写请求完成，不关心其结果
+                await asyncio.wait([previous])
+            try:
+                response = await handle_request(self._runner, request, self._passthrough, received_at)
+            except Exception as exc:  # noqa: BLE001
+                response = _error_response(request.get("id"), "InternalError", f"处理请求异常: {exc}")
+            result = self._emit(response)
+            if asyncio.iscoroutine(result):
+                await result
+        finally:
+            self._slots.release()
+
+
+class LineWriter:
+    """
+    合并 flush 的 json-per-line 输出端
+
+    同一轮事件循环内完成的多个响应会被拼接成一次 write，
+    缓冲超过 ``high_water`` 字节时由 ``drain()`` 等待底层传输排空。
+    响应中的 ``RawJson`` 以原始字节拼接输出，不再重新序列化。
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter, high_water: int = 256 * 1024) -> None:
+        self._writer = writer
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._high_water = high_water
+        self._flush_scheduled = False
+
+    def write(self, response: dict[str, Any] | bytes) -> None:
+        """写入一个响应；``bytes`` 视为已编码好的完整响应行"""
+        line = response if isinstance(response, bytes) else dumps_line(response)
+        self._buffer.append(line)
+        self._buffered += len(line)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._flush_scheduled = False
+        if not self._buffer or self._writer.is_closing():
+            self._buffer.clear()
+            self._buffered = 0
+            return
+        self._writer.write(b"".join(self._buffer))
+        self._buffer.clear()
+        self._buffered = 0
+
+    async def drain(self) -> None:
+        self._flush()
+        if not self._writer.is_closing():
+            await self._writer.drain()
+
+    async def emit(self, response: dict[str, Any] | bytes) -> None:
+        self.write(response)
+        if self._buffered >= self._high_water:
+            await self.drain()
+
+
+async def _open_stdio_streams(limit: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """把 stdin/stdout 包装为 asyncio 流；stdin 为普通文件时退化为线程读取"""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=limit)
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except ValueError:
+        loop.create_task(_feed_from_file(reader, sys.stdin.buffer))
+
+    try:
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+    except ValueError:
+        transport, protocol = _FileWriteTransport(sys.stdout.buffer), asyncio.streams.FlowControlMixin()
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)  # type: ignore[arg-type]
+    return reader, writer
+
+
+async def _feed_from_file(reader: asyncio.StreamReader, stream: Any) -> None:
+    loop = asyncio.get_running_loop()
     while True:
-        line = await loop.run_in_executor(None, input)
-        if line is None:
-            break
-        payload = line.strip()
-        if not payload:
-            continue
+        chunk = await loop.run_in_executor(None, stream.read1, 65536)
+        if not chunk:
+            reader.feed_eof()
+            return
+        reader.feed_data(chunk)
+
+
+class _FileWriteTransport(asyncio.WriteTransport):
+    """stdout 被重定向到普通文件时使用的同步写传输"""
+
+    def __init__(self, stream: Any) -> None:
+        super().__init__()
+        self._stream = stream
+        self._closing = False
+
+    def write(self, data: bytes) -> None:  # type: ignore[override]
+        self._stream.write(data)
+        self._stream.flush()
+
+    def is_closing(self) -> bool:
+        return self._closing
+
+    def close(self) -> None:
+        self._closing = True
+
+    def get_write_buffer_size(self) -> int:
+        return 0
+
+
+def metrics_result(snapshot: dict[str, Any], fmt: Any) -> dict[str, Any]:
+    """``metrics`` 方法的结果：默认为 JSON 快照，``format=prometheus`` 时为文本格式"""
+    if fmt == "prometheus":
+        return {"format": "prometheus", "text": render_prometheus(snapshot)}
+    return snapshot
+
+
+def _metrics_writer(settings: SkillSettings, runner: PolymarketSkillRunner) -> asyncio.Task[None] | None:
+    async def _render() -> str:
+        return render_prometheus(runner.metrics.snapshot())
+
+    return start_textfile_writer(settings.metrics_textfile_path, settings.metrics_textfile_interval_seconds, _render)
+
+
+class Dispatcher(Protocol):
+    async def submit(self, request: dict[str, Any]) -> None: ...
+
+    async def drain(self) -> None: ...
+
+
+async def serve_streams(
+    runner: PolymarketSkillRunner,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    max_in_flight: int = 32,
+    passthrough: bool = False,
+) -> None:
+    """在一对 asyncio 流上运行 json-per-line 协议，EOF 后等待在途请求全部响应"""
+    output = LineWriter(writer)
+    dispatcher = RequestDispatcher(runner, emit=output.emit, max_in_flight=max_in_flight, passthrough=passthrough)
+    await serve_requests(reader, output, dispatcher)
 
+
+async def _discard_line(reader: asyncio.StreamReader) -> None:
+    """丢弃输入直到（包括）下一个换行符或 EOF"""
+    while True:
         try:
-            request = json.loads(payload)
-        except json.JSONDecodeError:
-            print(
-                json.dumps(
-                    _error_response(None, "InvalidJson", "输入不是合法 JSON"),
-                    ensure_ascii=False,
-                ),
-                flush=True,
-            )
-            continue
-
-        if not isinstance(request, dict):
-            print(
-                json.dumps(
-                    _error_response(None, "ValidationError", "请求必须是 JSON 对象"),
-                    ensure_ascii=False,
-                ),
-                flush=True,
-            )
-            continue
-
-        response = await handle_request(runner, request)
-        print(json.dumps(response, ensure_ascii=False), flush=True)
+            await reader.readuntil(b"\n")
+            return
+        except asyncio.LimitOverrunError as exc:
+            await reader.readexactly(exc.consumed)
+        except asyncio.IncompleteReadError:
+            return
+
+
+async def serve_requests(reader: asyncio.StreamReader, output: LineWriter, dispatcher: Dispatcher) -> None:
+    """逐行读取请求交给 dispatcher，非法行直接输出错误响应；EOF 后等待 dispatcher 排空"""
+    try:
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as exc:
+                # EOF：最后一行可以没有换行符
+                line = exc.partial
+            except asyncio.LimitOverrunError:
+                # 单行超过 reader limit：丢弃到下一个换行符为止，剩余部分不能被当作新请求解析
+                await _discard_line(reader)
+                await output.emit(_error_response(None, "ValidationError", "请求行过长"))
+                continue
+            if not line:
+                break
+            payload = line.decode("utf-8", errors="replace").strip()
+            if not payload:
+                continue
+
+            request, error = _parse_line(payload)
+            if request is None:
+                await output.emit(error or {})
+                continue
+
+            await dispatcher.submit(request)
+
+        await dispatcher.drain()
+    finally:
+        await output.drain()
+
+
+async def serve_stdio() -> None:
+    settings = SkillSettings.from_env()
+    runner = PolymarketSkillRunner(settings=settings)
+    reader, writer = await _open_stdio_streams(limit=MAX_LINE_BYTES)
+    metrics_writer = _metrics_writer(settings, runner)
+    try:
+        await serve_streams(
+            runner,
+            reader,
+            writer,
+            max_in_flight=settings.bridge_max_in_flight,
+            passthrough=settings.bridge_passthrough,
+        )
+    finally:
+        await stop_textfile_writer(metrics_writer)
+
+
+async def start_socket_server(
+    runner: PolymarketSkillRunner,
+    path: str,
+    max_in_flight: int = 32,
+    passthrough: bool = False,
+) -> asyncio.AbstractServer:
+    """
+    在 Unix domain socket 上监听 bridge 协议
+
+    每个连接独立运行 ``serve_streams``，所有连接共享同一个 runner（缓存、版本检查、调度器）。
+    遗留的 socket 文件（daemon 异常退出）会被清理；已有 daemon 在监听时抛出 RuntimeError。
+    """
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)
+        else:
+            raise RuntimeError(f"已有 daemon 在监听 {path}")
+        finally:
+            probe.close()
+
+    async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await serve_streams(runner, reader, writer, max_in_flight=max_in_flight, passthrough=passthrough)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # 在 0177 umask 下同步 bind：socket 文件从创建起就是 0600，不存在其他用户可连接的窗口
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    previous = os.umask(0o177)
+    try:
+        listener.bind(path)
+    except BaseException:
+        listener.close()
+        raise
+    finally:
+        os.umask(previous)
+    return await asyncio.start_unix_server(_handle, sock=listener, limit=MAX_LINE_BYTES)
+
+
+async def serve_socket(path: str | None = None) -> None:
+    settings = SkillSettings.from_env()
+    runner = PolymarketSkillRunner(settings=settings)
+    socket_path = path or default_socket_path(settings)
+    server = await start_socket_server(
+        runner,
+        socket_path,
+        max_in_flight=settings.bridge_max_in_flight,
+        passthrough=settings.bridge_passthrough,
+    )
+    # SIGTERM 时正常退出，确保删除 socket 文件
+    current = asyncio.current_task()
+    if current is not None:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, current.cancel)
+    metrics_writer = _metrics_writer(settings, runner)
+    try:
+        async with server:
+            await server.serve_forever()
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await stop_textfile_writer(metrics_writer)
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
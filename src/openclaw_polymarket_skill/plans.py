@@ -0,0 +1,235 @@
+"""
+按 action 预编译的参数校验与 argv 计划
+
+``actions.py`` 以 argv 模板声明每个 action 读取哪些参数，导入时结合 ``validators.PARAM_RULES``
+与 ``action_schemas.json`` 为每个 action 编译一份 ``ActionPlan``：单请求与批量路径都直接复用，
+请求时只需按参数名查一次字典，不再逐条比较所有规则。
+"""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .models import ActionSpec
+from .validators import PARAM_RULES, ParamCheck, schema_checks
+
+SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "action_schemas.json")
+
+
+@dataclass(frozen=True)
+class Arg:
+    """位置参数（必填）"""
+
+    key: str
+
+
+@dataclass(frozen=True)
+class Opt:
+    """``flag value``；有默认值时总是输出，否则仅在参数存在且非 None 时输出"""
+
+    key: str
+    flag: str
+    default: Any = None
+
+
+@dataclass(frozen=True)
+class BoolOpt:
+    """``flag true|false``，仅在参数存在且非 None 时输出"""
+
+    key: str
+    flag: str
+
+
+@dataclass(frozen=True)
+class Flag:
+    """参数严格为 True 时输出的开关"""
+
+    key: str
+    flag: str
+
+
+Piece = Arg | Opt | BoolOpt | Flag
+
+
+class ArgvTemplate:
+    """
+    argv 模板
+
+    编译时拆成必填前缀（首个可选部分之前的固定字符串与 ``Arg``）与其余部分：
+    构建时复制前缀并填入位置参数，其余部分按预先拆好的 (类型, 参数名, flag, 默认值) 逐项判断。
+    """
+
+    def __init__(self, *items: str | Piece) -> None:
+        self.items = items
+        self.params = tuple(dict.fromkeys(item.key for item in items if not isinstance(item, str)))
+
+    def compile(self) -> Callable[[dict[str, Any]], list[str]]:
+        """
+        生成构建函数；函数带 ``params`` 属性（读取的参数名）与 ``values`` 属性
+        （参数名 → argv 中对应的字符串值，见 ``ArgvTemplate.values``）
+        """
+        split = next(
+            (index for index, item in enumerate(self.items) if not isinstance(item, (str, Arg))),
+            len(self.items),
+        )
+        # 必填前缀：固定字符串原样复制，Arg 所在位置按参数填入
+        head = [item if isinstance(item, str) else "" for item in self.items[:split]]
+        head_keys = tuple((index, item.key) for index, item in enumerate(self.items[:split]) if isinstance(item, Arg))
+        rest = tuple(_step(item) for item in self.items[split:])
+
+        def build(params: dict[str, Any]) -> list[str]:
+            args = head.copy()
+            for index, key in head_keys:
+                args[index] = str(params[key])
+            for kind, key, flag, default in rest:
+                if kind is _LITERAL:
+                    args.append(flag)
+                elif kind is _ARG:
+                    args.append(str(params[key]))
+                else:
+                    value = params.get(key)
+                    if kind is _OPT:
+                        if value is None:
+                            value = default
+                        if value is not None:
+                            args += (flag, str(value))
+                    elif kind is _BOOL:
+                        if value is not None:
+                            args += (flag, "true" if value else "false")
+                    elif value is True:
+                        args.append(flag)
+            return args
+
+        build.params = self.params  # type: ignore[attr-defined]
+        build.values = self.values  # type: ignore[attr-defined]
+        return build
+
+    def values(self, params: dict[str, Any]) -> dict[str, str]:
+        """
+        按参数名返回 argv 会携带的值（已套用默认值、布尔值写作 ``true`` / ``false``），未输出的参数不出现
+
+        供不经 argv 的执行后端（HTTP）使用：与 CLI 收到的参数一致，且不必从 argv 反向解析。
+        """
+        result: dict[str, str] = {}
+        for item in self.items:
+            if isinstance(item, str):
+                continue
+            value = params.get(item.key)
+            if isinstance(item, Arg):
+                result[item.key] = str(params[item.key])
+            elif isinstance(item, Opt):
+                if value is None:
+                    value = item.default
+                if value is not None:
+                    result[item.key] = str(value)
+            elif isinstance(item, BoolOpt):
+                if value is not None:
+                    result[item.key] = "true" if value else "false"
+            elif value is True:
+                result[item.key] = "true"
+        return result
+
+
+_LITERAL, _ARG, _OPT, _BOOL, _FLAG = "literal", "arg", "opt", "bool", "flag"
+
+
+def _step(item: str | Piece) -> tuple[str, str, str, Any]:
+    """可选部分（及其后的固定部分）拆成 (类型, 参数名, flag 或字面量, 默认值)"""
+    if isinstance(item, str):
+        return _LITERAL, "", item, None
+    if isinstance(item, Arg):
+        return _ARG, item.key, "", None
+    if isinstance(item, Opt):
+        return _OPT, item.key, item.flag, item.default
+    if isinstance(item, BoolOpt):
+        return _BOOL, item.key, item.flag, None
+    return _FLAG, item.key, item.flag, None
+
+
+def argv(*items: str | Piece) -> Callable[[dict[str, Any]], list[str]]:
+    """声明 argv 模板并编译为 ``ActionSpec.builder``"""
+    return ArgvTemplate(*items).compile()
+
+
+def _chain(checks: list[ParamCheck]) -> ParamCheck:
+    if len(checks) == 1:
+        return checks[0]
+
+    def _check(name: str, value: Any) -> str | None:
+        for check in checks:
+            error = check(name, value)
+            if error:
+                return error
+        return None
+
+    return _check
+
+
+class ActionPlan:
+    """单个 action 的预编译计划：必填参数、按参数名的校验函数与 argv 模板"""
+
+    __slots__ = ("spec", "required", "checks", "_lookup")
+
+    def __init__(self, spec: ActionSpec, required: tuple[str, ...], checks: dict[str, ParamCheck]) -> None:
+        self.spec = spec
+        self.required = required
+        # 该 action 读取的参数及其校验函数
+        self.checks = checks
+        # 模板未使用的参数不会进入 argv，仍按全局规则校验以保持既有行为
+        self._lookup = {**PARAM_RULES, **checks}
+
+    def validate(self, payload: dict[str, Any]) -> str | None:
+        for key in self.required:
+            if payload.get(key) is None:
+                return f"缺少必填参数: {key}"
+        lookup = self._lookup
+        for key, value in payload.items():
+            check = lookup.get(key)
+            if check is not None and value is not None:
+                error = check(key, value)
+                if error:
+                    return error
+        return None
+
+    def build(self, payload: dict[str, Any]) -> list[str]:
+        return self.spec.builder(payload)
+
+    def values(self, payload: dict[str, Any]) -> dict[str, str]:
+        """argv 模板对应的参数值（见 ``ArgvTemplate.values``）"""
+        return self.spec.builder.values(payload)  # type: ignore[attr-defined]
+
+
+def load_schemas(path: str = SCHEMA_PATH) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compile_plan(spec: ActionSpec, schema: dict[str, Any] | None = None) -> ActionPlan:
+    """
+    编译单个 action 的计划
+
+    参数集合 = argv 模板读取的参数 ∪ schema 声明的属性；每个参数的校验函数由
+    ``PARAM_RULES`` 中的同名规则与 schema 约束组合而成，没有任何约束的参数不出现在计划中。
+    """
+    template_params: tuple[str, ...] = getattr(spec.builder, "params", ())
+    properties: dict[str, Any] = (schema or {}).get("properties", {})
+    required = tuple(dict.fromkeys((*spec.required_params, *(schema or {}).get("required", ()))))
+
+    checks: dict[str, ParamCheck] = {}
+    for name in dict.fromkeys((*template_params, *required, *properties)):
+        rule = PARAM_RULES.get(name)
+        combined = [rule] if rule is not None else []
+        combined.extend(schema_checks(name, properties.get(name, {}), has_rule=rule is not None))
+        if combined:
+            checks[name] = _chain(combined)
+    return ActionPlan(spec=spec, required=required, checks=checks)
+
+
+def compile_plans(registry: dict[str, ActionSpec], schemas: dict[str, Any] | None = None) -> dict[str, ActionPlan]:
+    schemas = load_schemas() if schemas is None else schemas
+    unknown = sorted(set(schemas) - set(registry))
+    if unknown:
+        raise ValueError(f"action_schemas.json 中存在未注册的 action: {', '.join(unknown)}")
+    return {name: compile_plan(spec, schemas.get(name)) for name, spec in registry.items()}
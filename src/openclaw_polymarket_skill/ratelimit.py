@@ -0,0 +1,191 @@
+"""
+按上游 API 分组的客户端限流：gamma（markets_* / events_*）、clob（clob_*）、data（data_*）
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Callable
+
+from .scheduler import Priority
+from .settings import SkillSettings
+
+# 每秒请求数；突发容量等于一秒的配额
+DEFAULT_RATES: dict[str, float] = {
+    "gamma": 30.0,
+    "clob": 50.0,
+    "data": 20.0,
+}
+
+MAX_BACKOFF_SECONDS = 30.0
+
+_FAMILIES = {
+    "markets": "gamma",
+    "events": "gamma",
+    "clob": "clob",
+    "data": "data",
+}
+
+
+def family_for(cli_args: list[str]) -> str | None:
+    """按 CLI 子命令归类到上游 API 分组，无法识别时返回 None（不限流）"""
+    return _FAMILIES.get(cli_args[0]) if cli_args else None
+
+
+class TokenBucket:
+    """
+    令牌桶（GCRA 形式）：只维护"理论到达时间"，取令牌为 O(1)
+
+    - 取令牌时直接预约一个发送时刻，调用方只 ``sleep`` 一次，不轮询
+    - 观察到上游 ``RateLimitError`` 时暂停整个分组 ``backoff`` 秒并清空突发额度，
+      连续触发时退避时间翻倍（上限 ``MAX_BACKOFF_SECONDS``），任一请求成功后复位
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        backoff_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.interval = 1.0 / rate
+        self.burst = max(1.0, burst if burst is not None else rate)
+        self.backoff_seconds = backoff_seconds
+        self._clock = clock
+        self._tolerance = (self.burst - 1) * self.interval
+        self._tat = clock()
+        self._paused_until = 0.0
+        self._strikes = 0
+        self.acquired = 0
+        self.waited = 0
+        self.wait_seconds = 0.0
+        self.rejected = 0
+        self.limited = 0
+
+    def reserve(self, max_wait: float | None = None, wait: bool = True) -> float | None:
+        """
+        预约一个令牌，返回需要等待的秒数
+
+        ``wait=False``（写操作/撤单）时不等待，直接透支后续额度；预计等待超过 ``max_wait`` 时不预约，返回 None。
+        """
+        now = self._clock()
+        start = max(now, self._tat - self._tolerance)
+        delay = start - now if wait else 0.0
+        if max_wait is not None and delay > max_wait:
+            self.rejected += 1
+            return None
+        self._tat = max(self._tat, now if not wait else start) + self.interval
+        self.acquired += 1
+        if delay > 0:
+            self.waited += 1
+            self.wait_seconds += delay
+        return delay
+
+    def saturated(self) -> bool:
+        """下一个读请求需要等待（突发额度已用完或处于退避中）"""
+        return self._tat - self._tolerance > self._clock()
+
+    def refund(self) -> None:
+        """预约后未发送（等待中被取消）时归还令牌"""
+        self._tat -= self.interval
+
+    def penalize(self, retry_after: float | None = None) -> None:
+        now = self._clock()
+        self.limited += 1
+        if now < self._paused_until:
+            # 同一波并发请求一起失败，只计一次
+            return
+        backoff = min(self.backoff_seconds * (2 ** self._strikes), MAX_BACKOFF_SECONDS)
+        if retry_after is not None:
+            backoff = max(backoff, min(retry_after, MAX_BACKOFF_SECONDS))
+        self._strikes += 1
+        self._paused_until = now + backoff
+        # 暂停结束后从空桶开始，按速率逐个放行，避免恢复瞬间再次触发限流
+        self._tat = max(self._tat, self._paused_until + self._tolerance)
+
+    def succeed(self) -> None:
+        self._strikes = 0
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "wait_ms_total": int(self.wait_seconds * 1000),
+            "rejected": self.rejected,
+            "limited": self.limited,
+            "backoff_remaining_ms": max(0, int((self._paused_until - self._clock()) * 1000)),
+        }
+
+
+class RateLimiter:
+    """按 API 分组的令牌桶集合，由 ``PolymarketExecutor`` / ``HttpExecutor`` 在占用子进程槽位前调用"""
+
+    def __init__(
+        self,
+        rates: dict[str, float] | None = None,
+        backoff_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        merged = {**DEFAULT_RATES, **(rates or {})}
+        self.buckets = {
+            family: TokenBucket(rate, backoff_seconds=backoff_seconds, clock=clock)
+            for family, rate in merged.items()
+            if rate > 0
+        }
+
+    async def acquire(
+        self,
+        cli_args: list[str],
+        priority: Priority = Priority.READ,
+        max_wait: float | None = None,
+    ) -> float | None:
+        """
+        等待发送许可，返回等待秒数；预计等待超过 ``max_wait`` 时立即返回 None
+
+        撤单与写操作不排队等待（仍计入配额），避免被批量读阻塞。
+        """
+        bucket = self.buckets.get(family_for(cli_args) or "")
+        if bucket is None:
+            return 0.0
+        delay = bucket.reserve(max_wait=max_wait, wait=priority > Priority.WRITE)
+        if delay:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                bucket.refund()
+                raise
+        return delay
+
+    def saturated(self, cli_args: list[str]) -> bool:
+        bucket = self.buckets.get(family_for(cli_args) or "")
+        return bucket is not None and bucket.saturated()
+
+    def observe(self, cli_args: list[str], error: dict[str, Any] | None, retry_after: float | None = None) -> None:
+        """根据执行结果调整：``RateLimitError`` 触发退避，成功复位退避计数"""
+        bucket = self.buckets.get(family_for(cli_args) or "")
+        if bucket is None:
+            return
+        if error is None:
+            bucket.succeed()
+        elif error.get("type") == "RateLimitError":
+            bucket.penalize(retry_after)
+
+    def stats(self) -> dict[str, Any]:
+        return {family: bucket.stats() for family, bucket in self.buckets.items()}
+
+
+_SHARED: dict[tuple[Any, ...], RateLimiter] = {}
+
+
+def shared_rate_limiter(settings: SkillSettings) -> RateLimiter | None:
+    """进程内共享的限流器（按配置复用），``rate_limit_enabled=False`` 时返回 None"""
+    if not settings.rate_limit_enabled:
+        return None
+    key = (tuple(sorted(settings.rate_limits.items())), settings.rate_limit_backoff_seconds)
+    limiter = _SHARED.get(key)
+    if limiter is None:
+        limiter = _SHARED[key] = RateLimiter(settings.rate_limits, settings.rate_limit_backoff_seconds)
+    return limiter
@@ -0,0 +1,102 @@
+"""
+CLI / HTTP 原始 JSON 输出的零拷贝透传
+"""
+from __future__ import annotations
+
+import json
+import secrets
+from typing import Any
+
+_CLOSERS = {ord("{"): ord("}"), ord("["): ord("]")}
+
+
+class RawJson:
+    """
+    未解析的 JSON 文本（UTF-8 字节）
+
+    ``from_output`` 在捕获输出时完整校验一次，之后 bridge 输出时由 ``dumps_line`` 把原始字节
+    直接拼进响应行（省去重新序列化），缓存也直接保存这段文本；需要解析结果时调用 ``loads()``，
+    每次返回独立对象。直接构造时调用方需保证内容是合法 JSON（如来自已校验的缓存条目）。
+    """
+
+    __slots__ = ("raw",)
+
+    def __init__(self, raw: bytes | str) -> None:
+        self.raw = raw.encode("utf-8") if isinstance(raw, str) else raw
+
+    @classmethod
+    def from_output(cls, output: bytes) -> RawJson | None:
+        """
+        输出是合法的 JSON 对象或数组时返回 RawJson，否则返回 None（交给常规解析 / ``raw_text`` 路径）
+
+        只看首尾括号不够：括号匹配但内容非法的输出会被原样拼进响应行，并写入缓存。
+        """
+        output = output.strip()
+        if len(output) < 2 or _CLOSERS.get(output[0]) != output[-1]:
+            return None
+        try:
+            json.loads(output)
+        except ValueError:
+            # 含 JSONDecodeError 与非法 UTF-8 的 UnicodeDecodeError
+            return None
+        return cls(output)
+
+    def loads(self) -> Any:
+        return json.loads(self.raw)
+
+    def text(self) -> str:
+        return self.raw.decode("utf-8", errors="ignore")
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJson) and other.raw == self.raw
+
+    def __hash__(self) -> int:
+        return hash(self.raw)
+
+    def __copy__(self) -> RawJson:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> RawJson:
+        # 不可变，合并请求的各等待方可共享同一实例
+        return self
+
+    def __repr__(self) -> str:
+        return f"RawJson({len(self.raw)} bytes)"
+
+
+def materialize(data: Any) -> Any:
+    """把 RawJson 还原为解析后的对象，其余值原样返回"""
+    return data.loads() if isinstance(data, RawJson) else data
+
+
+def dumps_line(obj: Any) -> bytes:
+    """
+    序列化为一行 UTF-8 JSON（以换行结尾）
+
+    对象中的 RawJson 先以占位字符串参与序列化，再替换为原始字节；
+    合法 JSON 中换行只可能出现在字符串外的空白处，因此去掉换行不改变语义。
+    """
+    chunks: list[bytes] = []
+    nonce = secrets.token_hex(8)
+
+    def _default(value: Any) -> Any:
+        if isinstance(value, RawJson):
+            chunks.append(value.raw)
+            return f"{nonce}:{len(chunks) - 1}"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    encoded = json.dumps(obj, ensure_ascii=False, default=_default).encode("utf-8")
+    if not chunks:
+        return encoded + b"\n"
+
+    parts: list[bytes] = []
+    for index, chunk in enumerate(chunks):
+        head, _, encoded = encoded.partition(f'"{nonce}:{index}"'.encode())
+        parts.append(head)
+        parts.append(chunk.replace(b"\r", b"").replace(b"\n", b""))
+    parts.append(encoded)
+    parts.append(b"\n")
+    return b"".join(parts)
@@ -6,8 +6,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import random
+import time
 from functools import wraps
-from typing import Callable, TypeVar, Optional
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, TypeVar, Optional
+
+if TYPE_CHECKING:
+    from .deadline import Deadline
 
 logger = logging.getLogger(__name__)
 
@@ -211,3 +215,124 @@ class RetryableOperation:
             return await func(*args, **kwargs)
 
         return await _wrapped()
+
+
+class RetryBudget:
+    """
+    进程级重试预算（令牌桶）
+
+    每个首次请求存入 ``ratio`` 个令牌，每次重试取出 1 个，桶容量为 ``burst``：
+    稳态下重试量不超过总流量的 ``ratio``，上游整体故障时不会放大为重试风暴。
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        burst: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self.requests = 0
+        self.retries = 0
+        self.exhausted = 0
+        self.last_exhausted_at: float | None = None
+
+    def deposit(self) -> None:
+        """记录一次首次请求（重试本身不存入令牌）"""
+        self.requests += 1
+        self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """尝试为一次重试取出令牌，预算耗尽时返回 False"""
+        # 容差：10 次 0.1 的累加略小于 1
+        if self._tokens >= 1.0 - 1e-9:
+            self._tokens = max(0.0, self._tokens - 1.0)
+            self.retries += 1
+            return True
+        self.exhausted += 1
+        self.last_exhausted_at = self._clock()
+        return False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ratio": self.ratio,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 3),
+            "requests": self.requests,
+            "retries": self.retries,
+            "exhausted": self.exhausted,
+        }
+
+
+# 本地快速失败的错误，重试只会立即再次失败
+_LOCAL_FAILURES = frozenset({"CircuitOpen", "DeadlineExceeded"})
+
+
+async def retry_result(
+    call: Callable[[], Awaitable[dict[str, Any]]],
+    config: RetryConfig,
+    budget: Optional[RetryBudget] = None,
+    sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    deadline: Optional["Deadline"] = None,
+) -> dict[str, Any]:
+    """
+    按 ``error.retryable`` 重试返回结构化结果（``{"ok", "error", "meta"}``）的调用
+
+    与 ``async_retry`` 使用相同的退避策略，但不依赖异常：执行层已把失败归类为结构化错误。
+    客户端限流（``meta.rate_limited == "client"``）与熔断（``CircuitOpen``）在本地快速失败，不重试；
+    带 ``deadline``（``deadline.Deadline``）时剩余预算不足以完成退避就不再重试。
+    结果的 ``meta`` 中记录 ``attempts`` 与 ``retry_backoff_ms``，预算耗尽时附加 ``retry_budget_exhausted``。
+    调用方负责只对幂等的读操作使用。
+    """
+    if budget is not None:
+        budget.deposit()
+    attempt = 0
+    backoff = 0.0
+    while True:
+        result = await call()
+        error = None if result.get("ok") else result.get("error") or {}
+        if (
+            error is None
+            or not error.get("retryable")
+            or attempt + 1 >= config.max_attempts
+            or result["meta"].get("rate_limited") == "client"
+            or error.get("type") in _LOCAL_FAILURES
+        ):
+            break
+        delay = calculate_delay(attempt, config)
+        if deadline is not None and deadline.remaining() <= delay:
+            break
+        if budget is not None and not budget.withdraw():
+            result["meta"]["retry_budget_exhausted"] = True
+            break
+        logger.warning(
+            f"Attempt {attempt + 1}/{config.max_attempts} failed for {result.get('action')}, "
+            f"retrying in {delay:.2f}s",
+            extra={
+                "function": result.get("action"),
+                "attempt": attempt + 1,
+                "error_type": error.get("type"),
+                "delay_seconds": delay,
+            },
+        )
+        await sleep(delay)
+        backoff += delay
+        attempt += 1
+    result["meta"]["attempts"] = attempt + 1
+    result["meta"]["retry_backoff_ms"] = int(backoff * 1000)
+    return result
+
+
+_SHARED_BUDGETS: dict[tuple[float, float], RetryBudget] = {}
+
+
+def shared_retry_budget(ratio: float, burst: float) -> RetryBudget:
+    """进程内共享的重试预算（按配置复用），所有 runner 的读路径共用一个桶"""
+    key = (ratio, burst)
+    budget = _SHARED_BUDGETS.get(key)
+    if budget is None:
+        budget = _SHARED_BUDGETS[key] = RetryBudget(ratio, burst)
+    return budget
@@ -1,52 +1,334 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from decimal import Decimal
-from typing import Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
-from .actions import ACTION_REGISTRY
-from .executor import PolymarketExecutor
-from .locks import WalletLockManager
+from .actions import ACTION_PLANS, ACTION_REGISTRY
+from .cache import CacheEntry, ReadCache, cache_key, result_meta, serialize_payload
+from .deadline import Deadline
+from .executor import ExecutorBackend, PolymarketExecutor
+from .hedging import Hedger
+from .latency import AdaptiveTimeouts, LatencyTracker
+from .locks import WalletLockManager, wallet_key
+from .metrics import REGISTRY
+from .models import ActionCategory, ActionSpec
+from .rawjson import RawJson, materialize
+from .retry import RetryConfig, retry_result, shared_retry_budget
+from .scheduler import Priority, priority_for
 from .security import estimate_amount, is_placeholder_key
 from .settings import SkillSettings
-from .validators import validate_param, validate_presence
+from .singleflight import SingleFlight
+from .tracing import Tracer, activate, deactivate, span
+from .version_check import CliVersionCheck
+
+if TYPE_CHECKING:
+    # 以下模块分别依赖 http.client/ssl、sqlite3、mmap，仅在启用对应功能时导入
+    from .disk_cache import DiskCache
+    from .http_executor import HttpExecutor
+    from .shm_cache import ShmCache
+
+
+def _timings_requested(context: Any) -> bool:
+    return isinstance(context, dict) and context.get("timings") is True
+
+
+# 写操作门控拦截（计入 skill_trade_blocked_total）
+TRADE_BLOCKED_ERRORS = frozenset({"TradingDisabledError", "PlaceholderKeyError", "HumanApprovalRequired"})
 
 
 class PolymarketSkillRunner:
     def __init__(self, settings: SkillSettings | None = None) -> None:
         self.settings = settings or SkillSettings.from_env()
         self.executor = PolymarketExecutor(self.settings)
+        self.http_executor: HttpExecutor | None = None
+        for category, backend in self.settings.executor_backends.items():
+            if backend not in {"cli", "http"}:
+                raise ValueError(f"未知执行后端: {category}={backend}")
+            if backend == "http":
+                if category != ActionCategory.READ.value:
+                    raise ValueError("http 后端仅支持 read 类 action")
+                from .http_executor import HttpExecutor
+
+                self.http_executor = HttpExecutor(self.settings)
         self.lock_manager = WalletLockManager()
-        self._version_checked = False
+        self.read_cache: ReadCache | None = None
+        if self.settings.read_cache_enabled:
+            self.read_cache = ReadCache(
+                ttls=self.settings.read_cache_ttls,
+                max_entries=self.settings.read_cache_max_entries,
+                max_bytes=self.settings.read_cache_max_bytes,
+            )
+        self.disk_cache: DiskCache | None = None
+        if self.settings.disk_cache_path:
+            from .disk_cache import DiskCache
+
+            self.disk_cache = DiskCache(
+                self.settings.disk_cache_path,
+                ttls=self.settings.disk_cache_ttls,
+                max_bytes=self.settings.disk_cache_max_bytes,
+            )
+        self.shm_cache: ShmCache | None = None
+        if self.settings.shm_cache_path:
+            from .shm_cache import ShmCache
+
+            self.shm_cache = ShmCache(
+                self.settings.shm_cache_path,
+                ttls=self.settings.read_cache_ttls,
+                slots=self.settings.shm_cache_slots,
+                slot_bytes=self.settings.shm_cache_slot_bytes,
+            )
+        self.singleflight: SingleFlight | None = SingleFlight() if self.settings.read_coalescing_enabled else None
+        self._refreshing: set[str] = set()
+        self._background: set[asyncio.Task[None]] = set()
+        # lambda 以便测试替换 runner.executor 后仍生效
+        self.version_check = CliVersionCheck(self.settings, lambda: self.executor.check_cli_version())
+        # 只用于 READ / READ_AUTH；写操作从不自动重试
+        self.retry_config = RetryConfig(
+            max_attempts=max(1, self.settings.retry_max_attempts),
+            initial_delay=self.settings.retry_initial_delay_seconds,
+            max_delay=self.settings.retry_max_delay_seconds,
+        )
+        self.retry_budget = shared_retry_budget(self.settings.retry_budget_ratio, self.settings.retry_budget_burst)
+        self.latency = LatencyTracker()
+        self.metrics = REGISTRY
+        self.tracer = Tracer(
+            always=self.settings.trace_timings,
+            path=self.settings.trace_file,
+            sample_rate=self.settings.trace_sample_rate,
+        )
+        for action in self.settings.hedge_actions:
+            spec = ACTION_REGISTRY.get(action)
+            if spec is None or spec.category == ActionCategory.WRITE:
+                raise ValueError(f"对冲仅支持读类 action: {action}")
+        self.timeouts: AdaptiveTimeouts | None = None
+        if self.settings.adaptive_timeouts_enabled:
+            self.timeouts = AdaptiveTimeouts(
+                multiplier=self.settings.adaptive_timeout_multiplier,
+                min_seconds=self.settings.adaptive_timeout_min_seconds,
+                max_seconds=self.settings.adaptive_timeout_max_seconds,
+                min_samples=self.settings.adaptive_timeout_min_samples,
+            )
+        self.hedger = Hedger(
+            self.latency,
+            self.settings.hedge_actions,
+            percentile=self.settings.hedge_percentile,
+            min_samples=self.settings.hedge_min_samples,
+        )
 
     async def healthcheck(self) -> dict[str, Any]:
-        ok, message = await self.executor.check_cli_version()
-        return {
-            "ok": ok,
-            "version": message if ok else None,
-            "error": None if ok else message,
+        status, cached = await self.version_check.status()
+        result: dict[str, Any] = {
+            "ok": status.ok,
+            "version": status.message if status.ok else None,
+            "error": None if status.ok else status.message,
+            "version_checked_at": status.checked_at,
+            "cached": cached,
         }
+        if self.shm_cache is not None:
+            result["shm_cache"] = self.shm_cache.stats()
+        rate_limiter = getattr(self.executor, "rate_limiter", None)
+        if rate_limiter is not None:
+            result["rate_limits"] = rate_limiter.stats()
+        circuit_breakers = getattr(self.executor, "circuit_breakers", None)
+        if circuit_breakers is not None:
+            result["circuits"] = circuit_breakers.stats()
+        result["retry_budget"] = self.retry_budget.stats()
+        if self.hedger.actions:
+            result["hedging"] = self.hedger.stats()
+        if self.timeouts is not None:
+            result["timeouts"] = self.timeouts.stats()
+        return result
 
     async def execute(
         self,
         action: str,
         params: dict[str, Any] | None = None,
         context: dict[str, Any] | None = None,
+        *,
+        passthrough: bool = False,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """
+        执行单个 action
+
+        ``passthrough=True`` 时成功结果的 ``data`` 可能是未解析的 ``RawJson``（供 bridge 直接拼接输出），
+        其余调用方拿到的始终是解析后的对象。
+
+        截止时间取 ``deadline`` 与 ``context.deadline_ms`` 中较早者；到期时返回 ``DeadlineExceeded``，
+        已耗尽预算的请求不会启动子进程。
+
+        ``context.timings=true``（或 ``OPENCLAW_PM_TRACE_TIMINGS=true``）时响应 ``meta.timings`` 返回各阶段耗时。
+        """
+        started = time.monotonic()
+        trace = self.tracer.begin(_timings_requested(context))
+        if trace is None:
+            result = await self._execute(action, params, context, passthrough, deadline)
+        else:
+            token = activate(trace)
+            try:
+                result = await self._execute(action, params, context, passthrough, deadline)
+            finally:
+                deactivate(token)
+            self.tracer.finish(trace, action, result)
+        self._record_call(action, result, (time.monotonic() - started) * 1000)
+        return result
+
+    async def _execute(
+        self,
+        action: str,
+        params: dict[str, Any] | None,
+        context: dict[str, Any] | None,
+        passthrough: bool,
+        deadline: Deadline | None,
     ) -> dict[str, Any]:
         payload = params or {}
         runtime = context or {}
 
-        if self.settings.enforce_cli_version and not self._version_checked:
-            ok, message = await self.executor.check_cli_version()
-            if not ok:
-                return self._error(
-                    action,
-                    "CliVersionMismatch",
-                    message,
-                    retryable=False,
+        try:
+            requested = Deadline.from_context(runtime)
+        except ValueError as exc:
+            return self._error(action, "ValidationError", str(exc), retryable=False)
+        if requested is not None:
+            deadline = requested.earliest(deadline)
+        if deadline is not None and deadline.expired():
+            return self._deadline_error(action, deadline)
+
+        version_error = await self._ensure_cli_version(action)
+        if version_error:
+            return version_error
+
+        with span("validate"):
+            validation_error = self.validate(action, payload)
+        if validation_error:
+            return validation_error
+
+        return await self._execute_validated(ACTION_REGISTRY[action], payload, runtime, passthrough, deadline)
+
+    async def execute_batch(
+        self,
+        items: list[dict[str, Any]],
+        context: dict[str, Any] | None = None,
+        max_concurrency: int | None = None,
+        deadline_seconds: float | None = None,
+        *,
+        passthrough: bool = False,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        """
+        批量执行只读 action
+
+        - 所有条目先统一校验，校验失败的条目直接给出错误结果，不进入执行
+        - 其余条目以有界并发执行
+        - 到达 deadline 时取消未完成条目，返回部分结果（``meta.partial=true``）；
+          deadline 取 ``deadline_seconds``、``deadline`` 与 ``context.deadline_ms`` 中最早者，并传递给每个条目，
+          条目的排队与子进程超时同样受其约束
+        """
+        runtime = context or {}
+        started = time.monotonic()
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        timings: list[dict[str, int]] = [{"queued_ms": 0, "elapsed_ms": 0} for _ in items]
+
+        if deadline_seconds:
+            deadline = Deadline.after_ms(int(deadline_seconds * 1000)).earliest(deadline)
+        context_error: str | None = None
+        try:
+            requested = Deadline.from_context(runtime)
+        except ValueError as exc:
+            context_error = str(exc)
+        else:
+            if requested is not None:
+                deadline = requested.earliest(deadline)
+
+        version_error = await self._ensure_cli_version("execute_batch")
+        runnable: list[int] = []
+        for index, item in enumerate(items):
+            action = str(item.get("action") or "")
+            if context_error:
+                results[index] = self._error(action, "ValidationError", context_error, retryable=False)
+                continue
+            if version_error:
+                results[index] = self._error(action, "CliVersionMismatch", version_error["error"]["message"], retryable=False)
+                continue
+            payload = item.get("params") or {}
+            error = self.validate(action, payload)
+            if error is None and ACTION_REGISTRY[action].is_write:
+                error = self._error(action, "ValidationError", "execute_batch 不支持写操作", retryable=False)
+            if error:
+                results[index] = error
+                continue
+            runnable.append(index)
+
+        limit = max(1, min(max_concurrency or self.settings.batch_max_concurrency, self.settings.batch_max_concurrency))
+        slots = asyncio.Semaphore(limit)
+
+        requested = _timings_requested(runtime)
+
+        async def _run_item(index: int) -> None:
+            item = items[index]
+            async with slots:
+                item_started = time.monotonic()
+                timings[index]["queued_ms"] = int((item_started - started) * 1000)
+                # 每个条目独立 trace（_run_item 在自己的 task 中运行，contextvar 互不影响）
+                trace = self.tracer.begin(requested)
+                if trace is not None:
+                    activate(trace)
+                results[index] = await self._execute_validated(
+                    ACTION_REGISTRY[str(item["action"])],
+                    item.get("params") or {},
+                    runtime,
+                    passthrough,
+                    deadline,
                 )
-            self._version_checked = True
+                if trace is not None:
+                    self.tracer.finish(trace, str(item["action"]), results[index])
+                timings[index]["elapsed_ms"] = int((time.monotonic() - item_started) * 1000)
 
+        tasks = [asyncio.create_task(_run_item(index)) for index in runnable]
+        if tasks:
+            _, not_done = await asyncio.wait(tasks, timeout=deadline.remaining() if deadline is not None else None)
+            for task in not_done:
+                task.cancel()
+            if not_done:
+                await asyncio.gather(*not_done, return_exceptions=True)
+
+        entries: list[dict[str, Any]] = []
+        timed_out = 0
+        for index, item in enumerate(items):
+            result = results[index]
+            if result is None:
+                timed_out += 1
+                budget_ms = deadline.budget_ms if deadline is not None else 0
+                result = self._error(
+                    str(item.get("action") or ""),
+                    "DeadlineExceeded",
+                    f"批量请求超过 deadline（{budget_ms / 1000}s），该条目未完成",
+                    retryable=True,
+                )
+            elif (result.get("error") or {}).get("type") == "DeadlineExceeded":
+                timed_out += 1
+            self._record_call(str(item.get("action") or ""), result, timings[index]["elapsed_ms"])
+            entries.append({"index": index, "ok": bool(result.get("ok")), "result": result, **timings[index]})
+
+        succeeded = sum(1 for entry in entries if entry["ok"])
+        return {
+            "ok": succeeded == len(entries),
+            "items": entries,
+            "meta": {
+                "count": len(entries),
+                "succeeded": succeeded,
+                "failed": len(entries) - succeeded,
+                "timed_out": timed_out,
+                "partial": timed_out > 0,
+                "max_concurrency": limit,
+                "duration_ms": int((time.monotonic() - started) * 1000),
+            },
+        }
+
+    def validate(self, action: str, payload: dict[str, Any]) -> dict[str, Any] | None:
+        """校验 action 与参数，失败时返回错误响应"""
         if action not in ACTION_REGISTRY:
             return self._error(
                 action,
@@ -54,17 +336,37 @@ class PolymarketSkillRunner:
                 f"未知 action: {action}",
                 retryable=False,
             )
+        if not isinstance(payload, dict):
+            return self._error(action, "ValidationError", "params 必须是 JSON 对象", retryable=False)
 
-        spec = ACTION_REGISTRY[action]
-        missing_error = validate_presence(payload, spec.required_params)
-        if missing_error:
-            return self._error(action, "ValidationError", missing_error, retryable=False)
+        validation_error = ACTION_PLANS[action].validate(payload)
+        if validation_error:
+            return self._error(action, "ValidationError", validation_error, retryable=False)
+        return None
 
-        for key, value in payload.items():
-            validation_error = validate_param(key, value)
-            if validation_error:
-                return self._error(action, "ValidationError", validation_error, retryable=False)
+    async def _ensure_cli_version(self, action: str) -> dict[str, Any] | None:
+        if self._executor_for(action) is not self.executor:
+            return None
+        if self.settings.enforce_cli_version:
+            status = await self.version_check.ensure()
+            if not status.ok:
+                return self._error(
+                    action,
+                    "CliVersionMismatch",
+                    status.message,
+                    retryable=False,
+                )
+        return None
 
+    async def _execute_validated(
+        self,
+        spec: ActionSpec,
+        payload: dict[str, Any],
+        runtime: dict[str, Any],
+        passthrough: bool = False,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        action = spec.name
         args = spec.builder(payload)
 
         # 写操作门控
@@ -121,29 +423,313 @@ class PolymarketSkillRunner:
         timeout = self.settings.write_timeout_seconds if spec.is_write else self.settings.read_timeout_seconds
         env_overrides = self._build_env_overrides(runtime)
 
-        async def _do_execute() -> dict[str, Any]:
-            command_result = await self.executor.run(args, timeout_seconds=timeout, env_overrides=env_overrides)
-            if command_result.ok:
-                return {
-                    "ok": True,
-                    "action": action,
-                    "data": command_result.data,
-                    "meta": {"action": action, **command_result.meta},
-                }
+        if spec.is_write:
+            try:
+                result = await self.lock_manager.run_with_wallet_lock(
+                    wallet_key(runtime),
+                    lambda: self._invoke(
+                        action, args, timeout, env_overrides, priority_for(spec), raw=passthrough, deadline=deadline
+                    ),
+                    timeout=deadline.remaining() if deadline is not None else None,
+                )
+            except asyncio.TimeoutError:
+                # 等待同钱包的前序写操作时预算耗尽，尚未发出
+                if deadline is None:
+                    raise
+                return self._deadline_error(action, deadline)
+            return self._fix_timeout_retryable(result, is_write=True)
+
+        if spec.category == ActionCategory.READ:
+            result = await self._within(
+                deadline, action, self._read(action, args, timeout, env_overrides, passthrough, deadline, payload)
+            )
+            if not passthrough and isinstance(result.get("data"), RawJson):
+                # 合并请求的发起方可能是透传调用
+                result["data"] = materialize(result["data"])
+            return result
+
+        return await self._invoke_read(
+            action, args, timeout, env_overrides, priority_for(spec), raw=passthrough, deadline=deadline, params=payload
+        )
+
+    async def _within(
+        self,
+        deadline: Deadline | None,
+        action: str,
+        call: Awaitable[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """
+        以剩余预算等待 READ 结果
+
+        READ 可能与其他请求合并，共享调用以最晚的等待方的预算为准：到期时只是本调用方放弃等待，
+        所有等待方都放弃时共享调用被取消（子进程随之终止）。
+        """
+        if deadline is None:
+            return await call
+        try:
+            return await asyncio.wait_for(call, deadline.remaining())
+        except asyncio.TimeoutError:
+            return self._deadline_error(action, deadline)
+
+    async def _read(
+        self,
+        action: str,
+        args: list[str],
+        timeout: float,
+        env_overrides: dict[str, str | None],
+        passthrough: bool = False,
+        deadline: Deadline | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        READ 类 action 的读路径（READ_AUTH / WRITE 不会进入这里）
+
+        - 依次查进程内缓存、主机共享缓存、SQLite 缓存，命中直接返回；
+          未命中时相同 action + argv 的并发请求合并为一次 CLI 调用
+        - stale-while-revalidate：缓存刚过期时立即返回旧值，并在后台刷新
+        - 可重试错误先在进程级重试预算内自动重试（见 ``retry.retry_result``）
+        - stale-if-error：重试后仍是可重试错误时退回最近一次成功结果
+        返回旧值时 ``meta.stale=true``，``meta.age_ms`` 为数据年龄
+        - 调用按 ``deadline`` 停止重试；合并的调用以最晚的等待方为准（见 ``SingleFlight``），
+          后台刷新不限时
+        """
+        key = cache_key(action, args)
+        cache = self.read_cache if self.read_cache is not None and self.read_cache.is_cacheable(action) else None
+        disk = self.disk_cache if self.disk_cache is not None and self.disk_cache.is_cacheable(action) else None
+        shm = self.shm_cache if self.shm_cache is not None and self.shm_cache.is_cacheable(action) else None
+
+        async def _fetch(budget: Deadline | None = None) -> dict[str, Any]:
+            result = await self._invoke_read(
+                action, args, timeout, env_overrides, raw=passthrough, deadline=budget, params=params
+            )
+            if result.get("ok") and (cache is not None or shm is not None or disk is not None):
+                payload = serialize_payload(result.get("data"))
+                if payload is not None:
+                    meta = result_meta(result["meta"])
+                    if cache is not None:
+                        cache.put_payload(key, action, payload, meta)
+                    if shm is not None:
+                        shm.put_payload(key, action, payload, meta)
+                    if disk is not None:
+                        await asyncio.to_thread(disk.put_payload, key, action, payload, meta)
+            return result
+
+        with span("cache"):
+            if cache is not None:
+                entry = cache.get(key)
+                if entry is not None:
+                    return self._cached_response(action, entry, tier="memory", age_ms=cache.age_ms(entry), raw=passthrough)
+            if shm is not None:
+                entry = shm.get(key)
+                if entry is not None:
+                    if cache is not None:
+                        cache.put_payload(key, action, entry.payload, entry.meta, max_ttl=shm.remaining_ttl(entry))
+                    return self._cached_response(action, entry, tier="shm", age_ms=shm.age_ms(entry), raw=passthrough)
+            if disk is not None:
+                entry = await asyncio.to_thread(disk.get, key)
+                if entry is not None:
+                    if cache is not None:
+                        cache.put_payload(key, action, entry.payload, entry.meta, max_ttl=disk.remaining_ttl(entry))
+                    return self._cached_response(action, entry, tier="disk", age_ms=disk.age_ms(entry), raw=passthrough)
+        if cache is not None and self.settings.stale_while_revalidate_seconds > 0:
+            entry = cache.get_stale(key, self.settings.stale_while_revalidate_seconds)
+            if entry is not None:
+                self._refresh_in_background(key, _fetch)
+                return self._stale_response(action, entry, cache.age_ms(entry), revalidating=True, raw=passthrough)
+
+        if self.singleflight is not None:
+            # 副本：后加入的等待方会延长共享调用的截止时间，不能改动本请求自己的 deadline
+            budget = deadline.copy() if deadline is not None else None
+            result, shared = await self.singleflight.do(key, lambda: _fetch(budget), budget)
+            result["meta"]["coalesced"] = shared
+            result["meta"]["singleflight"] = self.singleflight.stats()
+        else:
+            result = await _fetch(deadline)
+
+        if (
+            cache is not None
+            and not result.get("ok")
+            and (result.get("error") or {}).get("retryable")
+            and self.settings.stale_if_error_seconds > 0
+        ):
+            entry = cache.get_stale(key, self.settings.stale_if_error_seconds)
+            if entry is not None:
+                stale = self._stale_response(action, entry, cache.age_ms(entry), revalidating=False, raw=passthrough)
+                stale["meta"]["stale_error"] = result["error"]
+                return stale
+
+        if cache is not None or shm is not None or disk is not None:
+            result["meta"]["cache"] = self._cache_meta(hit=False)
+        return result
+
+    def _refresh_in_background(self, key: str, fetch: Callable[[], Awaitable[dict[str, Any]]]) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def _refresh() -> None:
+            try:
+                if self.singleflight is not None:
+                    await self.singleflight.do(key, fetch)
+                else:
+                    await fetch()
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.create_task(_refresh())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    def _stale_response(
+        self,
+        action: str,
+        entry: CacheEntry,
+        age_ms: int,
+        revalidating: bool,
+        raw: bool = False,
+    ) -> dict[str, Any]:
+        response = self._cached_response(action, entry, tier="memory", age_ms=age_ms, raw=raw)
+        response["meta"]["stale"] = True
+        response["meta"]["age_ms"] = age_ms
+        response["meta"]["revalidating"] = revalidating
+        return response
+
+    def _cached_response(
+        self,
+        action: str,
+        entry: CacheEntry,
+        tier: str,
+        age_ms: int,
+        raw: bool = False,
+    ) -> dict[str, Any]:
+        return {
+            "ok": True,
+            "action": action,
+            "data": RawJson(entry.payload) if raw else entry.data(),
+            "meta": {
+                **result_meta(entry.meta),
+                "duration_ms": 0,
+                "cache": self._cache_meta(hit=True, tier=tier, age_ms=age_ms),
+            },
+        }
+
+    def _cache_meta(self, hit: bool, **extra: Any) -> dict[str, Any]:
+        meta: dict[str, Any] = {"hit": hit, **extra}
+        if self.read_cache is not None:
+            meta["hits"] = self.read_cache.hits
+            meta["misses"] = self.read_cache.misses
+        if self.shm_cache is not None:
+            meta["shm"] = {"hits": self.shm_cache.hits, "misses": self.shm_cache.misses}
+        if self.disk_cache is not None:
+            meta["disk"] = {"hits": self.disk_cache.hits, "misses": self.disk_cache.misses}
+        return meta
+
+    async def _invoke(
+        self,
+        action: str,
+        args: list[str],
+        timeout: float,
+        env_overrides: dict[str, str | None],
+        priority: Priority = Priority.READ,
+        raw: bool = False,
+        deadline: Deadline | None = None,
+        params: dict[str, Any] | None = None,
+        timeout_source: str | None = None,
+    ) -> dict[str, Any]:
+        options: dict[str, Any] = {"deadline": deadline} if deadline is not None else {}
+        if timeout_source is not None:
+            options["timeout_source"] = timeout_source
+        backend = self._executor_for(action)
+        if backend is self.http_executor:
+            # HTTP 后端按已校验参数构建请求，不从 argv 反向解析
+            options.update(action=action, params=params)
+        command_result = await backend.run(
+            args,
+            timeout_seconds=timeout,
+            env_overrides=env_overrides,
+            priority=priority,
+            raw=raw,
+            **options,
+        )
+        if command_result.ok:
             return {
-                "ok": False,
+                "ok": True,
                 "action": action,
-                "error": command_result.error,
+                "data": command_result.data,
                 "meta": {"action": action, **command_result.meta},
             }
+        return {
+            "ok": False,
+            "action": action,
+            "error": command_result.error,
+            "meta": {"action": action, **command_result.meta},
+        }
 
-        if spec.is_write:
-            wallet_id = str(runtime.get("wallet_id") or runtime.get("address") or "default-wallet")
-            result = await self.lock_manager.run_with_wallet_lock(wallet_id, _do_execute)
-            return self._fix_timeout_retryable(result, is_write=True)
+    async def _invoke_read(
+        self,
+        action: str,
+        args: list[str],
+        timeout: float,
+        env_overrides: dict[str, str | None],
+        priority: Priority = Priority.READ,
+        raw: bool = False,
+        deadline: Deadline | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        读操作调用：可重试错误在进程级重试预算内按指数退避自动重试；
+        每次尝试经 ``Hedger`` 执行（记录耗时，启用对冲的 action 慢调用时发起对冲请求）。
+        启用自适应超时时，每次调用的超时按该 action 的历史耗时计算，``timeout`` 只作为样本不足时的默认值；
+        自适应超时到期不计入熔断（见 ``executor.run_guarded``）。
+        """
+
+        async def _call() -> dict[str, Any]:
+            if self.timeouts is None:
+                return await self._invoke(
+                    action, args, timeout, env_overrides, priority, raw=raw, deadline=deadline, params=params
+                )
+            chosen, adaptive = self.timeouts.timeout(action, timeout)
+            source = "adaptive" if adaptive else "static"
+            result = await self._invoke(
+                action,
+                args,
+                chosen,
+                env_overrides,
+                priority,
+                raw=raw,
+                deadline=deadline,
+                params=params,
+                timeout_source=source,
+            )
+            self.timeouts.observe(action, result, chosen)
+            result["meta"]["timeout_source"] = source
+            return result
 
-        result = await _do_execute()
-        return self._fix_timeout_retryable(result, is_write=False)
+        async def _attempt() -> dict[str, Any]:
+            return self._fix_timeout_retryable(
+                await self.hedger.run(action, _call, lambda: self._can_hedge(action, args)), is_write=False
+            )
+
+        return await retry_result(_attempt, self.retry_config, self.retry_budget, deadline=deadline)
+
+    def _can_hedge(self, action: str, args: list[str]) -> bool:
+        """后端可取消且调度器、限流器都有余量时才发起对冲调用"""
+        backend = self._executor_for(action)
+        if not getattr(backend, "cancellable", True):
+            return False
+        scheduler = getattr(backend, "scheduler", None)
+        if scheduler is not None and scheduler.saturated:
+            return False
+        rate_limiter = getattr(backend, "rate_limiter", None)
+        return rate_limiter is None or not rate_limiter.saturated(args)
+
+    def _executor_for(self, action: str) -> ExecutorBackend:
+        """按 action 类别选择执行后端，未配置时使用 CLI 子进程"""
+        spec = ACTION_REGISTRY.get(action)
+        if self.http_executor is not None and spec is not None:
+            if self.settings.executor_backends.get(spec.category.value) == "http":
+                return self.http_executor
+        return self.executor
 
     def _build_env_overrides(self, runtime: dict[str, Any]) -> dict[str, str | None]:
         private_key = runtime.get("private_key") or runtime.get("POLYMARKET_PRIVATE_KEY")
@@ -163,6 +749,27 @@ class PolymarketSkillRunner:
                 )
         return result
 
+    def _record_call(self, action: str, result: dict[str, Any], duration_ms: float) -> None:
+        """更新 ``skill_call_*`` 指标；未注册的 action 统一记为 unknown，避免标签基数失控"""
+        label = action if action in ACTION_REGISTRY else "unknown"
+        metrics = self.metrics
+        if result.get("ok"):
+            metrics.inc("skill_call_total", action=label, result="ok")
+        else:
+            error_type = str((result.get("error") or {}).get("type") or "Unknown")
+            metrics.inc("skill_call_total", action=label, result="error")
+            metrics.inc("skill_call_error_total", action=label, type=error_type)
+            if error_type in {"TimeoutError", "DeadlineExceeded"}:
+                metrics.inc("skill_timeout_total", action=label)
+            elif error_type in TRADE_BLOCKED_ERRORS:
+                metrics.inc("skill_trade_blocked_total", action=label, reason=error_type)
+        metrics.observe("skill_call_duration_ms", duration_ms, action=label)
+
+    def _deadline_error(self, action: str, deadline: Deadline) -> dict[str, Any]:
+        result = self._error(action, "DeadlineExceeded", deadline.message(), retryable=True)
+        result["meta"]["deadline_exceeded"] = True
+        return result
+
     def _error(
         self,
         action: str,
@@ -184,3 +791,4 @@ class PolymarketSkillRunner:
         if extra:
             payload["error"].update(extra)
         return payload
+
@@ -0,0 +1,106 @@
+"""
+子进程并发调度：全局并发上限 + 优先级通道
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+
+from .models import ActionCategory, ActionSpec
+
+
+class Priority(IntEnum):
+    """数值越小越优先"""
+
+    CANCEL = 0
+    WRITE = 1
+    READ_AUTH = 2
+    READ = 3
+
+
+def priority_for(spec: ActionSpec) -> Priority:
+    """撤单优先于其他写操作，写操作优先于鉴权读与批量读"""
+    if spec.is_write:
+        return Priority.CANCEL if "cancel" in spec.name else Priority.WRITE
+    if spec.category == ActionCategory.READ_AUTH:
+        return Priority.READ_AUTH
+    return Priority.READ
+
+
+class SubprocessScheduler:
+    """
+    限制同时运行的 polymarket 子进程数量
+
+    空闲槽位按 (优先级, 到达顺序) 分配：排队中的撤单/写操作总是先于批量读获得槽位，
+    同一优先级内先到先得。
+    """
+
+    def __init__(self, max_concurrency: int) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def saturated(self) -> bool:
+        """没有空闲槽位，新的调用需要排队"""
+        return self._active >= self.max_concurrency or any(not future.done() for _, _, future in self._waiters)
+
+    async def acquire(self, priority: Priority = Priority.READ) -> float:
+        """获取一个槽位，返回排队等待秒数"""
+        if self._active < self.max_concurrency and not self._waiters:
+            self._active += 1
+            return 0.0
+
+        started = time.monotonic()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 槽位已分配但调用方被取消时归还槽位
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        return time.monotonic() - started
+
+    def release(self) -> None:
+        self._active -= 1
+        while self._waiters and self._active < self.max_concurrency:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._active += 1
+            future.set_result(None)
+
+    def stats(self) -> dict[str, object]:
+        queued: dict[str, int] = {}
+        for priority, _, future in self._waiters:
+            if not future.done():
+                name = Priority(priority).name.lower()
+                queued[name] = queued.get(name, 0) + 1
+        return {"max_concurrency": self.max_concurrency, "active": self._active, "queued": queued}
+
+
+_SHARED: dict[int, SubprocessScheduler] = {}
+
+
+def shared_scheduler(max_concurrency: int) -> SubprocessScheduler | None:
+    """
+    进程内共享的调度器（按上限复用），``max_concurrency <= 0`` 表示不限制
+
+    同一进程内的多个 runner / executor（如 MarketCollector 自建的 runner）共享同一组槽位。
+    """
+    if max_concurrency <= 0:
+        return None
+    scheduler = _SHARED.get(max_concurrency)
+    if scheduler is None:
+        scheduler = _SHARED[max_concurrency] = SubprocessScheduler(max_concurrency)
+    return scheduler
@@ -1,7 +1,27 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+
+def _parse_float_map(raw: str) -> dict[str, float]:
+    """解析 ``name=value,name=value`` 形式的环境变量"""
+    result: dict[str, float] = {}
+    for item in raw.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip():
+            result[name.strip()] = float(value)
+    return result
+
+
+def _parse_str_map(raw: str) -> dict[str, str]:
+    """解析 ``name=value,name=value`` 形式的环境变量（值保留为字符串）"""
+    result: dict[str, str] = {}
+    for item in raw.split(","):
+        name, sep, value = item.partition("=")
+        if sep and name.strip():
+            result[name.strip()] = value.strip()
+    return result
 
 
 @dataclass(frozen=True)
@@ -16,9 +36,61 @@ class SkillSettings:
     write_timeout_seconds: int = 60
     cli_version: str = "0.1.4"
     enforce_cli_version: bool = True
+    version_cache_path: str = "~/.cache/openclaw-polymarket-skill/cli-version.json"
+    version_check_ttl_seconds: float = 300.0
     anthropic_api_key: str = ""
     claude_timeout_seconds: int = 60
     claude_max_tokens: int = 4096
+    bridge_max_in_flight: int = 32
+    bridge_passthrough: bool = False
+    socket_path: str = ""
+    bridge_workers: int = 0
+    batch_max_items: int = 200
+    batch_max_concurrency: int = 16
+    read_cache_enabled: bool = True
+    read_cache_ttls: dict[str, float] = field(default_factory=dict)
+    read_cache_max_entries: int = 1024
+    read_cache_max_bytes: int = 64 * 1024 * 1024
+    read_coalescing_enabled: bool = True
+    disk_cache_path: str = ""
+    disk_cache_ttls: dict[str, float] = field(default_factory=dict)
+    disk_cache_max_bytes: int = 256 * 1024 * 1024
+    shm_cache_path: str = ""
+    shm_cache_slots: int = 1024
+    shm_cache_slot_bytes: int = 64 * 1024
+    stale_while_revalidate_seconds: float = 0.0
+    stale_if_error_seconds: float = 0.0
+    max_concurrent_processes: int = 16
+    rate_limit_enabled: bool = True
+    rate_limits: dict[str, float] = field(default_factory=dict)
+    rate_limit_backoff_seconds: float = 1.0
+    circuit_breaker_enabled: bool = True
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
+    retry_max_attempts: int = 3
+    retry_initial_delay_seconds: float = 0.2
+    retry_max_delay_seconds: float = 2.0
+    retry_budget_ratio: float = 0.1
+    retry_budget_burst: float = 10.0
+    hedge_actions: tuple[str, ...] = ()
+    hedge_percentile: float = 0.95
+    hedge_min_samples: int = 20
+    adaptive_timeouts_enabled: bool = True
+    adaptive_timeout_multiplier: float = 3.0
+    adaptive_timeout_min_seconds: float = 1.0
+    adaptive_timeout_max_seconds: float = 60.0
+    adaptive_timeout_min_samples: int = 20
+    metrics_textfile_path: str = ""
+    metrics_textfile_interval_seconds: float = 15.0
+    trace_timings: bool = False
+    trace_file: str = ""
+    trace_sample_rate: float = 0.01
+    max_output_bytes: int = 32 * 1024 * 1024
+    error_excerpt_bytes: int = 4096
+    executor_backends: dict[str, str] = field(default_factory=dict)
+    gamma_api_url: str = "https://gamma-api.polymarket.com"
+    clob_api_url: str = "https://clob.polymarket.com"
+    data_api_url: str = "https://data-api.polymarket.com"
 
     @staticmethod
     def from_env() -> "SkillSettings":
@@ -33,7 +105,63 @@ class SkillSettings:
             write_timeout_seconds=int(os.getenv("OPENCLAW_PM_WRITE_TIMEOUT_SECONDS", "60")),
             cli_version=os.getenv("OPENCLAW_PM_CLI_VERSION", "0.1.4"),
             enforce_cli_version=os.getenv("OPENCLAW_PM_ENFORCE_VERSION", "true").lower() == "true",
+            version_cache_path=os.getenv(
+                "OPENCLAW_PM_VERSION_CACHE_PATH", "~/.cache/openclaw-polymarket-skill/cli-version.json"
+            ),
+            version_check_ttl_seconds=float(os.getenv("OPENCLAW_PM_VERSION_CHECK_TTL_SECONDS", "300")),
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY", ""),
             claude_timeout_seconds=int(os.getenv("OPENCLAW_CLAUDE_TIMEOUT", "60")),
             claude_max_tokens=int(os.getenv("OPENCLAW_CLAUDE_MAX_TOKENS", "4096")),
+            bridge_max_in_flight=int(os.getenv("OPENCLAW_PM_BRIDGE_MAX_IN_FLIGHT", "32")),
+            bridge_passthrough=os.getenv("OPENCLAW_PM_BRIDGE_PASSTHROUGH", "false").lower() == "true",
+            socket_path=os.getenv("OPENCLAW_PM_SOCKET", ""),
+            bridge_workers=int(os.getenv("OPENCLAW_PM_BRIDGE_WORKERS", "0")),
+            batch_max_items=int(os.getenv("OPENCLAW_PM_BATCH_MAX_ITEMS", "200")),
+            batch_max_concurrency=int(os.getenv("OPENCLAW_PM_BATCH_MAX_CONCURRENCY", "16")),
+            read_cache_enabled=os.getenv("OPENCLAW_PM_READ_CACHE", "true").lower() == "true",
+            read_cache_ttls=_parse_float_map(os.getenv("OPENCLAW_PM_READ_CACHE_TTLS", "")),
+            read_cache_max_entries=int(os.getenv("OPENCLAW_PM_READ_CACHE_MAX_ENTRIES", "1024")),
+            read_cache_max_bytes=int(os.getenv("OPENCLAW_PM_READ_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            read_coalescing_enabled=os.getenv("OPENCLAW_PM_READ_COALESCING", "true").lower() == "true",
+            disk_cache_path=os.getenv("OPENCLAW_PM_DISK_CACHE_PATH", ""),
+            disk_cache_ttls=_parse_float_map(os.getenv("OPENCLAW_PM_DISK_CACHE_TTLS", "")),
+            disk_cache_max_bytes=int(os.getenv("OPENCLAW_PM_DISK_CACHE_MAX_BYTES", str(256 * 1024 * 1024))),
+            shm_cache_path=os.getenv("OPENCLAW_PM_SHM_CACHE_PATH", ""),
+            shm_cache_slots=int(os.getenv("OPENCLAW_PM_SHM_CACHE_SLOTS", "1024")),
+            shm_cache_slot_bytes=int(os.getenv("OPENCLAW_PM_SHM_CACHE_SLOT_BYTES", str(64 * 1024))),
+            stale_while_revalidate_seconds=float(os.getenv("OPENCLAW_PM_STALE_WHILE_REVALIDATE_SECONDS", "0")),
+            stale_if_error_seconds=float(os.getenv("OPENCLAW_PM_STALE_IF_ERROR_SECONDS", "0")),
+            max_concurrent_processes=int(os.getenv("OPENCLAW_PM_MAX_CONCURRENT_PROCESSES", "16")),
+            rate_limit_enabled=os.getenv("OPENCLAW_PM_RATE_LIMIT", "true").lower() == "true",
+            rate_limits=_parse_float_map(os.getenv("OPENCLAW_PM_RATE_LIMITS", "")),
+            rate_limit_backoff_seconds=float(os.getenv("OPENCLAW_PM_RATE_LIMIT_BACKOFF_SECONDS", "1")),
+            circuit_breaker_enabled=os.getenv("OPENCLAW_PM_CIRCUIT_BREAKER", "true").lower() == "true",
+            circuit_failure_threshold=int(os.getenv("OPENCLAW_PM_CIRCUIT_FAILURE_THRESHOLD", "5")),
+            circuit_reset_seconds=float(os.getenv("OPENCLAW_PM_CIRCUIT_RESET_SECONDS", "30")),
+            retry_max_attempts=int(os.getenv("OPENCLAW_PM_RETRY_MAX_ATTEMPTS", "3")),
+            retry_initial_delay_seconds=float(os.getenv("OPENCLAW_PM_RETRY_INITIAL_DELAY_SECONDS", "0.2")),
+            retry_max_delay_seconds=float(os.getenv("OPENCLAW_PM_RETRY_MAX_DELAY_SECONDS", "2")),
+            retry_budget_ratio=float(os.getenv("OPENCLAW_PM_RETRY_BUDGET_RATIO", "0.1")),
+            retry_budget_burst=float(os.getenv("OPENCLAW_PM_RETRY_BUDGET_BURST", "10")),
+            hedge_actions=tuple(
+                item.strip() for item in os.getenv("OPENCLAW_PM_HEDGE_ACTIONS", "").split(",") if item.strip()
+            ),
+            hedge_percentile=float(os.getenv("OPENCLAW_PM_HEDGE_PERCENTILE", "0.95")),
+            hedge_min_samples=int(os.getenv("OPENCLAW_PM_HEDGE_MIN_SAMPLES", "20")),
+            adaptive_timeouts_enabled=os.getenv("OPENCLAW_PM_ADAPTIVE_TIMEOUTS", "true").lower() == "true",
+            adaptive_timeout_multiplier=float(os.getenv("OPENCLAW_PM_ADAPTIVE_TIMEOUT_MULTIPLIER", "3")),
+            adaptive_timeout_min_seconds=float(os.getenv("OPENCLAW_PM_ADAPTIVE_TIMEOUT_MIN_SECONDS", "1")),
+            adaptive_timeout_max_seconds=float(os.getenv("OPENCLAW_PM_ADAPTIVE_TIMEOUT_MAX_SECONDS", "60")),
+            adaptive_timeout_min_samples=int(os.getenv("OPENCLAW_PM_ADAPTIVE_TIMEOUT_MIN_SAMPLES", "20")),
+            metrics_textfile_path=os.getenv("OPENCLAW_PM_METRICS_TEXTFILE", ""),
+            metrics_textfile_interval_seconds=float(os.getenv("OPENCLAW_PM_METRICS_TEXTFILE_INTERVAL_SECONDS", "15")),
+            trace_timings=os.getenv("OPENCLAW_PM_TRACE_TIMINGS", "false").lower() == "true",
+            trace_file=os.getenv("OPENCLAW_PM_TRACE_FILE", ""),
+            trace_sample_rate=float(os.getenv("OPENCLAW_PM_TRACE_SAMPLE_RATE", "0.01")),
+            max_output_bytes=int(os.getenv("OPENCLAW_PM_MAX_OUTPUT_BYTES", str(32 * 1024 * 1024))),
+            error_excerpt_bytes=int(os.getenv("OPENCLAW_PM_ERROR_EXCERPT_BYTES", "4096")),
+            executor_backends=_parse_str_map(os.getenv("OPENCLAW_PM_BACKENDS", "")),
+            gamma_api_url=os.getenv("OPENCLAW_PM_GAMMA_API_URL", "https://gamma-api.polymarket.com"),
+            clob_api_url=os.getenv("OPENCLAW_PM_CLOB_API_URL", "https://clob.polymarket.com"),
+            data_api_url=os.getenv("OPENCLAW_PM_DATA_API_URL", "https://data-api.polymarket.com"),
         )
@@ -0,0 +1,211 @@
+"""
+主机内多进程共享的内存映射缓存（读缓存中间层）
+
+同一主机上的多个 bridge 进程映射同一个文件（建议放在 /dev/shm），
+一个进程拉取的热点盘口数据可直接被其他进程命中。
+"""
+from __future__ import annotations
+
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from typing import Any, Callable
+
+from .cache import DEFAULT_READ_TTLS, CacheEntry
+
+_MAGIC = b"OCPMSHM1"
+# magic, 槽位数, 槽位字节数
+_HEADER = struct.Struct("<8sII")
+_HEADER_SIZE = 64
+# seq, key 哈希, stored_at, expires_at, key 长度, meta 长度, payload 长度, crc32
+_RECORD = struct.Struct("<QQddIIII")
+_SEQ = struct.Struct("<Q")
+
+
+def _key_hash(key: bytes) -> int:
+    # 跨进程稳定的哈希（内置 hash() 每个进程的种子不同）
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") or 1
+
+
+class ShmCache:
+    """
+    直接映射的定长槽位缓存
+
+    - 文件 = 64 字节文件头 + ``slots`` 个 ``slot_bytes`` 字节的槽位，key 按哈希落到固定槽位，冲突时后写覆盖
+    - 读无锁：槽位头部的 seq 为奇数表示正在写入，读前后 seq 不一致或 crc 不匹配时重试
+    - 写入按槽位加 ``fcntl.lockf`` 记录锁，不同槽位的写入互不阻塞
+    - 命中统计按进程计数；超过槽位容量的响应不写入
+    """
+
+    READ_RETRIES = 4
+
+    def __init__(
+        self,
+        path: str,
+        ttls: dict[str, float] | None = None,
+        slots: int = 1024,
+        slot_bytes: int = 64 * 1024,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = os.path.expanduser(path)
+        self.ttls = {**DEFAULT_READ_TTLS, **(ttls or {})}
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.retries = 0
+        self.writes = 0
+        self.oversized = 0
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            self.slots, self.slot_bytes = self._init_file(slots, slot_bytes)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        self._mm = mmap.mmap(self._fd, _HEADER_SIZE + self.slots * self.slot_bytes)
+
+    def _init_file(self, slots: int, slot_bytes: int) -> tuple[int, int]:
+        """已有文件沿用其布局（先创建者决定），否则按参数初始化"""
+        header = os.pread(self._fd, _HEADER.size, 0)
+        if len(header) == _HEADER.size:
+            magic, existing_slots, existing_bytes = _HEADER.unpack(header)
+            if magic == _MAGIC and existing_slots > 0 and existing_bytes > _RECORD.size:
+                return existing_slots, existing_bytes
+        slot_bytes = max(slot_bytes, _RECORD.size + 64)
+        os.ftruncate(self._fd, _HEADER_SIZE + slots * slot_bytes)
+        os.pwrite(self._fd, _HEADER.pack(_MAGIC, slots, slot_bytes), 0)
+        return slots, slot_bytes
+
+    def ttl_for(self, action: str) -> float:
+        return self.ttls.get(action, 0.0)
+
+    def is_cacheable(self, action: str) -> bool:
+        return self.ttl_for(action) > 0
+
+    def _offset(self, key_hash: int) -> int:
+        return _HEADER_SIZE + (key_hash % self.slots) * self.slot_bytes
+
+    def get(self, key: str) -> CacheEntry | None:
+        entry = self._read(key.encode("utf-8"))
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def _read(self, key: bytes) -> CacheEntry | None:
+        key_hash = _key_hash(key)
+        offset = self._offset(key_hash)
+        limit = self.slot_bytes - _RECORD.size
+        for attempt in range(self.READ_RETRIES):
+            if attempt:
+                self.retries += 1
+            seq, stored_hash, stored_at, expires_at, key_len, meta_len, payload_len, crc = _RECORD.unpack_from(
+                self._mm, offset
+            )
+            if seq & 1:
+                continue
+            if seq == 0 or stored_hash != key_hash:
+                return None
+            size = key_len + meta_len + payload_len
+            if size > limit:
+                continue
+            start = offset + _RECORD.size
+            body = self._mm[start:start + size]
+            if _SEQ.unpack_from(self._mm, offset)[0] != seq or zlib.crc32(body) != crc:
+                continue
+            if body[:key_len] != key or expires_at <= self._clock():
+                return None
+            return CacheEntry(
+                action=key.split(b"\x1f", 1)[0].decode("utf-8"),
+                payload=body[key_len + meta_len:].decode("utf-8"),
+                meta=json.loads(body[key_len:key_len + meta_len]),
+                stored_at=stored_at,
+                expires_at=expires_at,
+            )
+        return None
+
+    def put_payload(
+        self,
+        key: str,
+        action: str,
+        payload: str,
+        meta: dict[str, Any],
+        max_ttl: float | None = None,
+    ) -> None:
+        ttl = self.ttl_for(action)
+        if max_ttl is not None:
+            ttl = min(ttl, max_ttl)
+        if ttl <= 0:
+            return
+        key_bytes = key.encode("utf-8")
+        meta_bytes = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        payload_bytes = payload.encode("utf-8")
+        body = b"".join((key_bytes, meta_bytes, payload_bytes))
+        if _RECORD.size + len(body) > self.slot_bytes:
+            self.oversized += 1
+            return
+
+        key_hash = _key_hash(key_bytes)
+        offset = self._offset(key_hash)
+        now = self._clock()
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self.slot_bytes, offset)
+            try:
+                seq = _SEQ.unpack_from(self._mm, offset)[0]
+                # 奇数表示上一个写入方中途退出，直接跳到下一个奇数
+                writing = seq + 2 if seq & 1 else seq + 1
+                _SEQ.pack_into(self._mm, offset, writing)
+                start = offset + _RECORD.size
+                self._mm[start:start + len(body)] = body
+                _RECORD.pack_into(
+                    self._mm,
+                    offset,
+                    writing,
+                    key_hash,
+                    now,
+                    now + ttl,
+                    len(key_bytes),
+                    len(meta_bytes),
+                    len(payload_bytes),
+                    zlib.crc32(body),
+                )
+                _SEQ.pack_into(self._mm, offset, writing + 1)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_bytes, offset)
+        self.writes += 1
+
+    def remaining_ttl(self, entry: CacheEntry) -> float:
+        return max(entry.expires_at - self._clock(), 0.0)
+
+    def age_ms(self, entry: CacheEntry) -> int:
+        return int((self._clock() - entry.stored_at) * 1000)
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "path": self.path,
+            "pid": os.getpid(),
+            "slots": self.slots,
+            "slot_bytes": self.slot_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "retries": self.retries,
+            "writes": self.writes,
+            "oversized": self.oversized,
+        }
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
@@ -0,0 +1,80 @@
+"""
+相同只读请求的在途合并（single-flight）
+"""
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from .deadline import Deadline
+
+
+class _Call:
+    def __init__(self, task: asyncio.Task[dict[str, Any]], deadline: "Deadline | None") -> None:
+        self.task = task
+        self.waiters = 0
+        self.deadline = deadline
+
+
+class SingleFlight:
+    """
+    同一 key 的并发调用只执行一次，所有等待方共享结果
+
+    - 共享调用在独立 task 中执行，单个等待方被取消不影响其他等待方
+    - 所有等待方都取消时才取消共享调用
+    - 最后一个取回结果的等待方拿到原始对象，其余拿到深拷贝，互不影响
+    - 发起方传入的 ``deadline`` 由共享调用使用；后加入的等待方把它延长到自己的截止时间，
+      没有 deadline 的等待方使其不再限时
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, _Call] = {}
+        self.leaders = 0
+        self.followers = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[dict[str, Any]]],
+        deadline: "Deadline | None" = None,
+    ) -> tuple[dict[str, Any], bool]:
+        """执行或加入 key 对应的调用，返回 (结果, 是否为合并得到的结果)"""
+        call = self._calls.get(key)
+        shared = call is not None
+        if call is None:
+            call = _Call(asyncio.ensure_future(fn()), deadline)
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _, k=key, c=call: self._forget(k, c))
+            self.leaders += 1
+        else:
+            self.followers += 1
+            if call.deadline is not None:
+                call.deadline.extend(deadline)
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            call.waiters -= 1
+            if not call.task.done() and call.waiters == 0:
+                call.task.cancel()
+            raise
+        except BaseException:
+            call.waiters -= 1
+            raise
+
+        call.waiters -= 1
+        return (result if call.waiters == 0 else copy.deepcopy(result)), shared
+
+    def stats(self) -> dict[str, int]:
+        return {"leaders": self.leaders, "followers": self.followers, "in_flight": self.in_flight}
+
+    def _forget(self, key: str, call: _Call) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
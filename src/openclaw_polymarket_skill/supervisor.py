@@ -0,0 +1,312 @@
+"""
+多进程 bridge：supervisor + N 个 ``serve-stdio`` worker
+
+supervisor 只解析请求行（用于路由）与响应行开头的 id，响应体原样转发，
+JSON 编解码、校验与 runner 逻辑都在 worker 进程内完成，可用满多个 CPU 核。
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import re
+import sys
+import time
+import zlib
+from typing import Any, Callable
+
+from .metrics import merge_snapshots, render_prometheus, start_textfile_writer, stop_textfile_writer
+from .openclaw_bridge import (
+    MAX_LINE_BYTES,
+    LineWriter,
+    _error_response,
+    _open_stdio_streams,
+    _write_wallet,
+    metrics_result,
+    serve_requests,
+)
+from .settings import SkillSettings
+
+# worker 响应由 dict 字面量 {"id": ..., ...} 序列化而来，id 总在最前
+_RESPONSE_ID = re.compile(rb'^\{"id": (\d+)')
+
+
+def worker_command() -> list[str]:
+    # 显式 --workers 0：worker 必须直接服务请求，不能再按继承的 OPENCLAW_PM_BRIDGE_WORKERS 启动 supervisor
+    return [sys.executable, "-m", "openclaw_polymarket_skill.cli", "serve-stdio", "--workers", "0"]
+
+
+def worker_env() -> dict[str, str]:
+    """worker 进程环境：禁止嵌套 supervisor；指标由 supervisor 汇总后写入，worker 自身不写 textfile"""
+    return {**os.environ, "OPENCLAW_PM_BRIDGE_WORKERS": "0", "OPENCLAW_PM_METRICS_TEXTFILE": ""}
+
+
+class _Pending:
+    __slots__ = ("request_id", "future")
+
+    def __init__(self, request_id: Any, future: asyncio.Future[dict[str, Any]] | None = None) -> None:
+        self.request_id = request_id
+        self.future = future
+
+
+class Worker:
+    """一个 ``serve-stdio`` 子进程及其在途请求"""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: asyncio.subprocess.Process | None = None
+        self.pending: dict[int, _Pending] = {}
+        self.requests = 0
+        self.restarts = 0
+        self.reader_task: asyncio.Task[None] | None = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.returncode is None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "index": self.index,
+            "pid": self.process.pid if self.process else None,
+            "alive": self.alive,
+            "in_flight": len(self.pending),
+            "requests": self.requests,
+            "restarts": self.restarts,
+        }
+
+
+class Supervisor:
+    """
+    把 bridge 请求分发给 N 个 worker 进程
+
+    - 写操作按 ``crc32(wallet) % N`` 固定到同一 worker，worker 内仍按到达顺序串行并由
+      ``WalletLockManager`` 加锁；其余请求发给在途请求最少的 worker
+    - 转发时把请求 id 改写为 supervisor 内部递增 id，响应返回时换回原 id
+    - ``healthcheck`` 广播给所有 worker 并汇总；worker 退出时其在途请求返回 ``WorkerCrashed`` 并自动重启
+    - ``metrics`` 广播给所有 worker，合并各进程的计数器与直方图；textfile 只由 supervisor 写入
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        emit: Callable[[dict[str, Any] | bytes], None],
+        max_in_flight: int = 32,
+        command: list[str] | None = None,
+    ) -> None:
+        self.workers = [Worker(index) for index in range(max(1, workers))]
+        self._emit = emit
+        self._command = command or worker_command()
+        self._slots = asyncio.Semaphore(max(1, max_in_flight) * len(self.workers))
+        self._ids = itertools.count(1)
+        self._outstanding = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._health_tasks: set[asyncio.Task[None]] = set()
+        self._closing = False
+        self._started = time.monotonic()
+
+    async def start(self) -> None:
+        for worker in self.workers:
+            await self._spawn(worker)
+
+    async def _spawn(self, worker: Worker) -> None:
+        worker.process = await asyncio.create_subprocess_exec(
+            *self._command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=MAX_LINE_BYTES,
+            env=worker_env(),
+        )
+        worker.reader_task = asyncio.create_task(self._read_responses(worker))
+
+    def route(self, request: dict[str, Any]) -> Worker:
+        wallet_id = _write_wallet(request)
+        if wallet_id is not None:
+            return self.workers[zlib.crc32(wallet_id.encode("utf-8")) % len(self.workers)]
+        return min(self.workers, key=lambda worker: len(worker.pending))
+
+    async def submit(self, request: dict[str, Any]) -> None:
+        method = request.get("method")
+        if method in {"healthcheck", "metrics"}:
+            if method == "healthcheck":
+                task = asyncio.create_task(self._healthcheck(request.get("id")))
+            else:
+                task = asyncio.create_task(self._metrics(request.get("id"), request.get("format")))
+            self._health_tasks.add(task)
+            task.add_done_callback(self._health_tasks.discard)
+            return
+        await self._slots.acquire()
+        worker = self.route(request)
+        await self._send(worker, request, _Pending(request.get("id")))
+
+    async def _send(self, worker: Worker, request: dict[str, Any], pending: _Pending) -> None:
+        internal_id = next(self._ids)
+        worker.pending[internal_id] = pending
+        worker.requests += 1
+        self._outstanding += 1
+        self._idle.clear()
+        line = json.dumps({**request, "id": internal_id}, ensure_ascii=False).encode("utf-8") + b"\n"
+        process = worker.process
+        if process is None or process.stdin is None or process.returncode is not None or process.stdin.is_closing():
+            self._fail(worker, internal_id)
+            return
+        try:
+            process.stdin.write(line)
+            await process.stdin.drain()
+        except ConnectionError:
+            # worker 正在退出（重启前），读取任务可能已清理过在途请求
+            self._fail(worker, internal_id)
+
+    async def _read_responses(self, worker: Worker) -> None:
+        process = worker.process
+        assert process is not None and process.stdout is not None
+        while True:
+            try:
+                line = await process.stdout.readline()
+            except ValueError:
+                continue
+            if not line:
+                break
+            self._deliver(worker, line)
+        await process.wait()
+        self._fail_pending(worker)
+        if not self._closing:
+            worker.restarts += 1
+            await self._spawn(worker)
+
+    def _deliver(self, worker: Worker, line: bytes) -> None:
+        match = _RESPONSE_ID.match(line)
+        if match is None:
+            try:
+                response = json.loads(line)
+            except ValueError:
+                return
+            internal_id = response.get("id") if isinstance(response, dict) else None
+        else:
+            internal_id = int(match.group(1))
+        pending = worker.pending.pop(internal_id, None) if isinstance(internal_id, int) else None
+        if pending is None:
+            return
+        self._settle()
+        if pending.future is not None:
+            if not pending.future.done():
+                pending.future.set_result(json.loads(line))
+            return
+        self._slots.release()
+        head = b'{"id": ' + json.dumps(pending.request_id, ensure_ascii=False).encode("utf-8")
+        self._emit(head + line[match.end():] if match else line)
+
+    def _settle(self) -> None:
+        self._outstanding -= 1
+        if self._outstanding == 0:
+            self._idle.set()
+
+    def _fail_pending(self, worker: Worker) -> None:
+        for internal_id in list(worker.pending):
+            self._fail(worker, internal_id)
+
+    def _fail(self, worker: Worker, internal_id: int) -> None:
+        item = worker.pending.pop(internal_id, None)
+        if item is None:
+            return
+        self._settle()
+        error = _error_response(item.request_id, "WorkerCrashed", f"worker {worker.index} 异常退出，请求未完成")
+        if item.future is not None:
+            if not item.future.done():
+                item.future.set_result(error)
+            return
+        self._slots.release()
+        self._emit(error)
+
+    async def _broadcast(self, request: dict[str, Any]) -> list[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[dict[str, Any]]] = []
+        for worker in self.workers:
+            future: asyncio.Future[dict[str, Any]] = loop.create_future()
+            futures.append(future)
+            await self._send(worker, dict(request), _Pending(None, future))
+        return list(await asyncio.gather(*futures))
+
+    async def metrics_snapshot(self) -> dict[str, Any]:
+        """合并所有 worker 的指标快照；异常退出的 worker 不计入"""
+        responses = await self._broadcast({"method": "metrics"})
+        return merge_snapshots([response["result"] for response in responses if response.get("ok")])
+
+    async def _metrics(self, request_id: Any, fmt: Any) -> None:
+        result = metrics_result(await self.metrics_snapshot(), fmt)
+        self._emit({"id": request_id, "ok": True, "result": result})
+
+    async def _healthcheck(self, request_id: Any) -> None:
+        responses = await self._broadcast({"method": "healthcheck"})
+        workers = [
+            {**worker.stats(), "result": response.get("result") or response.get("error")}
+            for worker, response in zip(self.workers, responses)
+        ]
+        ok = all(response.get("ok") for response in responses)
+        first = next((response.get("result") for response in responses if response.get("result")), {}) or {}
+        result = {
+            "ok": ok,
+            "version": first.get("version"),
+            "error": None if ok else "部分 worker 不可用",
+            "supervisor": {
+                "workers": workers,
+                "uptime_s": int(time.monotonic() - self._started),
+            },
+        }
+        self._emit({"id": request_id, "ok": ok, "result": result})
+
+    async def drain(self) -> None:
+        while self._health_tasks or not self._idle.is_set():
+            if self._health_tasks:
+                await asyncio.gather(*list(self._health_tasks), return_exceptions=True)
+            await self._idle.wait()
+
+    async def close(self) -> None:
+        self._closing = True
+        for worker in self.workers:
+            process = worker.process
+            if process is not None and process.stdin is not None and not process.stdin.is_closing():
+                process.stdin.close()
+        for worker in self.workers:
+            if worker.reader_task is not None:
+                await worker.reader_task
+
+
+async def serve_supervised(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    workers: int,
+    max_in_flight: int = 32,
+    command: list[str] | None = None,
+    metrics_textfile: str = "",
+    metrics_interval: float = 15.0,
+) -> None:
+    """supervisor 模式的 json-per-line 主循环，EOF 后等待所有转发请求响应再关闭 worker"""
+    output = LineWriter(writer)
+    supervisor = Supervisor(workers, emit=output.write, max_in_flight=max_in_flight, command=command)
+    await supervisor.start()
+
+    async def _render() -> str:
+        return render_prometheus(await supervisor.metrics_snapshot())
+
+    metrics_writer = start_textfile_writer(metrics_textfile, metrics_interval, _render)
+    try:
+        await serve_requests(reader, output, supervisor)
+    finally:
+        await stop_textfile_writer(metrics_writer)
+        await supervisor.close()
+        await output.drain()
+
+
+async def serve_stdio_supervised(workers: int) -> None:
+    settings = SkillSettings.from_env()
+    reader, writer = await _open_stdio_streams(limit=MAX_LINE_BYTES)
+    await serve_supervised(
+        reader,
+        writer,
+        workers,
+        max_in_flight=settings.bridge_max_in_flight,
+        metrics_textfile=settings.metrics_textfile_path,
+        metrics_interval=settings.metrics_textfile_interval_seconds,
+    )
@@ -0,0 +1,158 @@
+"""
+按请求的阶段耗时（``meta.timings``）与 JSONL trace 采样
+
+当前请求的 ``Trace`` 保存在 contextvar 中：runner、执行后端与钱包锁直接调用 ``add`` / ``span``
+记录阶段耗时，无需逐层传参；由请求派生的 task（合并读、对冲、``asyncio.to_thread``）继承同一个 trace。
+未启用 trace 的请求只多一次 contextvar 读取。
+"""
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+from contextlib import nullcontext
+from contextvars import ContextVar, Token
+from typing import Any, Callable, ContextManager
+
+_CURRENT: ContextVar["Trace | None"] = ContextVar("openclaw_pm_trace", default=None)
+_NOOP = nullcontext()
+
+
+class Trace:
+    """
+    一个请求的阶段耗时（秒）
+
+    同名阶段多次发生（重试、对冲、批量中的多个子进程）时累加。
+    """
+
+    __slots__ = ("spans", "started", "returned", "sampled")
+
+    def __init__(self, returned: bool = False, sampled: bool = False) -> None:
+        self.spans: dict[str, float] = {}
+        self.started = time.perf_counter()
+        self.returned = returned
+        self.sampled = sampled
+
+    def add(self, name: str, seconds: float) -> None:
+        self.spans[name] = self.spans.get(name, 0.0) + seconds
+
+    def timings(self) -> dict[str, float]:
+        """以毫秒表示的各阶段耗时，``total_ms`` 为请求总耗时"""
+        result = {f"{name}_ms": round(seconds * 1000, 3) for name, seconds in self.spans.items()}
+        result["total_ms"] = round((time.perf_counter() - self.started) * 1000, 3)
+        return result
+
+
+class _Span:
+    __slots__ = ("trace", "name", "started")
+
+    def __init__(self, trace: Trace, name: str) -> None:
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, *_: Any) -> None:
+        self.trace.add(self.name, time.perf_counter() - self.started)
+
+
+def current() -> Trace | None:
+    return _CURRENT.get()
+
+
+def add(name: str, seconds: float) -> None:
+    """向当前请求的 trace 记录一段耗时，没有 trace 时不做任何事"""
+    trace = _CURRENT.get()
+    if trace is not None:
+        trace.add(name, seconds)
+
+
+def span(name: str) -> ContextManager[None]:
+    """``with span("cache"):`` 记录代码块耗时"""
+    trace = _CURRENT.get()
+    return _NOOP if trace is None else _Span(trace, name)
+
+
+def activate(trace: Trace) -> Token[Trace | None]:
+    return _CURRENT.set(trace)
+
+
+def deactivate(token: Token[Trace | None]) -> None:
+    _CURRENT.reset(token)
+
+
+class TraceSink:
+    """追加写 JSONL；每条记录一次 ``write``（O_APPEND），多个进程可共用同一文件"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd: int | None = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        os.write(self._fd, (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8"))
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class Tracer:
+    """
+    决定请求是否记录 trace
+
+    - ``always=True`` 或请求 ``context.timings=true`` 时在响应 ``meta.timings`` 中返回
+    - 配置了 ``path`` 时按 ``sample_rate`` 采样写入 JSONL（与是否返回无关）
+    """
+
+    def __init__(
+        self,
+        always: bool = False,
+        path: str = "",
+        sample_rate: float = 0.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.always = always
+        self.sink = TraceSink(path) if path else None
+        self.sample_rate = sample_rate
+        self._rng = rng
+
+    def begin(self, requested: bool = False) -> Trace | None:
+        returned = self.always or requested
+        sampled = self.sink is not None and self.sample_rate > 0 and self._rng() < self.sample_rate
+        if not (returned or sampled):
+            return None
+        return Trace(returned=returned, sampled=sampled)
+
+    def finish(self, trace: Trace, action: str, result: dict[str, Any]) -> None:
+        timings = trace.timings()
+        if trace.returned:
+            meta = result.get("meta")
+            if isinstance(meta, dict):
+                meta["timings"] = timings
+            else:
+                result["meta"] = {"timings": timings}
+        if trace.sampled and self.sink is not None:
+            error = result.get("error") or {}
+            meta = result.get("meta") or {}
+            try:
+                self.sink.write(
+                    {
+                        "ts": round(time.time(), 3),
+                        "pid": os.getpid(),
+                        "action": action,
+                        "ok": bool(result.get("ok")),
+                        "error": error.get("type"),
+                        "cache": (meta.get("cache") or {}).get("tier"),
+                        "coalesced": meta.get("coalesced"),
+                        "attempts": meta.get("attempts"),
+                        "timings": timings,
+                    }
+                )
+            except OSError:
+                # trace 写入失败不影响请求结果
+                pass
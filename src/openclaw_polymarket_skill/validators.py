@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from typing import Any, Callable
 
 
 TOKEN_ID_RE = re.compile(r"^([0-9]{1,100}|0x[0-9a-fA-F]{1,64})$")
@@ -13,6 +13,9 @@ SLUG_RE = re.compile(r"^[a-z0-9-]{1,200}$")
 DECIMAL_RE = re.compile(r"^[0-9]+(\.[0-9]+)?$")
 DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
+# (参数名, 参数值) -> 错误信息；值已确认非 None
+ParamCheck = Callable[[str, Any], "str | None"]
+
 
 def validate_presence(params: dict[str, Any], required_params: tuple[str, ...]) -> str | None:
     for key in required_params:
@@ -21,58 +24,135 @@ def validate_presence(params: dict[str, Any], required_params: tuple[str, ...])
     return None
 
 
+def _token(name: str, value: Any) -> str | None:
+    if not TOKEN_ID_RE.fullmatch(str(value)):
+        return f"{name} 必须是纯数字字符串"
+    return None
+
+
+def _condition_id(name: str, value: Any) -> str | None:
+    if not CONDITION_ID_RE.fullmatch(str(value)):
+        return f"{name} 必须是 0x 开头的 64 位十六进制"
+    return None
+
+
+def _pattern(regex: re.Pattern[str], message: str) -> ParamCheck:
+    def _check(_: str, value: Any) -> str | None:
+        return None if regex.fullmatch(str(value)) else message
+
+    return _check
+
+
+def _choice(options: frozenset[str], message: str) -> ParamCheck:
+    def _check(_: str, value: Any) -> str | None:
+        return None if str(value) in options else message
+
+    return _check
+
+
+def _decimal(name: str, value: Any) -> str | None:
+    v = str(value)
+    if not DECIMAL_RE.fullmatch(v):
+        return f"{name} 必须是正十进制数字"
+    numeric = float(v)
+    if numeric <= 0:
+        return f"{name} 必须大于 0"
+    if name == "price" and numeric >= 1:
+        return "price 必须小于 1"
+    return None
+
+
+def _query(_: str, value: Any) -> str | None:
+    v = str(value)
+    if len(v.strip()) == 0 or len(v) > 200:
+        return "query 长度必须在 1-200 之间"
+    return None
+
+
+def _limit(_: str, value: Any) -> str | None:
+    try:
+        numeric = int(str(value))
+    except ValueError:
+        return "limit 必须是整数"
+    if numeric < 1 or numeric > 100:
+        return "limit 范围必须在 1-100"
+    return None
+
+
+def _offset(_: str, value: Any) -> str | None:
+    try:
+        numeric = int(str(value))
+    except ValueError:
+        return "offset 必须是整数"
+    if numeric < 0:
+        return "offset 不能小于 0"
+    return None
+
+
+# 按参数名的校验规则，全局通用；按 action 的组合见 plans.compile_plan
+PARAM_RULES: dict[str, ParamCheck] = {
+    "token_id": _token,
+    "token": _token,
+    "condition_id": _condition_id,
+    "market": _condition_id,
+    "address": _pattern(ADDRESS_RE, "address 必须是 0x 开头的 40 位十六进制"),
+    "order_id": _pattern(ORDER_ID_RE, "order_id 格式不合法"),
+    "order_ids": _pattern(ORDER_IDS_RE, "order_ids 必须是逗号分隔的 order_id 列表"),
+    "asset_type": _choice(frozenset({"collateral", "conditional"}), "asset_type 仅支持 collateral 或 conditional"),
+    "side": _choice(frozenset({"buy", "sell"}), "side 仅支持 buy 或 sell"),
+    "order_type": _choice(frozenset({"GTC", "FOK", "GTD", "FAK"}), "order_type 仅支持 GTC/FOK/GTD/FAK"),
+    "interval": _choice(frozenset({"1m", "1h", "6h", "1d", "1w", "max"}), "interval 仅支持 1m/1h/6h/1d/1w/max"),
+    "price": _decimal,
+    "size": _decimal,
+    "amount": _decimal,
+    "query": _query,
+    "limit": _limit,
+    "offset": _offset,
+    "slug": _pattern(SLUG_RE, "slug 仅支持小写字母、数字和中划线"),
+    "date": _pattern(DATE_RE, "date 必须是 YYYY-MM-DD 格式"),
+}
+
+
 def validate_param(name: str, value: Any) -> str | None:
     if value is None:
         return None
+    check = PARAM_RULES.get(name)
+    return check(name, value) if check is not None else None
 
-    v = str(value)
 
-    if name in {"token_id", "token"} and not TOKEN_ID_RE.fullmatch(v):
-        return f"{name} 必须是纯数字字符串"
-    if name in {"condition_id", "market"} and not CONDITION_ID_RE.fullmatch(v):
-        return f"{name} 必须是 0x 开头的 64 位十六进制"
-    if name == "address" and not ADDRESS_RE.fullmatch(v):
-        return "address 必须是 0x 开头的 40 位十六进制"
-    if name == "order_id" and not ORDER_ID_RE.fullmatch(v):
-        return "order_id 格式不合法"
-    if name == "order_ids" and not ORDER_IDS_RE.fullmatch(v):
-        return "order_ids 必须是逗号分隔的 order_id 列表"
-    if name == "asset_type" and v not in {"collateral", "conditional"}:
-        return "asset_type 仅支持 collateral 或 conditional"
-    if name == "side" and v not in {"buy", "sell"}:
-        return "side 仅支持 buy 或 sell"
-    if name == "order_type" and v not in {"GTC", "FOK", "GTD", "FAK"}:
-        return "order_type 仅支持 GTC/FOK/GTD/FAK"
-    if name == "interval" and v not in {"1m", "1h", "6h", "1d", "1w", "max"}:
-        return "interval 仅支持 1m/1h/6h/1d/1w/max"
-    if name in {"price", "size", "amount"}:
-        if not DECIMAL_RE.fullmatch(v):
-            return f"{name} 必须是正十进制数字"
-        numeric = float(v)
-        if numeric <= 0:
-            return f"{name} 必须大于 0"
-        if name == "price" and numeric >= 1:
-            return "price 必须小于 1"
-    if name == "query":
-        if len(v.strip()) == 0 or len(v) > 200:
-            return "query 长度必须在 1-200 之间"
-    if name == "limit":
-        try:
-            numeric = int(v)
-        except ValueError:
-            return "limit 必须是整数"
-        if numeric < 1 or numeric > 100:
-            return "limit 范围必须在 1-100"
-    if name == "offset":
-        try:
-            numeric = int(v)
-        except ValueError:
-            return "offset 必须是整数"
-        if numeric < 0:
-            return "offset 不能小于 0"
-    if name == "slug" and not SLUG_RE.fullmatch(v):
-        return "slug 仅支持小写字母、数字和中划线"
-    if name == "date" and not DATE_RE.fullmatch(v):
-        return "date 必须是 YYYY-MM-DD 格式"
+def schema_checks(name: str, schema: dict[str, Any], has_rule: bool) -> list[ParamCheck]:
+    """
+    把 action_schemas.json 中单个属性的约束编译为校验函数
 
-    return None
+    ``PARAM_RULES`` 已有规则的参数以规则为准（如 token 同时接受十六进制），只叠加 schema 中
+    按 action 收紧的 ``enum``（如市价单仅支持 FOK/FAK）与布尔类型；其余参数完整套用 schema 约束。
+    """
+    checks: list[ParamCheck] = []
+    if schema.get("type") == "boolean":
+        checks.append(lambda _, value: None if isinstance(value, bool) else f"{name} 必须是布尔值")
+    if "enum" in schema:
+        options = frozenset(str(option) for option in schema["enum"])
+        checks.append(_choice(options, f"{name} 仅支持 {'/'.join(str(option) for option in schema['enum'])}"))
+    if has_rule:
+        return checks
+    if "pattern" in schema:
+        checks.append(_pattern(re.compile(schema["pattern"]), f"{name} 格式不合法"))
+    if "minLength" in schema or "maxLength" in schema:
+        low, high = int(schema.get("minLength", 0)), int(schema.get("maxLength", 1 << 30))
+        checks.append(
+            lambda _, value: None if low <= len(str(value)) <= high else f"{name} 长度必须在 {low}-{high} 之间"
+        )
+    if schema.get("type") == "integer" and ("minimum" in schema or "maximum" in schema):
+        minimum, maximum = schema.get("minimum"), schema.get("maximum")
+
+        def _bounds(_: str, value: Any) -> str | None:
+            try:
+                numeric = int(str(value))
+            except ValueError:
+                return f"{name} 必须是整数"
+            if (minimum is not None and numeric < minimum) or (maximum is not None and numeric > maximum):
+                return f"{name} 范围必须在 {minimum}-{maximum}"
+            return None
+
+        checks.append(_bounds)
+    return checks
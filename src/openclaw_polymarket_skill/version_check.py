@@ -0,0 +1,180 @@
+"""
+polymarket CLI 版本检查：进程内合并 + 按二进制指纹落盘缓存
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shutil
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from .settings import SkillSettings
+
+
+@dataclass(frozen=True)
+class VersionStatus:
+    ok: bool
+    message: str
+    checked_at: float
+
+
+# 进程内共享：同一进程的多个 runner（如 MarketCollector 自建的 runner）复用检查结果
+_MEMO: dict[str, VersionStatus] = {}
+_IN_FLIGHT: dict[str, asyncio.Task[VersionStatus]] = {}
+
+# execute 路径复用二进制指纹的时长（秒）；healthcheck 与显式刷新总是重新计算
+FINGERPRINT_TTL_SECONDS = 5.0
+
+
+def binary_fingerprint(binary: str) -> str | None:
+    """二进制解析后的真实路径 + inode + mtime；找不到二进制时返回 None"""
+    located = shutil.which(binary)
+    if located is None:
+        return None
+    resolved = os.path.realpath(located)
+    try:
+        stat = os.stat(resolved)
+    except OSError:
+        return None
+    return f"{resolved}:{stat.st_ino}:{stat.st_mtime_ns}"
+
+
+class CliVersionCheck:
+    """
+    CLI 版本检查
+
+    - 结果以 (二进制指纹, 期望版本) 为键；替换或升级二进制后指纹变化，自动重新检查
+    - 并发调用合并为一次 ``polymarket --version``
+    - 通过的结果写入 ``version_cache_path``，新进程（如每次 ``execute`` 调用）直接复用
+    - 找不到二进制时不缓存，每次都如实检查
+    - 指纹（``which`` + ``realpath`` + ``stat``）在进程内复用 ``FINGERPRINT_TTL_SECONDS``，
+      避免每个请求都访问文件系统；``status()`` 与 ``refresh()`` 总是重新计算
+    """
+
+    def __init__(
+        self,
+        settings: SkillSettings,
+        check: Callable[[], Awaitable[tuple[bool, str]]],
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.settings = settings
+        self._check = check
+        self._clock = clock
+        self.cache_path = os.path.expanduser(settings.version_cache_path) if settings.version_cache_path else ""
+        self.spawned = 0
+        self._key_memo: str | None = None
+        self._key_at: float | None = None
+
+    def _key(self, fresh: bool = False) -> str | None:
+        now = time.monotonic()
+        if fresh or self._key_at is None or now - self._key_at >= FINGERPRINT_TTL_SECONDS:
+            fingerprint = binary_fingerprint(self.settings.polymarket_bin)
+            self._key_memo = None if fingerprint is None else f"{fingerprint}|{self.settings.cli_version}"
+            self._key_at = now
+        return self._key_memo
+
+    def cached(self, fresh: bool = False) -> VersionStatus | None:
+        """当前二进制已知的检查结果（进程内优先，其次磁盘）"""
+        key = self._key(fresh)
+        if key is None:
+            return None
+        status = _MEMO.get(key)
+        if status is None:
+            status = self._load(key)
+            if status is not None:
+                _MEMO[key] = status
+        return status
+
+    async def ensure(self) -> VersionStatus:
+        """execute 前调用：已知通过时不再启动子进程，否则执行（合并的）检查"""
+        status = self.cached()
+        if status is not None and status.ok:
+            return status
+        return await self.refresh()
+
+    async def status(self) -> tuple[VersionStatus, bool]:
+        """
+        healthcheck 用：返回 (状态, 是否来自缓存)
+
+        有缓存时立即返回，超过 ``version_check_ttl_seconds`` 的结果在后台刷新。
+        """
+        status = self.cached(fresh=True)
+        if status is None:
+            return await self.refresh(), False
+        if self._clock() - status.checked_at >= self.settings.version_check_ttl_seconds:
+            self.refresh_in_background()
+        return status, True
+
+    async def refresh(self) -> VersionStatus:
+        return await asyncio.shield(self._start())
+
+    def refresh_in_background(self) -> None:
+        self._start()
+
+    def _start(self) -> asyncio.Task[VersionStatus]:
+        """启动或加入同一键的在途检查"""
+        key = self._key(fresh=True)
+        flight_key = key or f"instance:{id(self)}"
+        task = _IN_FLIGHT.get(flight_key)
+        if task is not None and task.get_loop() is not asyncio.get_running_loop():
+            # 上一个事件循环（如上一次 asyncio.run）遗留的任务不可复用
+            task = None
+        if task is None:
+            task = asyncio.ensure_future(self._run(key))
+            _IN_FLIGHT[flight_key] = task
+            task.add_done_callback(lambda done, k=flight_key: _IN_FLIGHT.pop(k) if _IN_FLIGHT.get(k) is done else None)
+        return task
+
+    async def _run(self, key: str | None) -> VersionStatus:
+        self.spawned += 1
+        ok, message = await self._check()
+        status = VersionStatus(ok=ok, message=message, checked_at=self._clock())
+        if key is not None:
+            _MEMO[key] = status
+            if ok:
+                self._store(key, status)
+        return status
+
+    def _load(self, key: str) -> VersionStatus | None:
+        if not self.cache_path:
+            return None
+        try:
+            with open(self.cache_path, encoding="utf-8") as handle:
+                entry = json.load(handle).get(key)
+        except (OSError, ValueError, AttributeError):
+            return None
+        if not isinstance(entry, dict):
+            return None
+        return VersionStatus(
+            ok=bool(entry.get("ok")),
+            message=str(entry.get("message")),
+            checked_at=float(entry.get("checked_at", 0)),
+        )
+
+    def _store(self, key: str, status: VersionStatus) -> None:
+        if not self.cache_path:
+            return
+        try:
+            with open(self.cache_path, encoding="utf-8") as handle:
+                entries: dict[str, Any] = json.load(handle)
+            if not isinstance(entries, dict):
+                entries = {}
+        except (OSError, ValueError):
+            entries = {}
+        # 只保留同一路径的最新指纹，避免升级多次后文件无限增长
+        path = key.rsplit("|", 1)[0].rsplit(":", 2)[0]
+        entries = {name: value for name, value in entries.items() if name.rsplit("|", 1)[0].rsplit(":", 2)[0] != path}
+        entries[key] = {"ok": status.ok, "message": status.message, "checked_at": status.checked_at}
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temporary = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as handle:
+                json.dump(entries, handle, ensure_ascii=False)
+            os.replace(temporary, self.cache_path)
+        except OSError:
+            pass
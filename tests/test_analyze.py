@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from openclaw_polymarket_skill.analyze_models import AnalysisResult, MarketSnapshot, TokenData
+from openclaw_polymarket_skill.deadline import Deadline
 from openclaw_polymarket_skill.market_collector import MarketCollector, _extract_float
 from openclaw_polymarket_skill.settings import SkillSettings
 
@@ -144,7 +145,12 @@ def test_collector_empty_search_result(no_version_check_settings: SkillSettings)
     """搜索返回空列表时，snapshot 应正常但无 token 数据"""
     collector = MarketCollector(settings=no_version_check_settings)
 
-    async def fake_execute(action: str, params: dict[str, Any] | None = None, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def fake_execute(
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
         if action == "markets_search":
             return _make_ok_result({"markets": []})
         if action == "events_list":
@@ -163,7 +169,12 @@ def test_collector_search_failure_records_error(no_version_check_settings: Skill
     """搜索失败时，fetch_errors 应记录错误但不抛异常"""
     collector = MarketCollector(settings=no_version_check_settings)
 
-    async def fake_execute(action: str, params: dict[str, Any] | None = None, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def fake_execute(
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
         if action == "markets_search":
             return _make_fail_result("network error")
         if action == "events_list":
@@ -181,7 +192,12 @@ def test_collector_collects_token_data(no_version_check_settings: SkillSettings)
     collector = MarketCollector(settings=no_version_check_settings)
     call_count: dict[str, int] = {}
 
-    async def fake_execute(action: str, params: dict[str, Any] | None = None, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def fake_execute(
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
         call_count[action] = call_count.get(action, 0) + 1
         if action == "markets_search":
             return _make_ok_result({
@@ -218,7 +234,12 @@ def test_collector_partial_token_failure(no_version_check_settings: SkillSetting
     """部分 token action 失败时，其他数据仍能采集，错误记录到 fetch_errors"""
     collector = MarketCollector(settings=no_version_check_settings)
 
-    async def fake_execute(action: str, params: dict[str, Any] | None = None, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def fake_execute(
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
         if action == "markets_search":
             return _make_ok_result({
                 "markets": [{"conditionId": "0xm", "question": "Q?", "clobTokenIds": ["tok1"]}]
@@ -250,7 +271,12 @@ def test_collector_events_failure_non_blocking(no_version_check_settings: SkillS
     """events_list 失败不应阻塞整体流程"""
     collector = MarketCollector(settings=no_version_check_settings)
 
-    async def fake_execute(action: str, params: dict[str, Any] | None = None, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def fake_execute(
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
         if action == "markets_search":
             return _make_ok_result({"markets": []})
         if action == "events_list":
@@ -268,7 +294,12 @@ def test_collector_actions_called_count(no_version_check_settings: SkillSettings
     """actions_called 应等于 1(search) + 4*token_count + 1(events)"""
     collector = MarketCollector(settings=no_version_check_settings)
 
-    async def fake_execute(action: str, params: dict[str, Any] | None = None, context: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def fake_execute(
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
         if action == "markets_search":
             return _make_ok_result({
                 "markets": [{"conditionId": "m1", "question": "Q?", "clobTokenIds": ["t1", "t2"]}]
@@ -285,6 +316,30 @@ def test_collector_actions_called_count(no_version_check_settings: SkillSettings
     assert snap.actions_called == 10
 
 
+def test_collector_passes_deadline_to_every_call(no_version_check_settings: SkillSettings) -> None:
+    collector = MarketCollector(settings=no_version_check_settings)
+    deadline = Deadline.after_ms(5000)
+    seen: list[tuple[str, Deadline | None]] = []
+
+    async def fake_execute(
+        action: str,
+        params: dict[str, Any] | None = None,
+        context: dict[str, Any] | None = None,
+        deadline: Deadline | None = None,
+    ) -> dict[str, Any]:
+        seen.append((action, deadline))
+        if action == "markets_search":
+            return _make_ok_result({
+                "markets": [{"conditionId": "m1", "question": "Q?", "clobTokenIds": ["t1"]}]
+            })
+        return _make_ok_result({})
+
+    collector._runner.execute = fake_execute  # type: ignore[method-assign]
+    asyncio.run(collector.collect("q", deadline=deadline))
+    assert len(seen) == 6
+    assert all(passed is deadline for _, passed in seen)
+
+
 # ---------------------------------------------------------------------------
 # SkillSettings Claude 字段测试
 # ---------------------------------------------------------------------------
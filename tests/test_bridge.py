@@ -1,6 +1,18 @@
 import asyncio
+import json
+import os
+import socket
 
-from openclaw_polymarket_skill.openclaw_bridge import handle_request
+from openclaw_polymarket_skill.daemon_client import forward
+from openclaw_polymarket_skill.openclaw_bridge import (
+    RequestDispatcher,
+    _parse_line,
+    handle_request,
+    serve_streams,
+    start_socket_server,
+)
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
 
 
 class FakeRunner:
@@ -45,3 +57,252 @@ def test_bridge_invalid_method() -> None:
     response = asyncio.run(handle_request(FakeRunner(), {"id": "x", "method": "unknown"}))
     assert response["ok"] is False
     assert response["error"]["code"] == "UnsupportedMethod"
+
+
+class SlowFakeRunner(FakeRunner):
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.started: list[str] = []
+
+    async def execute(self, action, params=None, context=None):  # type: ignore[no-untyped-def]
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.started.append((params or {}).get("tag", action))
+        try:
+            await asyncio.sleep(self.delays.get(action, 0))
+        finally:
+            self.active -= 1
+        return await super().execute(action, params, context)
+
+
+def _run_dispatcher(runner, requests, max_in_flight=32):  # type: ignore[no-untyped-def]
+    responses: list[dict] = []
+
+    async def _main() -> None:
+        dispatcher = RequestDispatcher(runner, emit=responses.append, max_in_flight=max_in_flight)
+        for request in requests:
+            await dispatcher.submit(request)
+        await dispatcher.drain()
+
+    asyncio.run(_main())
+    return responses
+
+
+def test_dispatcher_responds_out_of_order() -> None:
+    runner = SlowFakeRunner({"clob_price_history": 0.2, "clob_midpoint": 0.0})
+    responses = _run_dispatcher(
+        runner,
+        [
+            {"id": "slow", "action": "clob_price_history", "params": {"token_id": "1"}},
+            {"id": "fast", "action": "clob_midpoint", "params": {"token_id": "1"}},
+        ],
+    )
+    assert [r["id"] for r in responses] == ["fast", "slow"]
+    assert runner.peak == 2
+
+
+def test_dispatcher_respects_max_in_flight() -> None:
+    runner = SlowFakeRunner({"clob_book": 0.02})
+    requests = [{"id": str(i), "action": "clob_book", "params": {"token_id": "1"}} for i in range(10)]
+    responses = _run_dispatcher(runner, requests, max_in_flight=3)
+    assert len(responses) == 10
+    assert runner.peak == 3
+
+
+def test_dispatcher_keeps_wallet_write_order() -> None:
+    runner = SlowFakeRunner({"clob_create_order": 0.05, "clob_cancel": 0.0})
+    context = {"wallet_id": "w1"}
+    responses = _run_dispatcher(
+        runner,
+        [
+            {"id": "a", "action": "clob_create_order", "params": {"tag": "a"}, "context": context},
+            {"id": "b", "action": "clob_cancel", "params": {"tag": "b"}, "context": context},
+            {"id": "c", "action": "clob_cancel", "params": {"tag": "c"}, "context": {"wallet_id": "w2"}},
+        ],
+    )
+    assert runner.started.index("a") < runner.started.index("b")
+    assert [r["id"] for r in responses][:2] == ["c", "a"]
+    assert runner.peak == 2
+
+
+def test_parse_line_rejects_non_object() -> None:
+    request, error = _parse_line("[1, 2]")
+    assert request is None
+    assert error is not None and error["error"]["code"] == "ValidationError"
+    request, error = _parse_line("{bad")
+    assert request is None
+    assert error is not None and error["error"]["code"] == "InvalidJson"
+
+
+class BufferWriter:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    def is_closing(self) -> bool:
+        return False
+
+    async def drain(self) -> None:
+        return None
+
+
+def _serve_lines(runner, lines: list[bytes]) -> tuple[list[dict], BufferWriter]:  # type: ignore[no-untyped-def]
+    writer = BufferWriter()
+
+    async def _main() -> None:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"".join(lines))
+        reader.feed_eof()
+        await serve_streams(runner, reader, writer)  # type: ignore[arg-type]
+
+    asyncio.run(_main())
+    responses = [json.loads(line) for line in b"".join(writer.chunks).splitlines()]
+    return responses, writer
+
+
+def test_serve_streams_handles_eof_and_invalid_lines() -> None:
+    lines = [
+        b'{"id": "1", "method": "healthcheck"}\n',
+        b"\n",
+        b"not json\n",
+        b'{"id": "2", "action": "clob_midpoint", "params": {"token_id": "1"}}',
+    ]
+    responses, _ = _serve_lines(FakeRunner(), lines)
+    by_id = {r["id"]: r for r in responses}
+    assert set(by_id) == {"1", "2", None}
+    assert by_id[None]["error"]["code"] == "InvalidJson"
+    assert by_id["2"]["result"]["action"] == "clob_midpoint"
+
+
+def test_serve_streams_discards_rest_of_oversized_line() -> None:
+    writer = BufferWriter()
+
+    async def _main() -> None:
+        reader = asyncio.StreamReader(limit=64)
+
+        async def _feed() -> None:
+            reader.feed_data(b'{"id": "big", "pad": "' + b"x" * 200)
+            await asyncio.sleep(0.01)
+            reader.feed_data(b"x" * 200)
+            await asyncio.sleep(0.01)
+            reader.feed_data(b'", "method": "healthcheck"}{"id": "smuggled", "method": "healthcheck"}\n')
+            reader.feed_data(b'{"id": "next", "method": "healthcheck"}\n')
+            reader.feed_eof()
+
+        feeder = asyncio.create_task(_feed())
+        await serve_streams(FakeRunner(), reader, writer)  # type: ignore[arg-type]
+        await feeder
+
+    asyncio.run(_main())
+    responses = [json.loads(line) for line in b"".join(writer.chunks).splitlines()]
+    assert [r["id"] for r in responses] == [None, "next"]
+    assert responses[0]["error"]["message"] == "请求行过长"
+
+
+def test_serve_streams_coalesces_writes() -> None:
+    lines = [
+        json.dumps({"id": str(i), "action": "clob_midpoint", "params": {"token_id": "1"}}).encode() + b"\n"
+        for i in range(50)
+    ]
+    responses, writer = _serve_lines(FakeRunner(), lines)
+    assert len(responses) == 50
+    assert len(writer.chunks) < 50
+
+
+def test_bridge_execute_batch_rejects_bad_items() -> None:
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False, batch_max_items=2))
+    for items in (None, [], [{"params": {}}], [{"action": "clob_book"}] * 3):
+        response = asyncio.run(handle_request(runner, {"id": "b", "method": "execute_batch", "items": items}))
+        assert response["ok"] is False
+        assert response["error"]["code"] == "ValidationError"
+
+
+def test_serve_streams_passthrough_splices_cli_output(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    script = tmp_path / "polymarket"
+    script.write_text("""#!/bin/bash
+printf '{\\n  "mid": "0.5",\\n  "name": "测试"\\n}\\n'
+""")
+    script.chmod(0o755)
+    runner = PolymarketSkillRunner(settings=SkillSettings(polymarket_bin=str(script), enforce_cli_version=False))
+    lines = [b'{"id": "1", "action": "clob_midpoint", "params": {"token_id": "1"}}\n']
+    writer = BufferWriter()
+
+    async def _main() -> None:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"".join(lines))
+        reader.feed_eof()
+        await serve_streams(runner, reader, writer, passthrough=True)  # type: ignore[arg-type]
+
+    asyncio.run(_main())
+    output = b"".join(writer.chunks)
+    assert b'"data": {  "mid": "0.5",  "name": "\xe6\xb5\x8b\xe8\xaf\x95"}' in output
+    assert json.loads(output)["result"]["data"] == {"mid": "0.5", "name": "测试"}
+
+    # 非透传调用方（如 CLI、collector）拿到的仍是解析后的对象
+    result = asyncio.run(runner.execute("clob_midpoint", {"token_id": "1"}))
+    assert result["data"] == {"mid": "0.5", "name": "测试"}
+
+
+def test_socket_daemon_serves_concurrent_clients(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    path = str(tmp_path / "pm.sock")
+    runner = SlowFakeRunner({"clob_book": 0.05})
+
+    async def _main() -> list[dict]:
+        server = await start_socket_server(runner, path)  # type: ignore[arg-type]
+        async with server:
+            requests = [{"id": str(i), "action": "clob_book", "params": {"token_id": "1"}} for i in range(4)]
+            return await asyncio.gather(*(asyncio.to_thread(forward, path, request, 5) for request in requests))
+
+    responses = asyncio.run(_main())
+    assert sorted(r["id"] for r in responses) == ["0", "1", "2", "3"]
+    assert all(r["ok"] for r in responses)
+    assert runner.peak > 1
+
+
+def test_forward_falls_back_when_daemon_is_absent(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    path = tmp_path / "pm.sock"
+    assert forward(str(path), {"id": "1", "method": "healthcheck"}, 1) is None
+
+    # 遗留的 socket 文件（daemon 已退出）同样回退，并在下次启动 daemon 时被清理
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    assert forward(str(path), {"id": "1", "method": "healthcheck"}, 1) is None
+
+    async def _main() -> dict:
+        server = await start_socket_server(FakeRunner(), str(path))  # type: ignore[arg-type]
+        async with server:
+            return await asyncio.to_thread(forward, str(path), {"id": "h", "method": "healthcheck"}, 5)
+
+    assert asyncio.run(_main())["result"]["ok"] is True
+
+
+def test_socket_is_private_from_creation(tmp_path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    path = str(tmp_path / "pm.sock")
+    original = asyncio.start_unix_server
+    modes: list[int] = []
+
+    async def _recording(*args, **kwargs):  # type: ignore[no-untyped-def]
+        server = await original(*args, **kwargs)
+        # 服务开始监听时（chmod 之前）的权限
+        modes.append(os.stat(path).st_mode & 0o777)
+        return server
+
+    monkeypatch.setattr(asyncio, "start_unix_server", _recording)
+    previous = os.umask(0)
+    try:
+
+        async def _main() -> None:
+            server = await start_socket_server(FakeRunner(), path)  # type: ignore[arg-type]
+            server.close()
+            await server.wait_closed()
+
+        asyncio.run(_main())
+        assert os.umask(0) == 0
+    finally:
+        os.umask(previous)
+    assert modes == [0o600]
@@ -0,0 +1,65 @@
+"""
+读缓存测试
+"""
+from openclaw_polymarket_skill.cache import ReadCache, cache_key
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_key_includes_action_and_args() -> None:
+    assert cache_key("clob_book", ["clob", "book", "1"]) != cache_key("clob_book", ["clob", "book", "2"])
+    assert cache_key("clob_book", ["clob", "book", "1"]) == cache_key("clob_book", ["clob", "book", "1"])
+
+
+def test_cache_respects_per_action_ttl() -> None:
+    clock = FakeClock()
+    cache = ReadCache(ttls={"clob_book": 0.5, "markets_get": 300}, clock=clock)
+    cache.put("book", "clob_book", {"bids": []}, {})
+    cache.put("market", "markets_get", {"id": 1}, {})
+    clock.now = 1.0
+    assert cache.get("book") is None
+    entry = cache.get("market")
+    assert entry is not None and entry.data() == {"id": 1}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_skips_actions_without_ttl() -> None:
+    cache = ReadCache(ttls={"clob_book": 0})
+    cache.put("book", "clob_book", {"bids": []}, {})
+    cache.put("balance", "clob_balance", {"balance": 1}, {})
+    assert cache.stats()["entries"] == 0
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = ReadCache(max_entries=2)
+    cache.put("a", "markets_get", {"id": "a"}, {})
+    cache.put("b", "markets_get", {"id": "b"}, {})
+    assert cache.get("a") is not None
+    cache.put("c", "markets_get", {"id": "c"}, {})
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_bounded_by_bytes() -> None:
+    cache = ReadCache(max_bytes=100)
+    cache.put("a", "markets_get", "x" * 60, {})
+    cache.put("b", "markets_get", "y" * 60, {})
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] <= 100
+
+
+def test_cache_returns_independent_copies() -> None:
+    cache = ReadCache()
+    cache.put("a", "markets_get", {"tags": ["x"]}, {})
+    entry = cache.get("a")
+    assert entry is not None
+    entry.data()["tags"].append("y")
+    assert entry.data() == {"tags": ["x"]}
@@ -0,0 +1,105 @@
+"""
+按 API 分组的熔断器测试
+"""
+import asyncio
+from pathlib import Path
+
+from openclaw_polymarket_skill.circuit import CircuitBreaker, CircuitBreakers
+from openclaw_polymarket_skill.executor import PolymarketExecutor
+from openclaw_polymarket_skill.scheduler import Priority
+from openclaw_polymarket_skill.settings import SkillSettings
+
+NETWORK = {"type": "NetworkError", "message": "connect refused", "retryable": True}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_trips_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_seconds=10, clock=FakeClock())
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record(NETWORK)
+    # 非上游故障类结果清零计数
+    breaker.record({"type": "ValidationError", "retryable": False})
+    for _ in range(3):
+        breaker.record(NETWORK)
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+    stats = breaker.stats()
+    assert stats["trips"] == 1 and stats["rejected"] == 1
+    assert stats["retry_in_ms"] == 10000
+
+
+def test_half_open_lets_single_probe_through() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10, clock=clock)
+    breaker.record(NETWORK)
+    clock.now += 10
+    assert breaker.stats()["state"] == "half_open"
+    assert breaker.allow() is True
+    assert breaker.allow() is False
+    # 探测失败重新打开
+    breaker.record({"type": "TimeoutError", "retryable": True})
+    assert breaker.state == "open"
+    assert breaker.allow() is False
+    clock.now += 10
+    assert breaker.allow() is True
+    # 探测被取消时释放名额
+    breaker.abandon()
+    assert breaker.allow() is True
+    breaker.record(None)
+    assert breaker.state == "closed"
+    assert breaker.allow() and breaker.allow()
+
+
+def test_executor_fails_fast_when_open(tmp_path: Path) -> None:
+    marker = tmp_path / "calls"
+    script = tmp_path / "polymarket"
+    script.write_text(f"#!/bin/bash\necho x >> {marker}\necho 'Error: connection refused' >&2\nexit 1\n")
+    script.chmod(0o755)
+    breakers = CircuitBreakers(failure_threshold=2, reset_seconds=60)
+    executor = PolymarketExecutor(SkillSettings(polymarket_bin=str(script)), circuit_breakers=breakers)
+
+    async def main() -> None:
+        for _ in range(2):
+            result = await executor.run(["clob", "book", "1"], timeout_seconds=5)
+            assert result.error is not None and result.error["type"] == "NetworkError"
+        result = await executor.run(["clob", "book", "1"], timeout_seconds=5)
+        assert result.error is not None and result.error["type"] == "CircuitOpen"
+        assert result.error["retryable"] is True
+        assert result.meta["circuit"] == "open"
+        # 其他分组不受影响；撤单总是放行
+        other = await executor.run(["markets", "get", "1"], timeout_seconds=5)
+        assert other.error is not None and other.error["type"] == "NetworkError"
+        cancel = await executor.run(["clob", "cancel", "1"], timeout_seconds=5, priority=Priority.CANCEL)
+        assert cancel.error is not None and cancel.error["type"] == "NetworkError"
+
+    asyncio.run(main())
+    assert len(marker.read_text().splitlines()) == 4
+    assert breakers.stats()["clob"]["state"] == "open"
+
+
+def test_adaptive_timeouts_do_not_trip_breaker(tmp_path: Path) -> None:
+    script = tmp_path / "polymarket"
+    script.write_text("#!/bin/bash\nexec sleep 5\n")
+    script.chmod(0o755)
+    breakers = CircuitBreakers(failure_threshold=2, reset_seconds=60)
+    executor = PolymarketExecutor(SkillSettings(polymarket_bin=str(script)), circuit_breakers=breakers)
+
+    async def main() -> None:
+        for _ in range(3):
+            result = await executor.run(["clob", "book", "1"], timeout_seconds=0.1, timeout_source="adaptive")
+            assert result.error is not None and result.error["type"] == "TimeoutError"
+            assert result.meta["timeout_source"] == "adaptive"
+        assert breakers.stats()["clob"]["state"] == "closed"
+        for _ in range(2):
+            await executor.run(["clob", "book", "1"], timeout_seconds=0.1, timeout_source="static")
+        assert breakers.stats()["clob"]["state"] == "open"
+
+    asyncio.run(main())
@@ -0,0 +1,162 @@
+"""
+CLI 入口测试：预生成的 list-actions 输出与按子命令延迟导入
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from openclaw_polymarket_skill.action_catalog import LIST_ACTIONS_JSON, PUBLIC_READ_ACTIONS
+from openclaw_polymarket_skill.actions import ACTION_REGISTRY, action_list
+from openclaw_polymarket_skill.models import ActionCategory
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+# 运行子命令后把 sys.modules 写到 stderr 最后一行
+_PROBE = """
+import json, runpy, sys
+sys.argv = ["openclaw-polymarket-skill", *sys.argv[1:]]
+try:
+    runpy.run_module("openclaw_polymarket_skill.cli", run_name="__main__")
+except SystemExit:
+    pass
+sys.stderr.write("\\n" + json.dumps(sorted(sys.modules)))
+"""
+
+ANALYZE_ONLY = {
+    "anthropic",
+    "openclaw_polymarket_skill.claude_client",
+    "openclaw_polymarket_skill.market_collector",
+    "openclaw_polymarket_skill.report_builder",
+}
+
+
+def _imported_modules(args: list[str], tmp_path: Path, bin_path: str) -> set[str]:
+    env = dict(os.environ)
+    env.update(
+        {
+            "PYTHONPATH": str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", ""),
+            "OPENCLAW_PM_BIN": bin_path,
+            "OPENCLAW_PM_ENFORCE_VERSION": "false",
+            "OPENCLAW_PM_SOCKET": str(tmp_path / "absent.sock"),
+        }
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=30,
+    )
+    return set(json.loads(completed.stderr.rsplit("\n", 1)[-1]))
+
+
+def test_precomputed_action_list_matches_registry() -> None:
+    """ACTION_REGISTRY 变更后需运行 scripts/gen_action_catalog.py 重新生成"""
+    assert LIST_ACTIONS_JSON == json.dumps({"ok": True, "actions": action_list()}, ensure_ascii=False)
+    assert PUBLIC_READ_ACTIONS == {name for name, spec in ACTION_REGISTRY.items() if spec.category == ActionCategory.READ}
+
+
+def test_list_actions_skips_runner(tmp_path: Path, mock_polymarket_bin: str) -> None:
+    modules = _imported_modules(["list-actions"], tmp_path, mock_polymarket_bin)
+    assert "openclaw_polymarket_skill" in modules
+    assert "openclaw_polymarket_skill.runner" not in modules
+    assert "openclaw_polymarket_skill.actions" not in modules
+    assert "asyncio" not in modules
+
+
+@pytest.mark.parametrize("extra", [[], ["--no-daemon"]])
+def test_execute_skips_analyze_dependencies(tmp_path: Path, mock_polymarket_bin: str, extra: list[str]) -> None:
+    args = ["execute", "--action", "clob_midpoint", "--params", '{"token_id": "1"}', *extra]
+    modules = _imported_modules(args, tmp_path, mock_polymarket_bin)
+    assert "openclaw_polymarket_skill.runner" in modules
+    assert not modules & ANALYZE_ONLY
+    assert "openclaw_polymarket_skill.disk_cache" not in modules
+    assert "openclaw_polymarket_skill.http_executor" not in modules
+
+
+class _FakeDaemon:
+    """记录收到的请求并回复固定结果的 Unix socket"""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.requests: list[dict] = []
+        self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.server.bind(str(path))
+        self.server.listen()
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            with conn:
+                request = json.loads(conn.makefile("rb").readline())
+                self.requests.append(request)
+                conn.sendall(b'{"id": "cli", "ok": true, "result": {"ok": true, "from": "daemon"}}\n')
+
+    def close(self) -> None:
+        self.server.close()
+
+
+def _run_cli(args: list[str], socket_path: Path, bin_path: str) -> dict:
+    env = dict(os.environ)
+    env.update(
+        {
+            "PYTHONPATH": str(SRC_DIR) + os.pathsep + env.get("PYTHONPATH", ""),
+            "OPENCLAW_PM_BIN": bin_path,
+            "OPENCLAW_PM_ENFORCE_VERSION": "false",
+            "OPENCLAW_PM_ALLOW_TRADING": "false",
+            "OPENCLAW_PM_SOCKET": str(socket_path),
+        }
+    )
+    completed = subprocess.run(
+        [sys.executable, "-m", "openclaw_polymarket_skill.cli", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=30,
+    )
+    return json.loads(completed.stdout)
+
+
+def test_execute_forwards_only_public_reads(tmp_path: Path, mock_polymarket_bin: str) -> None:
+    daemon = _FakeDaemon(tmp_path / "daemon.sock")
+    try:
+        read = _run_cli(
+            ["execute", "--action", "clob_midpoint", "--params", '{"token_id": "1"}'], daemon.path, mock_polymarket_bin
+        )
+        write = _run_cli(
+            [
+                "execute",
+                "--action",
+                "clob_create_order",
+                "--params",
+                '{"token": "1", "side": "buy", "price": "0.5", "size": "1"}',
+                "--context",
+                '{"private_key": "0xcaller"}',
+            ],
+            daemon.path,
+            mock_polymarket_bin,
+        )
+        auth_read = _run_cli(
+            ["execute", "--action", "clob_balance", "--params", '{"asset_type": "collateral"}'],
+            daemon.path,
+            mock_polymarket_bin,
+        )
+    finally:
+        daemon.close()
+
+    assert read == {"ok": True, "from": "daemon"}
+    # 写操作与鉴权读在本进程按调用方配置执行（此处交易未启用），daemon 没有收到
+    assert write["error"]["type"] == "TradingDisabledError"
+    assert "from" not in auth_read
+    assert [request["action"] for request in daemon.requests] == ["clob_midpoint"]
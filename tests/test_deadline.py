@@ -0,0 +1,220 @@
+"""
+请求级 deadline 传递测试
+"""
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from openclaw_polymarket_skill.circuit import CircuitBreakers
+from openclaw_polymarket_skill.deadline import Deadline
+from openclaw_polymarket_skill.executor import CommandResult, PolymarketExecutor, spawn_timeout
+from openclaw_polymarket_skill.locks import acquire_within
+from openclaw_polymarket_skill.openclaw_bridge import handle_request
+from openclaw_polymarket_skill.retry import RetryBudget
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.scheduler import Priority, SubprocessScheduler
+from openclaw_polymarket_skill.settings import SkillSettings
+
+PRIVATE_KEY = "0x" + "7f3a9c" * 10 + "1b2c"
+
+
+class SlowExecutor:
+    def __init__(self, delay: float, error: dict | None = None) -> None:
+        self.delay = delay
+        self.error = error
+        self.calls: list[dict] = []
+
+    async def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls.append(kwargs)
+        await asyncio.sleep(self.delay)
+        if self.error is not None:
+            return CommandResult(ok=False, data=None, error=self.error, meta={"duration_ms": 1})
+        return CommandResult(ok=True, data={"ok": True}, error=None, meta={"duration_ms": 1})
+
+    async def check_cli_version(self):  # type: ignore[no-untyped-def]
+        return True, "0.1.4"
+
+
+def _runner(executor: SlowExecutor, **overrides) -> PolymarketSkillRunner:  # type: ignore[no-untyped-def]
+    settings = SkillSettings(enforce_cli_version=False, read_cache_enabled=False, **overrides)
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = executor  # type: ignore[assignment]
+    runner.retry_budget = RetryBudget()
+    return runner
+
+
+def test_context_deadline_parsing() -> None:
+    assert Deadline.from_context({}) is None
+    for bad in (0, -5, "100", True, 1.5):
+        with pytest.raises(ValueError):
+            Deadline.from_context({"deadline_ms": bad})
+    deadline = Deadline.from_context({"deadline_ms": 500}, received_at=time.monotonic() - 1)
+    assert deadline is not None and deadline.expired()
+    later = Deadline.after_ms(10_000)
+    assert later.earliest(deadline) is deadline
+    assert deadline.earliest(None) is deadline
+
+
+def test_spawn_timeout_clamps_reads_only() -> None:
+    deadline = Deadline.after_ms(500)
+    assert spawn_timeout(15, Priority.READ, None) == 15
+    assert spawn_timeout(15, Priority.READ, deadline) <= 0.5
+    # 写操作启动后不按预算截断
+    assert spawn_timeout(15, Priority.WRITE, deadline) == 15
+    assert spawn_timeout(15, Priority.WRITE, Deadline(time.monotonic() - 1)) is None
+
+
+def test_spent_budget_is_rejected_before_executor() -> None:
+    executor = SlowExecutor(0)
+    runner = _runner(executor)
+    result = asyncio.run(runner.execute("events_get", {"id": "1"}, deadline=Deadline(time.monotonic() - 0.01)))
+    assert result["error"]["type"] == "DeadlineExceeded"
+    assert result["error"]["retryable"] is True
+    assert executor.calls == []
+
+    result = asyncio.run(runner.execute("events_get", {"id": "1"}, {"deadline_ms": "soon"}))
+    assert result["error"]["type"] == "ValidationError"
+
+
+def test_read_returns_when_budget_runs_out() -> None:
+    runner = _runner(SlowExecutor(2.0))
+    started = time.monotonic()
+    result = asyncio.run(runner.execute("events_get", {"id": "1"}, {"deadline_ms": 100}))
+    assert time.monotonic() - started < 1.0
+    assert result["error"]["type"] == "DeadlineExceeded"
+    assert result["meta"]["deadline_exceeded"] is True
+
+
+def test_auth_read_passes_deadline_and_skips_retry_beyond_budget() -> None:
+    network = {"type": "NetworkError", "message": "x", "retryable": True}
+    executor = SlowExecutor(0.0, error=network)
+    runner = _runner(executor, retry_initial_delay_seconds=1.0, retry_max_delay_seconds=1.0)
+    result = asyncio.run(runner.execute("clob_balance", {"asset_type": "collateral"}, {"deadline_ms": 200}))
+    assert result["error"]["type"] == "NetworkError"
+    assert result["meta"]["attempts"] == 1
+    assert isinstance(executor.calls[0]["deadline"], Deadline)
+
+
+def test_public_read_stops_retrying_at_budget() -> None:
+    network = {"type": "NetworkError", "message": "x", "retryable": True}
+    for coalescing in (True, False):
+        executor = SlowExecutor(0.0, error=network)
+        runner = _runner(
+            executor,
+            read_coalescing_enabled=coalescing,
+            retry_initial_delay_seconds=1.0,
+            retry_max_delay_seconds=1.0,
+        )
+        result = asyncio.run(runner.execute("events_get", {"id": "1"}, {"deadline_ms": 200}))
+        assert result["error"]["type"] == "NetworkError"
+        assert result["meta"]["attempts"] == 1
+        assert isinstance(executor.calls[0]["deadline"], Deadline)
+
+
+def test_coalesced_read_uses_latest_waiter_deadline() -> None:
+    executor = SlowExecutor(0.05)
+    runner = _runner(executor)
+    short, long = Deadline.after_ms(100), Deadline.after_ms(5000)
+
+    async def main() -> None:
+        await asyncio.gather(
+            runner.execute("events_get", {"id": "1"}, deadline=short),
+            runner.execute("events_get", {"id": "1"}, deadline=long),
+        )
+
+    asyncio.run(main())
+    assert len(executor.calls) == 1
+    shared = executor.calls[0]["deadline"]
+    assert shared is not short and shared.expires_at == long.expires_at
+    assert short.remaining() < 0.1
+
+
+def test_write_gives_up_waiting_for_wallet_lock() -> None:
+    executor = SlowExecutor(0.5)
+    runner = _runner(executor, allow_trading=True, dry_run=False)
+    context = {"private_key": PRIVATE_KEY, "wallet_id": "w1"}
+
+    async def main() -> list[dict]:
+        first = asyncio.create_task(runner.execute("clob_cancel", {"order_id": "a"}, context))
+        await asyncio.sleep(0.05)
+        second = await runner.execute("clob_cancel", {"order_id": "b"}, {**context, "deadline_ms": 100})
+        return [await first, second]
+
+    first, second = asyncio.run(main())
+    assert first["ok"] is True
+    assert second["error"]["type"] == "DeadlineExceeded"
+    assert len(executor.calls) == 1
+
+
+@pytest.mark.parametrize("native_timeout", [True, False])
+def test_lock_wait_timeout_never_leaks_lock(monkeypatch, native_timeout: bool) -> None:  # type: ignore[no-untyped-def]
+    if not native_timeout:
+        monkeypatch.delattr(asyncio, "timeout", raising=False)
+
+    async def main() -> None:
+        for offset in (-0.002, -0.001, 0.0, 0.001, 0.002) * 4:
+            lock = asyncio.Lock()
+            await lock.acquire()
+            asyncio.get_running_loop().call_later(0.01 + offset, lock.release)
+            try:
+                await acquire_within(lock, 0.01)
+            except asyncio.TimeoutError:
+                await asyncio.sleep(0.01)
+                assert not lock.locked()
+            else:
+                assert lock.locked()
+                lock.release()
+
+    asyncio.run(main())
+
+
+def test_executor_clamps_subprocess_and_queue_waits(tmp_path: Path) -> None:
+    script = tmp_path / "polymarket"
+    script.write_text("#!/bin/bash\nexec sleep 5\n")
+    script.chmod(0o755)
+    breakers = CircuitBreakers(failure_threshold=1)
+    executor = PolymarketExecutor(
+        SkillSettings(polymarket_bin=str(script)),
+        scheduler=SubprocessScheduler(max_concurrency=1),
+        circuit_breakers=breakers,
+    )
+
+    async def main() -> list[CommandResult]:
+        return await asyncio.gather(
+            executor.run(["clob", "book", "1"], timeout_seconds=15, deadline=Deadline.after_ms(300)),
+            executor.run(["clob", "book", "2"], timeout_seconds=15, deadline=Deadline.after_ms(200)),
+        )
+
+    started = time.monotonic()
+    first, queued = asyncio.run(main())
+    assert time.monotonic() - started < 2.0
+    assert first.error is not None and first.error["type"] == "DeadlineExceeded"
+    assert first.meta["timed_out"] is True
+    # 排队等待超过预算，未启动子进程
+    assert queued.error is not None and queued.error["type"] == "DeadlineExceeded"
+    assert "exit_code" not in queued.meta
+    # 预算导致的超时不计入熔断
+    assert breakers.stats()["clob"]["state"] == "closed"
+
+
+def test_batch_uses_earliest_of_batch_and_context_deadlines() -> None:
+    runner = _runner(SlowExecutor(1.0))
+    items = [{"action": "events_get", "params": {"id": str(i)}} for i in range(2)]
+    result = asyncio.run(runner.execute_batch(items, context={"deadline_ms": 100}, deadline_seconds=5))
+    assert result["meta"]["timed_out"] == 2
+    assert result["meta"]["duration_ms"] < 1000
+    assert all(entry["result"]["error"]["type"] == "DeadlineExceeded" for entry in result["items"])
+
+
+def test_bridge_rejects_invalid_deadline() -> None:
+    runner = _runner(SlowExecutor(0))
+    request = {"id": 1, "action": "events_get", "params": {"id": "1"}, "context": {"deadline_ms": -1}}
+    response = asyncio.run(handle_request(runner, request))
+    assert response["error"]["code"] == "ValidationError"
+
+    received_at = time.monotonic() - 1
+    request["context"] = {"deadline_ms": 500}
+    response = asyncio.run(handle_request(runner, request, received_at=received_at))
+    assert response["result"]["error"]["type"] == "DeadlineExceeded"
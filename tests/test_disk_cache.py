@@ -0,0 +1,85 @@
+"""
+SQLite 持久化缓存测试
+"""
+import asyncio
+from pathlib import Path
+
+from openclaw_polymarket_skill.disk_cache import DiskCache
+from openclaw_polymarket_skill.executor import CommandResult
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingExecutor:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return CommandResult(ok=True, data={"id": "m1"}, error=None, meta={"duration_ms": 5})
+
+    async def check_cli_version(self):  # type: ignore[no-untyped-def]
+        return True, "0.1.4"
+
+
+def test_disk_cache_round_trip_and_ttl(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = DiskCache(str(tmp_path / "cache.db"), clock=clock)
+    cache.put_payload("k", "markets_get", '{"id": "m1"}', {"duration_ms": 5})
+    entry = cache.get("k")
+    assert entry is not None and entry.data() == {"id": "m1"}
+    assert entry.meta == {"duration_ms": 5}
+    clock.now += 3601
+    assert cache.get("k") is None
+
+
+def test_disk_cache_ignores_fast_changing_actions(tmp_path: Path) -> None:
+    cache = DiskCache(str(tmp_path / "cache.db"))
+    cache.put_payload("k", "clob_book", "{}", {})
+    assert cache.stats()["entries"] == 0
+
+
+def test_disk_cache_shared_between_instances(tmp_path: Path) -> None:
+    path = str(tmp_path / "cache.db")
+    DiskCache(path).put_payload("k", "events_get", '{"id": 1}', {})
+    assert DiskCache(path).get("k") is not None
+
+
+def test_disk_cache_prune_and_purge(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = DiskCache(str(tmp_path / "cache.db"), max_bytes=25, clock=clock)
+    cache.put_payload("a", "markets_get", "a" * 10, {})
+    clock.now += 1
+    cache.put_payload("b", "markets_get", "b" * 10, {})
+    clock.now += 1
+    cache.put_payload("c", "events_list", "c" * 10, {})
+    assert cache.prune() == 1
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 20
+    assert cache.purge(action="events_list") == 1
+    assert cache.stats()["by_action"] == {"markets_get": {"entries": 1, "bytes": 10, "expired": 0}}
+
+
+def test_runner_survives_restart_with_disk_cache(tmp_path: Path) -> None:
+    settings = SkillSettings(enforce_cli_version=False, disk_cache_path=str(tmp_path / "cache.db"))
+    first = PolymarketSkillRunner(settings=settings)
+    first.executor = CountingExecutor()
+    asyncio.run(first.execute("markets_get", {"id_or_slug": "btc"}))
+
+    restarted = PolymarketSkillRunner(settings=settings)
+    restarted.executor = CountingExecutor()
+    result = asyncio.run(restarted.execute("markets_get", {"id_or_slug": "btc"}))
+    assert restarted.executor.calls == 0
+    assert result["data"] == {"id": "m1"}
+    assert result["meta"]["cache"]["tier"] == "disk"
+
+    again = asyncio.run(restarted.execute("markets_get", {"id_or_slug": "btc"}))
+    assert again["meta"]["cache"]["tier"] == "memory"
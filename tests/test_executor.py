@@ -0,0 +1,64 @@
+"""
+CLI 执行器输出采集测试
+"""
+import asyncio
+from pathlib import Path
+
+from openclaw_polymarket_skill.executor import PolymarketExecutor, excerpt
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+def _script(tmp_path: Path, body: str) -> str:
+    script = tmp_path / "polymarket"
+    script.write_text(f"#!/bin/bash\n{body}\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+def _executor(binary: str, **overrides: object) -> PolymarketExecutor:
+    return PolymarketExecutor(SkillSettings(polymarket_bin=binary, **overrides), scheduler=None)  # type: ignore[arg-type]
+
+
+def test_excerpt_truncates_on_utf8_boundary() -> None:
+    assert excerpt("short", 16) == "short"
+    truncated = excerpt("测" * 100, 10)
+    assert truncated.startswith("测测测")
+    assert "已截断，共 300 字节" in truncated
+    assert excerpt("x" * 100, 0) == "x" * 100
+
+
+def test_runaway_output_is_killed(tmp_path: Path) -> None:
+    executor = _executor(_script(tmp_path, "exec yes '{\"a\": 1}'"), max_output_bytes=256 * 1024)
+    result = asyncio.run(executor.run(["markets", "list"], timeout_seconds=10))
+
+    assert result.ok is False
+    assert result.error["type"] == "ResponseTooLarge"
+    assert result.meta["duration_ms"] < 5000
+    assert len(result.meta["stdout"].encode()) < 4096 + 100
+
+
+def test_failure_keeps_bounded_excerpts(tmp_path: Path) -> None:
+    body = "head -c 200000 /dev/zero | tr '\\0' 'e' >&2\nexit 1"
+    executor = _executor(_script(tmp_path, body), error_excerpt_bytes=1024)
+    result = asyncio.run(executor.run(["markets", "list"], timeout_seconds=10))
+
+    assert result.ok is False
+    assert len(result.meta["stderr"].encode()) < 1024 + 100
+    assert len(result.error["message"].encode()) < 1024 + 100
+
+
+def test_large_stderr_does_not_block_success(tmp_path: Path) -> None:
+    body = "head -c 500000 /dev/zero | tr '\\0' 'w' >&2\necho '{\"ok\": true}'"
+    executor = _executor(_script(tmp_path, body))
+    result = asyncio.run(executor.run(["markets", "list"], timeout_seconds=10))
+
+    assert result.ok is True
+    assert result.data == {"ok": True}
+    assert len(result.meta["stderr"].encode()) < 4096 + 100
+
+
+def test_chosen_timeout_is_reported_in_meta(tmp_path: Path) -> None:
+    executor = _executor(_script(tmp_path, "echo '{\"ok\": true}'"))
+    result = asyncio.run(executor.run(["markets", "list"], timeout_seconds=2.5))
+    assert result.ok is True
+    assert result.meta["timeout_ms"] == 2500
@@ -0,0 +1,199 @@
+"""
+幂等读请求对冲测试
+"""
+import asyncio
+
+import pytest
+
+from openclaw_polymarket_skill.executor import CommandResult
+from openclaw_polymarket_skill.hedging import Hedger
+from openclaw_polymarket_skill.latency import LatencyTracker
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+def _warm(tracker: LatencyTracker, action: str, seconds: float = 0.01, count: int = 20) -> None:
+    for _ in range(count):
+        tracker.record(action, seconds)
+
+
+class ScriptedCalls:
+    """按调用顺序返回预设 (延迟, 是否成功)，记录被取消的调用"""
+
+    def __init__(self, *script: tuple[float, bool]) -> None:
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled: list[int] = []
+
+    async def __call__(self) -> dict:
+        index = self.calls
+        self.calls += 1
+        delay, ok = self.script[index]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(index)
+            raise
+        if ok:
+            return {"ok": True, "data": index, "meta": {}}
+        return {"ok": False, "error": {"type": "NetworkError", "retryable": True}, "meta": {"call": index}}
+
+
+def test_no_hedge_until_enough_samples() -> None:
+    hedger = Hedger(LatencyTracker(), ("clob_book",), min_samples=20)
+    calls = ScriptedCalls((0.05, True))
+    result = asyncio.run(hedger.run("clob_book", calls))
+    assert calls.calls == 1
+    assert "hedged" not in result["meta"]
+    assert hedger.tracker.count("clob_book") == 1
+
+
+def test_slow_primary_is_hedged_and_loser_cancelled() -> None:
+    hedger = Hedger(LatencyTracker(), ("clob_book",))
+    _warm(hedger.tracker, "clob_book")
+    calls = ScriptedCalls((1.0, True), (0.01, True))
+
+    async def main() -> dict:
+        result = await hedger.run("clob_book", calls)
+        await asyncio.sleep(0)
+        return result
+
+    result = asyncio.run(main())
+    assert result["data"] == 1
+    assert result["meta"] == {"hedged": True, "hedge_won": True}
+    assert calls.cancelled == [0]
+    stats = hedger.stats()["clob_book"]
+    assert stats["hedged"] == 1 and stats["hedge_wins"] == 1
+    assert stats["hedge_rate"] == 1.0
+    assert stats["threshold_ms"] == 10
+
+
+def test_fast_primary_is_not_hedged_and_other_actions_pass_through() -> None:
+    hedger = Hedger(LatencyTracker(), ("clob_book",))
+    _warm(hedger.tracker, "clob_book", seconds=0.5)
+    calls = ScriptedCalls((0.01, True), (0.01, True))
+    result = asyncio.run(hedger.run("clob_book", calls))
+    assert calls.calls == 1
+    assert "hedged" not in result["meta"]
+
+    _warm(hedger.tracker, "markets_get")
+    calls = ScriptedCalls((0.05, True))
+    asyncio.run(hedger.run("markets_get", calls))
+    assert calls.calls == 1
+    assert "markets_get" not in hedger.stats()
+
+
+def test_failed_first_finisher_waits_for_other_call() -> None:
+    hedger = Hedger(LatencyTracker(), ("clob_book",))
+    _warm(hedger.tracker, "clob_book")
+    calls = ScriptedCalls((0.1, True), (0.01, False))
+    result = asyncio.run(hedger.run("clob_book", calls))
+    assert result["ok"] is True
+    assert result["meta"]["hedge_won"] is False
+
+    calls = ScriptedCalls((0.05, False), (0.05, False))
+    result = asyncio.run(hedger.run("clob_book", calls))
+    assert result["ok"] is False
+    assert result["meta"]["call"] == 0
+
+
+class SlowFirstExecutor:
+    """第一次调用卡住，之后的调用立即返回"""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+
+    async def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        if self.calls == 21:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return CommandResult(ok=True, data={"mid": "0.5"}, error=None, meta={"duration_ms": 1})
+
+    async def check_cli_version(self):  # type: ignore[no-untyped-def]
+        return True, "0.1.4"
+
+
+def test_runner_hedges_configured_read_actions() -> None:
+    settings = SkillSettings(enforce_cli_version=False, read_cache_enabled=False, hedge_actions=("clob_midpoint",))
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = SlowFirstExecutor()
+
+    async def main() -> tuple[dict, dict]:
+        for _ in range(20):
+            await runner.execute("clob_midpoint", {"token_id": "1"})
+        result = await runner.execute("clob_midpoint", {"token_id": "1"})
+        await asyncio.sleep(0)
+        return result, await runner.healthcheck()
+
+    result, health = asyncio.run(main())
+    assert result["ok"] is True
+    assert result["meta"]["hedged"] is True
+    assert runner.executor.calls == 22
+    assert runner.executor.cancelled == 1
+    assert health["hedging"]["clob_midpoint"]["hedge_wins"] == 1
+
+
+def test_runner_rejects_hedging_writes() -> None:
+    with pytest.raises(ValueError):
+        PolymarketSkillRunner(settings=SkillSettings(hedge_actions=("clob_create_order",)))
+
+
+def test_samples_exclude_queue_and_rate_limit_waits() -> None:
+    hedger = Hedger(LatencyTracker(), ("clob_book",), min_samples=1)
+
+    async def _queued() -> dict:
+        await asyncio.sleep(0.05)
+        return {"ok": True, "meta": {"duration_ms": 3, "queue_wait_ms": 50}}
+
+    async def _waited() -> dict:
+        await asyncio.sleep(0.05)
+        return {"ok": True, "meta": {"rate_limit_wait_ms": 50}}
+
+    asyncio.run(hedger.run("markets_get", _queued))
+    assert hedger.tracker.percentile("markets_get", 0.5, 1) == 0.003
+    asyncio.run(hedger.run("markets_get", _waited))
+    assert hedger.tracker.percentile("markets_get", 1.0, 1) < 0.03
+
+
+def test_no_hedge_when_saturated() -> None:
+    hedger = Hedger(LatencyTracker(), ("clob_book",))
+    _warm(hedger.tracker, "clob_book")
+    calls = ScriptedCalls((0.1, True), (0.01, True))
+    result = asyncio.run(hedger.run("clob_book", calls, lambda: False))
+    assert calls.calls == 1
+    assert result["data"] == 0
+    assert "hedged" not in result["meta"]
+    assert hedger.stats()["clob_book"]["hedge_skipped"] == 1
+
+
+def test_runner_skips_hedge_for_saturated_or_uncancellable_backends() -> None:
+    from openclaw_polymarket_skill.ratelimit import RateLimiter
+    from openclaw_polymarket_skill.scheduler import SubprocessScheduler
+
+    settings = SkillSettings(enforce_cli_version=False, read_cache_enabled=False, hedge_actions=("clob_midpoint",))
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = SlowFirstExecutor()
+    args = ["clob", "midpoint", "1"]
+    assert runner._can_hedge("clob_midpoint", args) is True
+
+    scheduler = SubprocessScheduler(1)
+    runner.executor.scheduler = scheduler
+    assert runner._can_hedge("clob_midpoint", args) is True
+    asyncio.run(scheduler.acquire())
+    assert runner._can_hedge("clob_midpoint", args) is False
+    scheduler.release()
+
+    limiter = RateLimiter({"clob": 1.0})
+    runner.executor.rate_limiter = limiter
+    assert runner._can_hedge("clob_midpoint", args) is True
+    limiter.buckets["clob"].reserve()
+    assert runner._can_hedge("clob_midpoint", args) is False
+
+    runner.executor = SlowFirstExecutor()
+    runner.executor.cancellable = False
+    assert runner._can_hedge("clob_midpoint", args) is False
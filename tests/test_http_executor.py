@@ -0,0 +1,194 @@
+"""
+HTTP 执行后端测试（本地桩服务器）
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from openclaw_polymarket_skill.actions import ACTION_PLANS
+from openclaw_polymarket_skill.http_executor import HttpExecutor, UnsupportedCommand, map_request
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: list[str] = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.requests.append(self.path)
+        parts = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        if parts.path == "/midpoint":
+            self._reply(200, {"mid": "0.55", "token_id": query.get("token_id")})
+        elif parts.path.startswith("/markets/"):
+            self._reply(200, {"path": parts.path})
+        elif parts.path == "/public-search":
+            self._reply(200, {"q": query.get("q")})
+        elif parts.path == "/book":
+            self._trickle()
+        elif parts.path == "/price":
+            self._reply(429, {"error": "too many requests"})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def _reply(self, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _trickle(self) -> None:
+        """每个字节间隔都短于 socket 超时，但总耗时远超请求预算"""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "100")
+        self.end_headers()
+        try:
+            for _ in range(100):
+                self.wfile.write(b" ")
+                self.wfile.flush()
+                time.sleep(0.05)
+        except OSError:
+            pass
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def stub_url() -> Iterator[str]:
+    _StubHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _settings(url: str, **overrides: object) -> SkillSettings:
+    return SkillSettings(gamma_api_url=url, clob_api_url=url, data_api_url=url, **overrides)
+
+
+def test_map_request_markets_get_by_id_and_slug() -> None:
+    assert map_request("markets_get", {"id_or_slug": "123"}) == ("gamma", "/markets/123", {})
+    assert map_request("markets_get", {"id_or_slug": "will-it-rain"}) == ("gamma", "/markets/slug/will-it-rain", {})
+    assert map_request("clob_price", {"token_id": "tok", "side": "buy"}) == ("clob", "/price", {"token_id": "tok", "side": "buy"})
+    with pytest.raises(UnsupportedCommand):
+        map_request("clob_balance", {})
+
+
+def test_map_request_uses_plan_values_not_argv() -> None:
+    values = ACTION_PLANS["markets_search"].values({"query": "--limit"})
+
+    assert map_request("markets_search", values) == ("gamma", "/public-search", {"q": "--limit", "limit_per_type": "10"})
+
+
+_midpoint = {"action": "clob_midpoint", "params": {"token_id": "tok-1"}}
+
+
+def test_midpoint_over_http(stub_url: str) -> None:
+    executor = HttpExecutor(_settings(stub_url))
+    result = asyncio.run(executor.run(["clob", "midpoint", "tok-1"], timeout_seconds=5, **_midpoint))
+    executor.close()
+
+    assert result.ok is True
+    assert result.data == {"mid": "0.55", "token_id": "tok-1"}
+    assert result.meta["backend"] == "http"
+    assert result.meta["status"] == 200
+
+
+def test_rate_limit_maps_to_retryable_error(stub_url: str) -> None:
+    executor = HttpExecutor(_settings(stub_url))
+    result = asyncio.run(executor.run(
+            ["clob", "price", "tok-1", "--side", "buy"],
+            timeout_seconds=5,
+            action="clob_price",
+            params={"token_id": "tok-1", "side": "buy"},
+        )
+    )
+    executor.close()
+
+    assert result.ok is False
+    assert result.error["type"] == "RateLimitError"
+    assert result.error["retryable"] is True
+
+
+def test_unsupported_command_is_not_sent(stub_url: str) -> None:
+    executor = HttpExecutor(_settings(stub_url))
+    result = asyncio.run(executor.run(["clob", "balance"], timeout_seconds=5, action="clob_balance", params={}))
+
+    assert result.error["type"] == "UnsupportedByBackend"
+    assert _StubHandler.requests == []
+
+
+def test_keep_alive_connection_is_reused(stub_url: str) -> None:
+    executor = HttpExecutor(_settings(stub_url, max_concurrent_processes=0))
+
+    async def main() -> None:
+        for ident in ("1", "2", "3"):
+            result = await executor.run(
+                ["markets", "get", ident], timeout_seconds=5, action="markets_get", params={"id_or_slug": ident}
+            )
+            assert result.data == {"path": f"/markets/{ident}"}
+
+    asyncio.run(main())
+    executor.close()
+
+    assert executor.pools["gamma"].created == 1
+    assert len(_StubHandler.requests) == 3
+
+
+def test_runner_routes_read_actions_to_http_backend(stub_url: str) -> None:
+    runner = PolymarketSkillRunner(_settings(stub_url, executor_backends={"read": "http"}, read_cache_enabled=False))
+    result = asyncio.run(runner.execute("clob_midpoint", {"token_id": "9001"}, {}))
+
+    assert result["ok"] is True
+    assert result["data"]["token_id"] == "9001"
+    assert result["meta"]["backend"] == "http"
+
+
+def test_runner_sends_dash_prefixed_query_as_value(stub_url: str) -> None:
+    runner = PolymarketSkillRunner(_settings(stub_url, executor_backends={"read": "http"}, read_cache_enabled=False))
+    result = asyncio.run(runner.execute("markets_search", {"query": "--help"}, {}))
+
+    assert result["ok"] is True
+    assert result["data"] == {"q": "--help"}
+
+
+def test_trickling_response_stops_at_total_timeout(stub_url: str) -> None:
+    executor = HttpExecutor(_settings(stub_url))
+    started = time.monotonic()
+    result = asyncio.run(
+        executor.run(["clob", "book", "tok-1"], timeout_seconds=0.5, action="clob_book", params={"token_id": "tok-1"})
+    )
+    elapsed = time.monotonic() - started
+    executor.close()
+
+    assert result.error["type"] == "TimeoutError"
+    assert elapsed < 2
+    assert executor.pools["clob"]._idle == []
+
+
+def test_http_backend_rejected_for_write_actions() -> None:
+    with pytest.raises(ValueError):
+        PolymarketSkillRunner(SkillSettings(executor_backends={"write": "http"}))
+
+
+def test_oversized_body_is_rejected(stub_url: str) -> None:
+    executor = HttpExecutor(_settings(stub_url, max_output_bytes=16))
+    result = asyncio.run(executor.run(["clob", "midpoint", "tok-1"], timeout_seconds=5, **_midpoint))
+
+    assert result.ok is False
+    assert result.error["type"] == "ResponseTooLarge"
+    assert executor.pools["clob"]._idle == []
+    executor.close()
@@ -0,0 +1,115 @@
+"""
+按 action 的耗时统计测试
+"""
+import asyncio
+
+from openclaw_polymarket_skill.executor import CommandResult
+from openclaw_polymarket_skill.latency import AdaptiveTimeouts, LatencyTracker
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    tracker = LatencyTracker()
+    for value in range(1, 101):
+        tracker.record("clob_book", value / 1000)
+    assert tracker.percentile("clob_book", 0.5) == 0.05
+    assert tracker.percentile("clob_book", 0.95) == 0.095
+    assert tracker.percentile("clob_book", 1.0) == 0.1
+    assert tracker.percentile("clob_book", 0.95, min_samples=101) is None
+    assert tracker.percentile("clob_midpoint", 0.95) is None
+
+
+def test_window_drops_old_samples() -> None:
+    tracker = LatencyTracker(window=10)
+    for _ in range(10):
+        tracker.record("clob_book", 5.0)
+    for _ in range(10):
+        tracker.record("clob_book", 0.01)
+    assert tracker.count("clob_book") == 10
+    assert tracker.percentile("clob_book", 0.99) == 0.01
+    assert tracker.stats()["clob_book"]["p99_ms"] == 10
+
+
+def _ok(duration_ms: int) -> dict:
+    return {"ok": True, "meta": {"duration_ms": duration_ms}}
+
+
+def test_adaptive_timeout_from_p99_within_bounds() -> None:
+    timeouts = AdaptiveTimeouts(multiplier=3, min_seconds=1, max_seconds=30, min_samples=5)
+    for _ in range(4):
+        timeouts.observe("clob_midpoint", _ok(300), 15)
+    assert timeouts.timeout("clob_midpoint", 15) == (15, False)
+    timeouts.observe("clob_midpoint", _ok(600), 15)
+    seconds, adaptive = timeouts.timeout("clob_midpoint", 15)
+    assert adaptive and abs(seconds - 1.8) < 1e-9
+
+    for _ in range(5):
+        timeouts.observe("clob_price_history", _ok(20_000), 15)
+    assert timeouts.timeout("clob_price_history", 15) == (30, True)
+    for _ in range(5):
+        timeouts.observe("events_get", _ok(10), 15)
+    assert timeouts.timeout("events_get", 15) == (1, True)
+    assert timeouts.stats()["events_get"]["timeout_ms"] == 1000
+
+
+def test_timeouts_count_as_samples_so_threshold_recovers() -> None:
+    timeouts = AdaptiveTimeouts(multiplier=2, min_seconds=0.1, max_seconds=10, min_samples=5, window=10)
+    for _ in range(10):
+        timeouts.observe("clob_book", _ok(100), 15)
+    assert timeouts.timeout("clob_book", 15) == (0.2, True)
+    timeouts.observe("clob_book", {"ok": False, "error": {"type": "TimeoutError"}, "meta": {}}, 0.2)
+    timeouts.observe("clob_book", {"ok": False, "error": {"type": "NetworkError"}, "meta": {}}, 0.2)
+    assert timeouts.timeout("clob_book", 15) == (0.4, True)
+
+
+class RecordingExecutor:
+    def __init__(self) -> None:
+        self.timeouts: list[float] = []
+        self.sources: list[str | None] = []
+
+    async def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.timeouts.append(kwargs["timeout_seconds"])
+        self.sources.append(kwargs.get("timeout_source"))
+        return CommandResult(ok=True, data={"mid": "0.5"}, error=None, meta={"duration_ms": 200})
+
+    async def check_cli_version(self):  # type: ignore[no-untyped-def]
+        return True, "0.1.4"
+
+
+def test_runner_applies_learned_timeout_to_reads() -> None:
+    settings = SkillSettings(
+        enforce_cli_version=False,
+        read_cache_enabled=False,
+        adaptive_timeouts_enabled=True,
+        adaptive_timeout_min_samples=3,
+    )
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = RecordingExecutor()  # type: ignore[assignment]
+
+    async def main() -> list[dict]:
+        return [await runner.execute("clob_midpoint", {"token_id": "1"}) for _ in range(4)]
+
+    results = asyncio.run(main())
+    assert runner.executor.timeouts == [15, 15, 15, 1.0]
+    assert runner.executor.sources == ["static"] * 3 + ["adaptive"]
+    assert [r["meta"]["timeout_source"] for r in results] == ["static"] * 3 + ["adaptive"]
+    health = asyncio.run(runner.healthcheck())
+    assert health["timeouts"]["clob_midpoint"]["timeout_ms"] == 1000
+
+
+def test_adaptive_timeouts_can_be_disabled() -> None:
+    settings = SkillSettings(enforce_cli_version=False, read_cache_enabled=False, adaptive_timeouts_enabled=False)
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = RecordingExecutor()  # type: ignore[assignment]
+    for _ in range(25):
+        result = asyncio.run(runner.execute("clob_midpoint", {"token_id": "1"}))
+    assert set(runner.executor.timeouts) == {15}
+    assert "timeout_source" not in result["meta"]
+
+
+def test_adaptive_timeouts_on_by_default(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    monkeypatch.delenv("OPENCLAW_PM_ADAPTIVE_TIMEOUTS", raising=False)
+    assert SkillSettings().adaptive_timeouts_enabled is True
+    assert SkillSettings.from_env().adaptive_timeouts_enabled is True
+    assert PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False)).timeouts is not None
@@ -0,0 +1,165 @@
+"""
+进程内指标测试
+"""
+import asyncio
+import os
+from pathlib import Path
+
+import openclaw_polymarket_skill
+from openclaw_polymarket_skill.metrics import (
+    BUCKETS_MS,
+    MetricsRegistry,
+    merge_snapshots,
+    render_prometheus,
+    write_textfile,
+)
+from openclaw_polymarket_skill.openclaw_bridge import handle_request
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+from openclaw_polymarket_skill.supervisor import Supervisor
+
+
+def _runner(**overrides: object) -> tuple[PolymarketSkillRunner, MetricsRegistry]:
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False, **overrides))  # type: ignore[arg-type]
+    registry = MetricsRegistry()
+    runner.metrics = registry
+    runner.executor.metrics = registry
+    return runner, registry
+
+
+def _series(snapshot: dict, kind: str, name: str) -> dict:
+    return {tuple(sorted(entry["labels"].items())): entry for entry in snapshot[kind].get(name, [])}
+
+
+def test_histogram_quantiles_from_buckets() -> None:
+    registry = MetricsRegistry()
+    for _ in range(90):
+        registry.observe("latency", 8, action="a")
+    for _ in range(10):
+        registry.observe("latency", 400, action="a")
+    registry.observe("latency", 120000, action="a")
+
+    entry = registry.snapshot()["histograms"]["latency"][0]
+    assert entry["count"] == 101
+    assert entry["buckets"][BUCKETS_MS.index(10)] == 90
+    assert entry["buckets"][-1] == 1
+    assert 5 <= entry["p50"] <= 10
+    assert 250 <= entry["p95"] <= 500
+    assert entry["p99"] <= BUCKETS_MS[-1]
+
+
+def test_merge_snapshots_adds_counters_and_buckets() -> None:
+    first, second = MetricsRegistry(), MetricsRegistry()
+    first.inc("calls", action="a", result="ok")
+    second.inc("calls", 2, action="a", result="ok")
+    second.inc("calls", action="b", result="error")
+    first.observe("latency", 3, action="a")
+    second.observe("latency", 3000, action="a")
+
+    merged = merge_snapshots([first.snapshot(), second.snapshot()])
+    calls = _series(merged, "counters", "calls")
+    assert calls[(("action", "a"), ("result", "ok"))]["value"] == 3
+    assert calls[(("action", "b"), ("result", "error"))]["value"] == 1
+    latency = merged["histograms"]["latency"][0]
+    assert latency["count"] == 2
+    assert latency["sum"] == 3003
+    assert latency["p99"] > 2500
+
+
+def test_render_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    registry.inc("skill_call_total", action='we"ird', result="ok")
+    registry.observe("skill_call_duration_ms", 7, action="clob_book")
+    registry.observe("skill_call_duration_ms", 70, action="clob_book")
+
+    text = render_prometheus(registry.snapshot())
+    assert "# TYPE skill_call_total counter" in text
+    assert 'skill_call_total{action="we\\"ird",result="ok"} 1' in text
+    assert "# TYPE skill_call_duration_ms histogram" in text
+    assert 'skill_call_duration_ms_bucket{action="clob_book",le="10"} 1' in text
+    assert 'skill_call_duration_ms_bucket{action="clob_book",le="100"} 2' in text
+    assert 'skill_call_duration_ms_bucket{action="clob_book",le="+Inf"} 2' in text
+    assert 'skill_call_duration_ms_sum{action="clob_book"} 77' in text
+    assert 'skill_call_duration_ms_count{action="clob_book"} 2' in text
+    assert render_prometheus(MetricsRegistry().snapshot()) == ""
+
+
+def test_write_textfile_replaces_atomically(tmp_path: Path) -> None:
+    target = tmp_path / "skill.prom"
+    write_textfile(str(target), "a 1\n")
+    write_textfile(str(target), "a 2\n")
+    assert target.read_text() == "a 2\n"
+    assert os.listdir(tmp_path) == ["skill.prom"]
+
+
+def test_runner_records_call_metrics(mock_polymarket_bin: str) -> None:
+    runner, registry = _runner(polymarket_bin=mock_polymarket_bin, allow_trading=False)
+
+    async def _main() -> None:
+        assert (await runner.execute("clob_midpoint", {"token_id": "1"}))["ok"] is True
+        await runner.execute("no_such_action")
+        await runner.execute("clob_create_order", {"token": "1", "side": "buy", "price": "0.5", "size": "1"})
+
+    asyncio.run(_main())
+
+    assert registry.value("skill_call_total", action="clob_midpoint", result="ok") == 1
+    assert registry.value("skill_call_error_total", action="unknown", type="UnknownAction") == 1
+    assert registry.value(
+        "skill_trade_blocked_total", action="clob_create_order", reason="TradingDisabledError"
+    ) == 1
+    assert registry.value("skill_exec_total", backend="cli", family="clob", result="ok") == 1
+    histograms = registry.snapshot()["histograms"]
+    assert {entry["labels"]["action"] for entry in histograms["skill_call_duration_ms"]} == {
+        "clob_midpoint",
+        "unknown",
+        "clob_create_order",
+    }
+    assert histograms["skill_exec_duration_ms"][0]["labels"] == {"backend": "cli", "family": "clob"}
+
+
+def test_runner_counts_timeouts(tmp_path: Path) -> None:
+    script = tmp_path / "polymarket"
+    script.write_text("#!/bin/bash\nexec sleep 5\n")
+    script.chmod(0o755)
+    runner, registry = _runner(polymarket_bin=str(script), read_timeout_seconds=0.2, retry_max_attempts=1)
+    result = asyncio.run(runner.execute("clob_midpoint", {"token_id": "1"}))
+    assert result["error"]["type"] == "TimeoutError"
+    assert registry.value("skill_timeout_total", action="clob_midpoint") == 1
+    assert registry.value("skill_exec_error_total", backend="cli", family="clob", type="TimeoutError") == 1
+
+
+def test_bridge_metrics_method() -> None:
+    runner, registry = _runner()
+    registry.inc("skill_call_total", action="clob_book", result="ok")
+
+    snapshot = asyncio.run(handle_request(runner, {"id": 1, "method": "metrics"}))
+    assert snapshot["ok"] is True
+    assert snapshot["result"]["counters"]["skill_call_total"][0]["value"] == 1
+
+    text = asyncio.run(handle_request(runner, {"id": 2, "method": "metrics", "format": "prometheus"}))
+    assert text["result"]["format"] == "prometheus"
+    assert 'skill_call_total{action="clob_book",result="ok"} 1' in text["result"]["text"]
+
+
+def test_supervisor_merges_worker_metrics(monkeypatch, mock_polymarket_bin: str) -> None:  # type: ignore[no-untyped-def]
+    source = str(Path(openclaw_polymarket_skill.__file__).resolve().parents[1])
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [source, os.environ.get("PYTHONPATH")])))
+    monkeypatch.setenv("OPENCLAW_PM_BIN", mock_polymarket_bin)
+    monkeypatch.setenv("OPENCLAW_PM_ENFORCE_VERSION", "false")
+    emitted: list = []
+
+    async def _main() -> dict:
+        supervisor = Supervisor(2, emit=emitted.append)
+        await supervisor.start()
+        try:
+            for index in range(4):
+                await supervisor.submit({"id": index, "action": "clob_midpoint", "params": {"token_id": str(index)}})
+            await supervisor.drain()
+            return await supervisor.metrics_snapshot()
+        finally:
+            await supervisor.close()
+
+    merged = asyncio.run(_main())
+    calls = _series(merged, "counters", "skill_call_total")
+    assert calls[(("action", "clob_midpoint"), ("result", "ok"))]["value"] == 4
+    assert len(emitted) == 4
@@ -0,0 +1,94 @@
+"""
+按 action 预编译的校验与 argv 计划测试
+"""
+import asyncio
+
+import pytest
+
+from openclaw_polymarket_skill.actions import ACTION_PLANS, ACTION_REGISTRY
+from openclaw_polymarket_skill.plans import Arg, BoolOpt, Flag, Opt, argv, compile_plans, load_schemas
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+def test_schema_matches_registry() -> None:
+    schemas = load_schemas()
+    for name, schema in schemas.items():
+        spec = ACTION_REGISTRY[name]
+        assert tuple(schema["required"]) == spec.required_params
+        assert set(schema["properties"]) <= set(spec.builder.params)
+
+
+def test_plan_lists_checks_for_template_params() -> None:
+    plan = ACTION_PLANS["clob_create_order"]
+    assert set(plan.checks) == {"token", "side", "price", "size", "order_type", "post_only"}
+    assert set(ACTION_PLANS["clob_midpoint"].checks) == {"token_id"}
+
+
+def test_argv_template_compiles_optional_pieces() -> None:
+    template = argv("clob", "spread", Arg("token_id"), Opt("side", "--side"), Opt("limit", "--limit", 25), Flag("x", "--x"))
+    assert template({"token_id": "1"}) == ["clob", "spread", "1", "--limit", "25"]
+    assert template({"token_id": "1", "side": "buy", "limit": None, "x": True}) == [
+        "clob",
+        "spread",
+        "1",
+        "--side",
+        "buy",
+        "--limit",
+        "25",
+        "--x",
+    ]
+    assert template.params == ("token_id", "side", "limit", "x")  # type: ignore[attr-defined]
+
+
+def test_argv_template_keeps_order_after_optional_pieces() -> None:
+    template = argv("data", BoolOpt("active", "--active"), "positions", Arg("address"), Opt("limit", "--limit"))
+    assert template({"address": "0x1"}) == ["data", "positions", "0x1"]
+    assert template({"address": "0x1", "active": False, "limit": 5}) == [
+        "data",
+        "--active",
+        "false",
+        "positions",
+        "0x1",
+        "--limit",
+        "5",
+    ]
+
+
+def test_schema_narrows_enum_but_rules_keep_hex_tokens() -> None:
+    market_order = ACTION_PLANS["clob_market_order"]
+    base = {"token": "0xabc123", "side": "buy", "amount": "5"}
+    assert market_order.validate(base) is None
+    assert market_order.validate({**base, "order_type": "FAK"}) is None
+    assert "FOK/FAK" in str(market_order.validate({**base, "order_type": "GTC"}))
+    # 其它 action 仍按全局规则接受 GTC
+    create_order = ACTION_PLANS["clob_create_order"]
+    assert create_order.validate({"token": "1", "side": "buy", "price": "0.5", "size": "1", "order_type": "GTC"}) is None
+
+
+def test_schema_constraints_for_params_without_rules() -> None:
+    assert ACTION_PLANS["markets_get"].validate({"id_or_slug": ""}) is not None
+    assert ACTION_PLANS["markets_get"].validate({"id_or_slug": "x" * 201}) is not None
+    order = {"token": "1", "side": "buy", "price": "0.5", "size": "1"}
+    assert ACTION_PLANS["clob_create_order"].validate({**order, "post_only": "true"}) == "post_only 必须是布尔值"
+    assert ACTION_PLANS["clob_create_order"].validate({**order, "post_only": True}) is None
+
+
+def test_undeclared_params_still_use_global_rules() -> None:
+    plan = ACTION_PLANS["clob_midpoint"]
+    assert plan.validate({"token_id": "1", "limit": 0}) == "limit 范围必须在 1-100"
+    assert plan.validate({"token_id": "1", "unknown": object()}) is None
+    assert plan.validate({"token_id": None}) == "缺少必填参数: token_id"
+
+
+def test_unregistered_schema_action_rejected() -> None:
+    with pytest.raises(ValueError):
+        compile_plans(ACTION_REGISTRY, {"no_such_action": {"properties": {}}})
+
+
+def test_batch_path_uses_compiled_plan() -> None:
+    runner = PolymarketSkillRunner(SkillSettings(enforce_cli_version=False))
+    result = asyncio.run(runner.execute_batch([{"action": "markets_get", "params": {"id_or_slug": ""}}]))
+    error = result["items"][0]["result"]["error"]
+    assert error["type"] == "ValidationError"
+    assert "id_or_slug" in error["message"]
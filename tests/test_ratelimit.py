@@ -0,0 +1,118 @@
+"""
+按 API 分组的令牌桶限流测试
+"""
+import asyncio
+from pathlib import Path
+
+from openclaw_polymarket_skill.executor import PolymarketExecutor
+from openclaw_polymarket_skill.ratelimit import RateLimiter, TokenBucket, family_for
+from openclaw_polymarket_skill.scheduler import Priority
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_family_for_cli_args() -> None:
+    assert family_for(["markets", "search", "x"]) == "gamma"
+    assert family_for(["events", "list"]) == "gamma"
+    assert family_for(["clob", "book", "1"]) == "clob"
+    assert family_for(["data", "value", "0x1"]) == "data"
+    assert family_for([]) is None
+
+
+def test_bucket_allows_burst_then_paces() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=3, clock=clock)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert abs(bucket.reserve() - 0.1) < 1e-9
+    assert abs(bucket.reserve() - 0.2) < 1e-9
+    # 超过 max_wait 的请求不预约
+    assert bucket.reserve(max_wait=0.1) is None
+    assert bucket.rejected == 1
+    clock.now += 10
+    assert bucket.reserve() == 0.0
+
+
+def test_writes_do_not_wait_but_consume_quota() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=10, burst=1, clock=clock)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve(wait=False) == 0.0
+    assert abs(bucket.reserve() - 0.2) < 1e-9
+
+
+def test_rate_limit_error_pauses_and_backs_off_exponentially() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(rate=100, backoff_seconds=1.0, clock=clock)
+    bucket.penalize()
+    assert abs(bucket.reserve() - 1.0) < 1e-9
+    # 同一波失败只计一次
+    bucket.penalize()
+    assert bucket.stats()["limited"] == 2
+    clock.now += 2
+    bucket.penalize()
+    assert abs(bucket.reserve() - 2.0) < 1e-9
+    clock.now += 3
+    bucket.succeed()
+    bucket.penalize(retry_after=5)
+    assert abs(bucket.reserve() - 5.0) < 1e-9
+
+
+def test_limiter_paces_concurrent_reads() -> None:
+    limiter = RateLimiter({"clob": 50}, backoff_seconds=0.1)
+    limiter.buckets["clob"] = TokenBucket(rate=50, burst=2)
+
+    async def main() -> list[float | None]:
+        return await asyncio.gather(*(limiter.acquire(["clob", "book", "1"]) for _ in range(5)))
+
+    waits = asyncio.run(main())
+    assert waits[:2] == [0.0, 0.0]
+    assert all(wait and wait > 0 for wait in waits[2:])
+    assert asyncio.run(limiter.acquire(["unknown"])) == 0.0
+
+
+def test_cancelled_wait_refunds_token() -> None:
+    clock = FakeClock()
+    limiter = RateLimiter({"clob": 10})
+    limiter.buckets["clob"] = TokenBucket(rate=10, burst=1, clock=clock)
+
+    async def main() -> None:
+        assert await limiter.acquire(["clob", "book", "1"]) == 0.0
+        waiter = asyncio.create_task(limiter.acquire(["clob", "book", "1"]))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+    asyncio.run(main())
+    assert abs(limiter.buckets["clob"].reserve() - 0.1) < 1e-9
+
+
+def test_executor_reports_wait_and_backs_off_on_rate_limit(tmp_path: Path) -> None:
+    script = tmp_path / "polymarket"
+    script.write_text("#!/bin/bash\necho 'Error: 429 Too Many Requests' >&2\nexit 1\n")
+    script.chmod(0o755)
+    limiter = RateLimiter({"gamma": 1000}, backoff_seconds=30)
+    executor = PolymarketExecutor(SkillSettings(polymarket_bin=str(script)), rate_limiter=limiter)
+
+    async def main() -> None:
+        first = await executor.run(["markets", "get", "1"], timeout_seconds=5)
+        assert first.error is not None and first.error["type"] == "RateLimitError"
+        assert first.meta["rate_limit_wait_ms"] == 0
+        # 分组暂停 30s，超过请求超时的请求直接在本地拒绝，不再启动子进程
+        second = await executor.run(["markets", "get", "1"], timeout_seconds=5)
+        assert second.meta["rate_limited"] == "client"
+        assert second.error is not None and second.error["retryable"] is True
+        # 其他分组不受影响；撤单不等待
+        other = await executor.run(["clob", "book", "1"], timeout_seconds=5)
+        assert "rate_limited" not in other.meta
+        cancel = await executor.run(["markets", "get", "1"], timeout_seconds=5, priority=Priority.CANCEL)
+        assert "rate_limited" not in cancel.meta
+
+    asyncio.run(main())
+    assert limiter.stats()["gamma"]["limited"] == 2
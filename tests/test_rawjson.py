@@ -0,0 +1,67 @@
+"""
+原始 JSON 透传测试
+"""
+import asyncio
+import copy
+import json
+from pathlib import Path
+
+from openclaw_polymarket_skill.cache import serialize_payload
+from openclaw_polymarket_skill.rawjson import RawJson, dumps_line, materialize
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+def test_from_output_accepts_objects_and_arrays_only() -> None:
+    assert RawJson.from_output(b'  {"a": 1}\n') == RawJson(b'{"a": 1}')
+    assert RawJson.from_output(b"[1, 2]") == RawJson(b"[1, 2]")
+    assert RawJson.from_output(b"plain text") is None
+    assert RawJson.from_output(b'"quoted"') is None
+    assert RawJson.from_output(b"") is None
+    assert RawJson.from_output(b'{"a": 1,}') is None
+    assert RawJson.from_output(b"[not json]") is None
+    assert RawJson.from_output(b'{"a": "\xff"}') is None
+
+
+def test_dumps_line_splices_raw_bytes() -> None:
+    raw = RawJson('{\n  "question": "下雨吗？",\n  "prices": [0.4, 0.6]\n}'.encode())
+    line = dumps_line({"id": "1", "result": {"data": raw, "items": [{"data": RawJson(b"[]")}]}})
+
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert json.loads(line) == {
+        "id": "1",
+        "result": {"data": {"question": "下雨吗？", "prices": [0.4, 0.6]}, "items": [{"data": []}]},
+    }
+
+
+def test_dumps_line_without_raw_matches_json_dumps() -> None:
+    response = {"id": 1, "ok": True, "result": {"text": "中文"}}
+    assert dumps_line(response) == json.dumps(response, ensure_ascii=False).encode() + b"\n"
+
+
+def test_raw_json_is_shared_not_copied_and_parses_fresh() -> None:
+    raw = RawJson(b'{"a": [1]}')
+    assert copy.deepcopy(raw) is raw
+    first = materialize(raw)
+    first["a"].append(2)
+    assert materialize(raw) == {"a": [1]}
+    assert serialize_payload(raw) == '{"a": [1]}'
+
+
+def test_invalid_bracketed_output_falls_back_and_is_not_cached(tmp_path: Path) -> None:
+    script = tmp_path / "polymarket"
+    script.write_text("#!/bin/bash\necho '{\"a\": 1,}'\n")
+    script.chmod(0o755)
+    runner = PolymarketSkillRunner(settings=SkillSettings(polymarket_bin=str(script), enforce_cli_version=False))
+
+    async def _main() -> tuple[dict, dict]:
+        passthrough = await runner.execute("markets_get", {"id_or_slug": "m1"}, passthrough=True)
+        plain = await runner.execute("markets_get", {"id_or_slug": "m1"})
+        return passthrough, plain
+
+    passthrough, plain = asyncio.run(_main())
+
+    assert not isinstance(passthrough["data"], RawJson)
+    assert passthrough["ok"] is True and passthrough["meta"]["format"] == "raw_text"
+    assert json.loads(dumps_line({"id": 1, "result": passthrough}))["result"]["data"] == '{"a": 1,}'
+    assert plain["ok"] is True and plain["data"] == '{"a": 1,}'
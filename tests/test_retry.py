@@ -6,8 +6,10 @@ import asyncio
 from openclaw_polymarket_skill.retry import (
     async_retry,
     RetryConfig,
+    RetryBudget,
     should_retry,
     calculate_delay,
+    retry_result,
 )
 
 
@@ -169,3 +171,125 @@ class TestAsyncRetry:
         result = await func_with_defaults()
         assert result == 1
         assert call_count == 1
+
+
+class CountingExecutor:
+    """前 ``failures`` 次返回可重试的 NetworkError，之后成功"""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    async def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        from openclaw_polymarket_skill.executor import CommandResult
+
+        self.calls += 1
+        if self.calls <= self.failures:
+            return CommandResult(
+                ok=False,
+                data=None,
+                error={"type": "NetworkError", "message": "connect failed", "retryable": True},
+                meta={"duration_ms": 1},
+            )
+        return CommandResult(ok=True, data={"id": "1"}, error=None, meta={"duration_ms": 1})
+
+    async def check_cli_version(self):  # type: ignore[no-untyped-def]
+        return True, "0.1.4"
+
+
+def _retry_runner(failures: int, **overrides):  # type: ignore[no-untyped-def]
+    from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+    from openclaw_polymarket_skill.settings import SkillSettings
+
+    settings = SkillSettings(
+        enforce_cli_version=False,
+        read_cache_enabled=False,
+        retry_initial_delay_seconds=0.001,
+        retry_max_delay_seconds=0.002,
+        **overrides,
+    )
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = CountingExecutor(failures)
+    runner.retry_budget = RetryBudget()
+    return runner
+
+
+def test_retry_budget_caps_retries_to_fraction_of_traffic() -> None:
+    budget = RetryBudget(ratio=0.1, burst=2)
+    assert budget.withdraw() and budget.withdraw()
+    assert budget.withdraw() is False
+    for _ in range(10):
+        budget.deposit()
+    assert budget.withdraw() is True
+    assert budget.withdraw() is False
+    stats = budget.stats()
+    assert stats["requests"] == 10
+    assert stats["retries"] == 3
+    assert stats["exhausted"] == 2
+
+
+def test_retry_result_records_attempts_and_backoff() -> None:
+    delays: list[float] = []
+    outcomes = [
+        {"ok": False, "action": "x", "error": {"type": "NetworkError", "retryable": True}, "meta": {}},
+        {"ok": True, "action": "x", "data": 1, "meta": {}},
+    ]
+
+    async def call():  # type: ignore[no-untyped-def]
+        return outcomes.pop(0)
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    config = RetryConfig(max_attempts=3, initial_delay=0.5, jitter=False)
+    result = asyncio.run(retry_result(call, config, RetryBudget(), sleep=sleep))
+    assert result["ok"] is True
+    assert delays == [0.5]
+    assert result["meta"]["attempts"] == 2
+    assert result["meta"]["retry_backoff_ms"] == 500
+
+
+def test_retry_result_skips_non_retryable_and_client_rate_limit() -> None:
+    async def fail(error: dict, meta: dict):  # type: ignore[no-untyped-def]
+        return {"ok": False, "error": error, "meta": meta}
+
+    config = RetryConfig(max_attempts=3, initial_delay=0.001)
+    result = asyncio.run(retry_result(lambda: fail({"type": "ValidationError", "retryable": False}, {}), config))
+    assert result["meta"]["attempts"] == 1
+    result = asyncio.run(
+        retry_result(lambda: fail({"type": "RateLimitError", "retryable": True}, {"rate_limited": "client"}), config)
+    )
+    assert result["meta"]["attempts"] == 1
+
+
+def test_runner_retries_transient_read_failures() -> None:
+    runner = _retry_runner(failures=2)
+    result = asyncio.run(runner.execute("events_get", {"id": "1"}))
+    assert result["ok"] is True
+    assert runner.executor.calls == 3
+    assert result["meta"]["attempts"] == 3
+    assert result["meta"]["retry_backoff_ms"] >= 0
+    assert asyncio.run(runner.healthcheck())["retry_budget"]["retries"] == 2
+
+
+def test_runner_stops_retrying_when_budget_exhausted() -> None:
+    runner = _retry_runner(failures=5)
+    runner.retry_budget = RetryBudget(ratio=0.1, burst=1)
+    result = asyncio.run(runner.execute("events_get", {"id": "1"}))
+    assert result["ok"] is False
+    assert runner.executor.calls == 2
+    assert result["meta"]["retry_budget_exhausted"] is True
+
+
+def test_runner_never_retries_writes() -> None:
+    runner = _retry_runner(failures=1, allow_trading=True, dry_run=False)
+    result = asyncio.run(
+        runner.execute(
+            "clob_cancel",
+            {"order_id": "abc"},
+            {"private_key": "0x" + "7f3a9c" * 10 + "1b2c"},
+        )
+    )
+    assert runner.executor.calls == 1
+    assert result["ok"] is False
+    assert "attempts" not in result["meta"]
@@ -94,3 +94,200 @@ def test_cli_version_mismatch_block_execute() -> None:
     result = asyncio.run(runner.execute("markets_search", {"query": "btc"}))
     assert result["ok"] is False
     assert result["error"]["type"] == "CliVersionMismatch"
+
+
+class DelayedExecutor(FakeExecutor):
+    def __init__(self, delays: dict[str, float]) -> None:
+        super().__init__(CommandResult(ok=True, data={"mid": "0.5"}, error=None, meta={"duration_ms": 1}))
+        self.delays = delays
+        self.calls: list[list[str]] = []
+
+    async def run(self, cli_args, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls.append(list(cli_args))
+        await asyncio.sleep(self.delays.get(cli_args[-1], 0))
+        return self._result
+
+
+def test_execute_batch_validates_up_front() -> None:
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False))
+    runner.executor = DelayedExecutor({})
+    result = asyncio.run(
+        runner.execute_batch(
+            [
+                {"action": "clob_midpoint", "params": {"token_id": "1"}},
+                {"action": "clob_midpoint", "params": {"token_id": "abc"}},
+                {"action": "clob_cancel_all", "params": {}},
+                {"action": "not_exists"},
+            ]
+        )
+    )
+    assert result["ok"] is False
+    assert [item["ok"] for item in result["items"]] == [True, False, False, False]
+    assert result["items"][1]["result"]["error"]["type"] == "ValidationError"
+    assert result["items"][2]["result"]["error"]["type"] == "ValidationError"
+    assert result["items"][3]["result"]["error"]["type"] == "UnknownAction"
+    assert len(runner.executor.calls) == 1
+
+
+def test_execute_batch_deadline_returns_partial_results() -> None:
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False))
+    runner.executor = DelayedExecutor({"2": 5.0})
+    items = [{"action": "clob_midpoint", "params": {"token_id": str(i)}} for i in range(4)]
+    result = asyncio.run(runner.execute_batch(items, deadline_seconds=0.1))
+    assert result["meta"]["partial"] is True
+    assert result["meta"]["timed_out"] == 1
+    assert result["meta"]["succeeded"] == 3
+    assert result["items"][2]["result"]["error"]["type"] == "DeadlineExceeded"
+    assert result["meta"]["duration_ms"] < 1000
+
+
+def test_execute_batch_bounds_concurrency() -> None:
+    settings = SkillSettings(enforce_cli_version=False, batch_max_concurrency=2)
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = DelayedExecutor({str(i): 0.05 for i in range(4)})
+    items = [{"action": "clob_midpoint", "params": {"token_id": str(i)}} for i in range(4)]
+    result = asyncio.run(runner.execute_batch(items, max_concurrency=10))
+    assert result["meta"]["max_concurrency"] == 2
+    assert result["items"][3]["queued_ms"] >= 40
+
+
+def test_read_cache_serves_repeated_reads() -> None:
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False))
+    runner.executor = DelayedExecutor({})
+    first = asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    second = asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    assert first["meta"]["cache"]["hit"] is False
+    assert second["meta"]["cache"]["hit"] is True
+    assert second["meta"]["cache"]["hits"] == 1
+    assert second["data"] == first["data"]
+    assert len(runner.executor.calls) == 1
+
+
+def test_cache_hits_do_not_replay_execution_meta() -> None:
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False))
+    runner.executor = FakeExecutor(
+        CommandResult(
+            ok=True,
+            data={"id": "btc"},
+            error=None,
+            meta={
+                "duration_ms": 120,
+                "queue_wait_ms": 80,
+                "rate_limit_wait_ms": 40,
+                "timeout_ms": 15000,
+                "exit_code": 0,
+                "stderr": "slow",
+                "warning": "partial",
+            },
+        )
+    )
+    first = asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    second = asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    assert first["meta"]["queue_wait_ms"] == 80
+    assert second["meta"]["cache"]["hit"] is True
+    assert second["meta"]["warning"] == "partial"
+    assert second["meta"]["duration_ms"] == 0
+    for key in ("queue_wait_ms", "rate_limit_wait_ms", "timeout_ms", "exit_code", "stderr", "attempts"):
+        assert key not in second["meta"], key
+
+
+def test_read_cache_skips_auth_reads_and_failures() -> None:
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False))
+    runner.executor = DelayedExecutor({})
+    for _ in range(2):
+        result = asyncio.run(runner.execute("clob_balance", {"asset_type": "collateral"}))
+        assert "cache" not in result["meta"]
+    assert len(runner.executor.calls) == 2
+
+    runner.executor = FakeExecutor(
+        CommandResult(ok=False, data=None, error={"type": "NetworkError", "message": "x", "retryable": True}, meta={})
+    )
+    asyncio.run(runner.execute("events_get", {"id": "1"}))
+    result = asyncio.run(runner.execute("events_get", {"id": "1"}))
+    assert result["ok"] is False
+    assert result["meta"]["cache"]["hit"] is False
+
+
+def test_identical_concurrent_reads_are_coalesced() -> None:
+    settings = SkillSettings(enforce_cli_version=False, read_cache_enabled=False)
+    runner = PolymarketSkillRunner(settings=settings)
+    runner.executor = DelayedExecutor({"1": 0.02})
+
+    async def main() -> list:
+        return await asyncio.gather(*(runner.execute("clob_book", {"token_id": "1"}) for _ in range(4)))
+
+    results = asyncio.run(main())
+    assert len(runner.executor.calls) == 1
+    assert sorted(r["meta"]["coalesced"] for r in results) == [False, True, True, True]
+    assert results[-1]["meta"]["singleflight"]["followers"] == 3
+
+
+class SwitchableExecutor(FakeExecutor):
+    def __init__(self) -> None:
+        super().__init__(CommandResult(ok=True, data={"mid": "0.5"}, error=None, meta={"duration_ms": 1}))
+        self.calls = 0
+
+    async def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return self._result
+
+    def fail(self, retryable: bool) -> None:
+        self._result = CommandResult(
+            ok=False,
+            data=None,
+            error={"type": "NetworkError" if retryable else "ValidationError", "message": "x", "retryable": retryable},
+            meta={"duration_ms": 1},
+        )
+
+
+def _stale_runner(**overrides):  # type: ignore[no-untyped-def]
+    from openclaw_polymarket_skill.cache import ReadCache
+
+    clock = {"now": 0.0}
+    runner = PolymarketSkillRunner(settings=SkillSettings(enforce_cli_version=False, **overrides))
+    runner.read_cache = ReadCache(ttls={"markets_get": 10}, clock=lambda: clock["now"])
+    runner.executor = SwitchableExecutor()
+    return runner, clock
+
+
+def test_stale_while_revalidate_returns_old_value_and_refreshes() -> None:
+    runner, clock = _stale_runner(stale_while_revalidate_seconds=30)
+
+    async def main() -> dict:
+        await runner.execute("markets_get", {"id_or_slug": "btc"})
+        clock["now"] = 15
+        result = await runner.execute("markets_get", {"id_or_slug": "btc"})
+        await asyncio.sleep(0.01)
+        return result
+
+    result = asyncio.run(main())
+    assert result["ok"] is True
+    assert result["meta"]["stale"] is True
+    assert result["meta"]["revalidating"] is True
+    assert result["meta"]["age_ms"] == 15000
+    assert runner.executor.calls == 2
+
+
+def test_stale_if_error_serves_last_good_value() -> None:
+    runner, clock = _stale_runner(stale_if_error_seconds=60)
+    asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    clock["now"] = 20
+    runner.executor.fail(retryable=True)
+    result = asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    assert result["ok"] is True
+    assert result["data"] == {"mid": "0.5"}
+    assert result["meta"]["stale"] is True
+    assert result["meta"]["stale_error"]["type"] == "NetworkError"
+
+    runner.executor.fail(retryable=False)
+    result = asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    assert result["ok"] is False
+
+
+def test_stale_values_disabled_by_default() -> None:
+    runner, clock = _stale_runner()
+    asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    clock["now"] = 20
+    runner.executor.fail(retryable=True)
+    result = asyncio.run(runner.execute("markets_get", {"id_or_slug": "btc"}))
+    assert result["ok"] is False
@@ -0,0 +1,77 @@
+"""
+子进程调度器测试
+"""
+import asyncio
+
+from openclaw_polymarket_skill.actions import ACTION_REGISTRY
+from openclaw_polymarket_skill.executor import PolymarketExecutor
+from openclaw_polymarket_skill.scheduler import Priority, SubprocessScheduler, priority_for, shared_scheduler
+from openclaw_polymarket_skill.settings import SkillSettings
+
+
+def test_priority_for_actions() -> None:
+    assert priority_for(ACTION_REGISTRY["clob_cancel_all"]) is Priority.CANCEL
+    assert priority_for(ACTION_REGISTRY["clob_create_order"]) is Priority.WRITE
+    assert priority_for(ACTION_REGISTRY["clob_balance"]) is Priority.READ_AUTH
+    assert priority_for(ACTION_REGISTRY["clob_book"]) is Priority.READ
+
+
+def test_waiters_served_by_priority_then_arrival() -> None:
+    order: list[str] = []
+
+    async def worker(scheduler: SubprocessScheduler, name: str, priority: Priority) -> None:
+        await scheduler.acquire(priority)
+        order.append(name)
+        await asyncio.sleep(0.01)
+        scheduler.release()
+
+    async def main() -> None:
+        scheduler = SubprocessScheduler(1)
+        await scheduler.acquire(Priority.READ)
+        tasks = [
+            asyncio.create_task(worker(scheduler, "read-1", Priority.READ)),
+            asyncio.create_task(worker(scheduler, "read-2", Priority.READ)),
+            asyncio.create_task(worker(scheduler, "write", Priority.WRITE)),
+            asyncio.create_task(worker(scheduler, "cancel", Priority.CANCEL)),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.stats()["queued"] == {"read": 2, "write": 1, "cancel": 1}
+        scheduler.release()
+        await asyncio.gather(*tasks)
+        assert scheduler.active == 0
+
+    asyncio.run(main())
+    assert order == ["cancel", "write", "read-1", "read-2"]
+
+
+def test_cancelled_waiter_does_not_leak_slot() -> None:
+    async def main() -> None:
+        scheduler = SubprocessScheduler(1)
+        await scheduler.acquire()
+        waiter = asyncio.create_task(scheduler.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        scheduler.release()
+        assert scheduler.active == 0
+        assert await scheduler.acquire() == 0.0
+
+    asyncio.run(main())
+
+
+def test_shared_scheduler_reused_and_disabled() -> None:
+    assert shared_scheduler(7) is shared_scheduler(7)
+    assert shared_scheduler(0) is None
+
+
+def test_executor_limits_concurrent_processes(mock_polymarket_bin: str) -> None:
+    settings = SkillSettings(polymarket_bin=mock_polymarket_bin)
+    executor = PolymarketExecutor(settings, scheduler=SubprocessScheduler(2))
+
+    async def main() -> list:
+        return await asyncio.gather(*(executor.run(["clob", "book", "1"], timeout_seconds=5) for _ in range(6)))
+
+    results = asyncio.run(main())
+    assert all(result.ok for result in results)
+    assert all("queue_wait_ms" in result.meta for result in results)
+    assert executor.scheduler is not None and executor.scheduler.active == 0
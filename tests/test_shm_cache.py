@@ -0,0 +1,92 @@
+"""
+主机共享内存缓存测试
+"""
+import asyncio
+import multiprocessing
+from pathlib import Path
+
+from openclaw_polymarket_skill.executor import CommandResult
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+from openclaw_polymarket_skill.shm_cache import ShmCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_put_get_and_expiry(tmp_path: Path) -> None:
+    clock = Clock()
+    cache = ShmCache(str(tmp_path / "shm"), slots=8, slot_bytes=4096, clock=clock)
+    cache.put_payload("clob_book\x1fclob\x1fbook\x1f1", "clob_book", '{"bids": []}', {"action": "clob_book"})
+
+    entry = cache.get("clob_book\x1fclob\x1fbook\x1f1")
+    assert entry is not None
+    assert entry.action == "clob_book"
+    assert entry.data() == {"bids": []}
+    assert entry.meta == {"action": "clob_book"}
+
+    clock.now += 1
+    assert cache.get("clob_book\x1fclob\x1fbook\x1f1") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_oversized_and_uncacheable_entries_are_skipped(tmp_path: Path) -> None:
+    cache = ShmCache(str(tmp_path / "shm"), slots=4, slot_bytes=256)
+    cache.put_payload("markets_list\x1fx", "markets_list", "x" * 1024, {})
+    cache.put_payload("clob_balance\x1fx", "clob_balance", "{}", {})
+    assert cache.get("markets_list\x1fx") is None
+    assert cache.get("clob_balance\x1fx") is None
+    assert cache.oversized == 1
+
+
+def test_existing_file_layout_wins(tmp_path: Path) -> None:
+    path = str(tmp_path / "shm")
+    first = ShmCache(path, slots=16, slot_bytes=1024)
+    second = ShmCache(path, slots=64, slot_bytes=4096)
+    assert (second.slots, second.slot_bytes) == (16, 1024)
+    first.put_payload("markets_get\x1fa", "markets_get", '{"id": "a"}', {})
+    assert second.get("markets_get\x1fa") is not None
+
+
+def _write_from_child(path: str) -> None:
+    ShmCache(path).put_payload("markets_get\x1fchild", "markets_get", '{"from": "child"}', {})
+
+
+def test_entries_are_visible_across_processes(tmp_path: Path) -> None:
+    path = str(tmp_path / "shm")
+    reader = ShmCache(path)
+    process = multiprocessing.get_context("fork").Process(target=_write_from_child, args=(path,))
+    process.start()
+    process.join(10)
+    entry = reader.get("markets_get\x1fchild")
+    assert entry is not None and entry.data() == {"from": "child"}
+
+
+class CountingExecutor:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def run(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+        self.calls += 1
+        return CommandResult(ok=True, data={"mid": "0.5"}, error=None, meta={"duration_ms": 3})
+
+
+def test_second_runner_hits_shared_tier(tmp_path: Path) -> None:
+    settings = SkillSettings(enforce_cli_version=False, shm_cache_path=str(tmp_path / "shm"))
+    first, second = PolymarketSkillRunner(settings), PolymarketSkillRunner(settings)
+    first.executor = CountingExecutor()  # type: ignore[assignment]
+    second.executor = CountingExecutor()  # type: ignore[assignment]
+
+    asyncio.run(first.execute("markets_get", {"id_or_slug": "1"}))
+    result = asyncio.run(second.execute("markets_get", {"id_or_slug": "1"}))
+
+    assert second.executor.calls == 0  # type: ignore[attr-defined]
+    assert result["data"] == {"mid": "0.5"}
+    assert result["meta"]["cache"]["tier"] == "shm"
+    assert result["meta"]["cache"]["shm"] == {"hits": 1, "misses": 0}
@@ -0,0 +1,83 @@
+"""
+single-flight 合并测试
+"""
+import asyncio
+import math
+
+from openclaw_polymarket_skill.deadline import Deadline
+from openclaw_polymarket_skill.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_execution() -> None:
+    calls = 0
+
+    async def fetch() -> dict:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"data": {"bids": [1]}}
+
+    async def main() -> list:
+        flight = SingleFlight()
+        results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(5)))
+        assert flight.stats() == {"leaders": 1, "followers": 4, "in_flight": 0}
+        return results
+
+    results = asyncio.run(main())
+    assert calls == 1
+    assert [shared for _, shared in results] == [False, True, True, True, True]
+    results[0][0]["data"]["bids"].append(2)
+    assert all(result["data"] == {"bids": [1]} for result, _ in results[1:])
+
+
+def test_cancelled_waiter_does_not_cancel_shared_call() -> None:
+    async def fetch() -> dict:
+        await asyncio.sleep(0.02)
+        return {"ok": True}
+
+    async def main() -> dict:
+        flight = SingleFlight()
+        leader = asyncio.create_task(flight.do("k", fetch))
+        follower = asyncio.create_task(flight.do("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        result, shared = await follower
+        assert shared is True
+        return result
+
+    assert asyncio.run(main()) == {"ok": True}
+
+
+def test_sequential_calls_are_not_coalesced() -> None:
+    calls = 0
+
+    async def fetch() -> dict:
+        nonlocal calls
+        calls += 1
+        return {}
+
+    async def main() -> None:
+        flight = SingleFlight()
+        await flight.do("k", fetch)
+        await flight.do("k", fetch)
+
+    asyncio.run(main())
+    assert calls == 2
+
+
+def test_followers_extend_shared_deadline() -> None:
+    budget = Deadline.after_ms(100)
+    later = Deadline.after_ms(1000)
+
+    async def fetch() -> dict:
+        await asyncio.sleep(0.01)
+        return {}
+
+    async def main() -> None:
+        flight = SingleFlight()
+        await asyncio.gather(flight.do("k", fetch, budget), flight.do("k", fetch, later))
+        assert budget.expires_at == later.expires_at
+        await asyncio.gather(flight.do("k", fetch, budget), flight.do("k", fetch))
+        assert budget.expires_at == math.inf
+
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""
+多进程 supervisor 测试
+"""
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+import openclaw_polymarket_skill
+from openclaw_polymarket_skill.supervisor import Supervisor, serve_supervised, worker_command
+from openclaw_polymarket_skill.supervisor import worker_env as spawn_env
+
+
+class BufferWriter:
+    def __init__(self) -> None:
+        self.chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    def is_closing(self) -> bool:
+        return False
+
+    async def drain(self) -> None:
+        return None
+
+
+def _serve(lines: list[dict], workers: int, command: list[str] | None = None) -> list[dict]:
+    writer = BufferWriter()
+
+    async def _main() -> None:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"".join(json.dumps(line).encode() + b"\n" for line in lines))
+        reader.feed_eof()
+        await serve_supervised(reader, writer, workers, command=command)  # type: ignore[arg-type]
+
+    asyncio.run(_main())
+    return [json.loads(line) for line in b"".join(writer.chunks).splitlines()]
+
+
+@pytest.fixture()
+def worker_env(monkeypatch: pytest.MonkeyPatch, mock_polymarket_bin: str) -> None:
+    source = str(Path(openclaw_polymarket_skill.__file__).resolve().parents[1])
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(filter(None, [source, os.environ.get("PYTHONPATH")])))
+    monkeypatch.setenv("OPENCLAW_PM_BIN", mock_polymarket_bin)
+    monkeypatch.setenv("OPENCLAW_PM_ENFORCE_VERSION", "false")
+
+
+def test_writes_for_one_wallet_route_to_one_worker() -> None:
+    supervisor = Supervisor(4, emit=lambda _: None)
+    for wallet in ("w1", "w2", "w3"):
+        request = {"action": "clob_create_order", "context": {"wallet_id": wallet}}
+        assert len({supervisor.route(request).index for _ in range(5)}) == 1
+    read = {"action": "clob_book", "context": {"wallet_id": "w1"}}
+    supervisor.workers[0].pending[1] = None  # type: ignore[assignment]
+    assert supervisor.route(read).index != 0
+
+
+def test_requests_are_forwarded_and_ids_restored(worker_env: None) -> None:
+    requests = [{"id": f"r{i}", "action": "clob_midpoint", "params": {"token_id": str(i)}} for i in range(6)]
+    requests.append({"id": 7, "method": "list_actions"})
+    requests.append({"id": "health", "method": "healthcheck"})
+    responses = {response["id"]: response for response in _serve(requests, workers=2)}
+
+    assert set(responses) == {"r0", "r1", "r2", "r3", "r4", "r5", 7, "health"}
+    assert responses["r3"]["result"]["data"] == {"status": "ok", "data": []}
+    assert responses[7]["result"]["actions"]
+    workers = responses["health"]["result"]["supervisor"]["workers"]
+    assert len(workers) == 2
+    assert len({worker["pid"] for worker in workers}) == 2
+    assert all("version" in worker["result"] for worker in workers)
+
+
+def test_crashed_worker_fails_pending_requests() -> None:
+    command = [sys.executable, "-c", "import sys; sys.stdin.readline()"]
+    responses = _serve([{"id": "x", "action": "clob_book", "params": {"token_id": "1"}}], workers=1, command=command)
+    assert responses == [
+        {"id": "x", "ok": False, "error": {"code": "WorkerCrashed", "message": "worker 0 异常退出，请求未完成"}}
+    ]
+
+
+def test_worker_never_supervises(worker_env: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OPENCLAW_PM_BRIDGE_WORKERS", "1")
+    assert worker_command()[-2:] == ["--workers", "0"]
+    assert spawn_env()["OPENCLAW_PM_BRIDGE_WORKERS"] == "0"
+
+    responses = _serve([{"id": "health", "method": "healthcheck"}], workers=1)
+    # 嵌套 supervisor 时 worker 的 healthcheck 结果会带 supervisor 字段
+    worker = responses[0]["result"]["supervisor"]["workers"][0]
+    assert "supervisor" not in worker["result"]
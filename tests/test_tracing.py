@@ -0,0 +1,120 @@
+"""
+按请求阶段耗时与 trace 采样测试
+"""
+import asyncio
+import json
+from pathlib import Path
+
+from openclaw_polymarket_skill import tracing
+from openclaw_polymarket_skill.locks import WalletLockManager
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+from openclaw_polymarket_skill.tracing import Trace, Tracer
+
+
+def test_spans_accumulate_only_inside_active_trace() -> None:
+    tracing.add("spawn", 1.0)
+    with tracing.span("decode"):
+        pass
+
+    trace = Trace(returned=True)
+    token = tracing.activate(trace)
+    try:
+        tracing.add("spawn", 0.002)
+        tracing.add("spawn", 0.003)
+        with tracing.span("decode"):
+            pass
+    finally:
+        tracing.deactivate(token)
+    tracing.add("spawn", 1.0)
+
+    timings = trace.timings()
+    assert timings["spawn_ms"] == 5.0
+    assert "decode_ms" in timings
+    assert timings["total_ms"] >= 0
+    assert tracing.current() is None
+
+
+def test_timings_returned_when_requested(mock_polymarket_bin: str) -> None:
+    runner = PolymarketSkillRunner(settings=SkillSettings(polymarket_bin=mock_polymarket_bin, enforce_cli_version=False))
+
+    async def _main() -> tuple[dict, dict, dict]:
+        plain = await runner.execute("clob_midpoint", {"token_id": "1"})
+        traced = await runner.execute("clob_midpoint", {"token_id": "2"}, {"timings": True})
+        cached = await runner.execute("clob_midpoint", {"token_id": "2"}, {"timings": True})
+        return plain, traced, cached
+
+    plain, traced, cached = asyncio.run(_main())
+
+    assert "timings" not in plain["meta"]
+    timings = traced["meta"]["timings"]
+    for phase in ("validate_ms", "cache_ms", "queue_wait_ms", "spawn_ms", "child_ms", "stdout_read_ms", "decode_ms"):
+        assert phase in timings, phase
+    assert timings["total_ms"] >= timings["child_ms"]
+    assert cached["meta"]["cache"]["hit"] is True
+    assert "cache_ms" in cached["meta"]["timings"]
+    assert "spawn_ms" not in cached["meta"]["timings"]
+
+
+def test_batch_items_get_their_own_timings(mock_polymarket_bin: str) -> None:
+    runner = PolymarketSkillRunner(
+        settings=SkillSettings(polymarket_bin=mock_polymarket_bin, enforce_cli_version=False, read_cache_enabled=False)
+    )
+    items = [{"action": "clob_midpoint", "params": {"token_id": str(index)}} for index in range(3)]
+    response = asyncio.run(runner.execute_batch(items, {"timings": True}))
+
+    assert response["ok"] is True
+    for entry in response["items"]:
+        timings = entry["result"]["meta"]["timings"]
+        assert "child_ms" in timings
+        assert "validate_ms" not in timings
+
+
+def test_lock_wait_recorded() -> None:
+    manager = WalletLockManager()
+    trace = Trace()
+
+    async def _hold() -> dict:
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    async def _main() -> None:
+        first = asyncio.create_task(manager.run_with_wallet_lock("w", _hold))
+        await asyncio.sleep(0)
+        token = tracing.activate(trace)
+        try:
+            await manager.run_with_wallet_lock("w", _hold)
+        finally:
+            tracing.deactivate(token)
+        await first
+
+    asyncio.run(_main())
+    assert trace.timings()["lock_wait_ms"] >= 30
+
+
+def test_sampled_traces_written_to_jsonl(tmp_path: Path, mock_polymarket_bin: str) -> None:
+    path = tmp_path / "trace.jsonl"
+    runner = PolymarketSkillRunner(settings=SkillSettings(polymarket_bin=mock_polymarket_bin, enforce_cli_version=False))
+    runner.tracer = Tracer(path=str(path), sample_rate=0.5, rng=iter([0.1, 0.9]).__next__)
+
+    async def _main() -> list[dict]:
+        return [
+            await runner.execute("clob_midpoint", {"token_id": "1"}),
+            await runner.execute("clob_midpoint", {"token_id": "2"}),
+        ]
+
+    results = asyncio.run(_main())
+
+    assert all("timings" not in result["meta"] for result in results)
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(records) == 1
+    assert records[0]["action"] == "clob_midpoint"
+    assert records[0]["ok"] is True
+    assert "child_ms" in records[0]["timings"]
+
+
+def test_tracer_disabled_by_default() -> None:
+    tracer = Tracer()
+    assert tracer.begin() is None
+    assert tracer.begin(requested=True) is not None
+    assert Tracer(always=True).begin() is not None
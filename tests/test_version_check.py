@@ -0,0 +1,130 @@
+"""
+CLI 版本检查缓存测试
+"""
+import asyncio
+from pathlib import Path
+
+from openclaw_polymarket_skill.runner import PolymarketSkillRunner
+from openclaw_polymarket_skill.settings import SkillSettings
+from openclaw_polymarket_skill.version_check import CliVersionCheck, binary_fingerprint
+
+
+def _binary(tmp_path: Path, version: str = "0.1.4") -> str:
+    script = tmp_path / "polymarket"
+    script.write_text(f"#!/bin/bash\necho 'polymarket {version}'\n")
+    script.chmod(0o755)
+    return str(script)
+
+
+class CountingCheck:
+    def __init__(self, result: tuple[bool, str] = (True, "0.1.4")) -> None:
+        self.calls = 0
+        self.result = result
+
+    async def __call__(self) -> tuple[bool, str]:
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return self.result
+
+
+def test_concurrent_checks_are_coalesced(tmp_path: Path) -> None:
+    settings = SkillSettings(polymarket_bin=_binary(tmp_path), version_cache_path="")
+    check = CountingCheck()
+    checker = CliVersionCheck(settings, check)
+
+    async def _main() -> None:
+        statuses = await asyncio.gather(*(checker.ensure() for _ in range(10)))
+        assert all(status.ok for status in statuses)
+        await checker.ensure()
+
+    asyncio.run(_main())
+    assert check.calls == 1
+
+
+def test_result_persisted_per_binary_fingerprint(tmp_path: Path) -> None:
+    binary = _binary(tmp_path)
+    settings = SkillSettings(polymarket_bin=binary, version_cache_path=str(tmp_path / "version.json"))
+    first = CountingCheck()
+    asyncio.run(CliVersionCheck(settings, first).ensure())
+
+    # 模拟新进程：清空进程内缓存后应直接命中磁盘
+    import openclaw_polymarket_skill.version_check as version_check
+
+    version_check._MEMO.clear()
+    second = CountingCheck()
+    assert asyncio.run(CliVersionCheck(settings, second).ensure()).ok
+    assert second.calls == 0
+
+    # 二进制被替换（mtime 变化）后重新检查
+    fingerprint = binary_fingerprint(binary)
+    Path(binary).write_text("#!/bin/bash\necho 'polymarket 0.2.0'\n")
+    assert binary_fingerprint(binary) != fingerprint
+    third = CountingCheck((False, "CLI 版本不匹配"))
+    assert asyncio.run(CliVersionCheck(settings, third).ensure()).ok is False
+    assert third.calls == 1
+
+
+def test_failed_check_is_not_persisted(tmp_path: Path) -> None:
+    settings = SkillSettings(polymarket_bin=_binary(tmp_path, "0.0.1"), version_cache_path=str(tmp_path / "v.json"))
+    runner = PolymarketSkillRunner(settings)
+    result = asyncio.run(runner.execute("clob_midpoint", {"token_id": "1"}))
+    assert result["error"]["type"] == "CliVersionMismatch"
+    assert not (tmp_path / "v.json").exists()
+
+
+def test_healthcheck_answers_from_cache_and_refreshes_in_background(tmp_path: Path) -> None:
+    clock = [1000.0]
+    settings = SkillSettings(polymarket_bin=_binary(tmp_path), version_cache_path="", version_check_ttl_seconds=60)
+    check = CountingCheck()
+    checker = CliVersionCheck(settings, check, clock=lambda: clock[0])
+
+    async def _main() -> None:
+        status, cached = await checker.status()
+        assert status.ok and cached is False
+        status, cached = await checker.status()
+        assert cached is True and check.calls == 1
+
+        clock[0] += 120
+        status, cached = await checker.status()
+        assert cached is True and status.ok
+        await asyncio.sleep(0.05)
+        assert check.calls == 2
+
+    asyncio.run(_main())
+
+
+def test_runner_healthcheck_reports_cached_status(tmp_path: Path) -> None:
+    runner = PolymarketSkillRunner(SkillSettings(polymarket_bin=_binary(tmp_path), version_cache_path=""))
+
+    async def _main() -> tuple[dict, dict]:
+        return await runner.healthcheck(), await runner.healthcheck()
+
+    first, second = asyncio.run(_main())
+    assert first["ok"] is True and first["version"] == "0.1.4" and first["cached"] is False
+    assert second["cached"] is True
+
+
+def test_fingerprint_reused_on_execute_path(tmp_path: Path, monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    import openclaw_polymarket_skill.version_check as version_check
+
+    calls = []
+    original = version_check.binary_fingerprint
+
+    def _counting(binary: str) -> str | None:
+        calls.append(binary)
+        return original(binary)
+
+    monkeypatch.setattr(version_check, "binary_fingerprint", _counting)
+    settings = SkillSettings(polymarket_bin=_binary(tmp_path), version_cache_path="")
+    checker = CliVersionCheck(settings, CountingCheck())
+
+    async def _main() -> None:
+        for _ in range(50):
+            assert (await checker.ensure()).ok
+        before = len(calls)
+        await checker.status()
+        assert len(calls) == before + 1
+
+    asyncio.run(_main())
+    # 首次 ensure 未命中时 refresh 会再计算一次，此后 execute 路径不再访问文件系统
+    assert len(calls) <= 3